@@ -0,0 +1,314 @@
+"""
+Toplu Ortam Modülü
+==================
+N bağımsız robot süpürge bölümünü (episode) aynı anda adımlayan vektörize
+ortam. Her bölümün kendi odası vardır; konum, açı, batarya, sıkışma sayacı
+ve durum gibi robot alanları NumPy dizilerinde tutulur (struct-of-arrays).
+
+Tepkisel katman RobotVacuum ile aynıdır (keşif, duvar takibi, sıkışma
+kurtarma). Gövde çarpışma kontrolü ve ön sensör de aynı modelle, bölüm
+başına konfigürasyon uzayı haritasında (config_space.inflate, 2 piksellik
+alt hücre) yapılır. Farklar:
+
+- Planlı gezinme yoktur: şarj için başlangıca dönüş (RETURNING),
+  temizlenmemiş bölgeye gitme (CLEANING) ve doluluk haritası kullanılmaz;
+  robotlar sadece EXPLORING ve STUCK durumlarında olur.
+- LiDAR taraması yapılmaz ve her bölümde tek robot vardır (robot-robot
+  çarpışması yoktur).
+- Adım kontrolü hedef alt hücrede tek okumadır; adım (1.5 piksel) alt
+  hücreden kısa olduğundan RobotVacuum'un adım boyunca yürüyüşünden farkı
+  sadece alt hücre köşelerinin kesilmesidir.
+- Temizlenen alan sadece robotun ulaşabildiği boş hücrelerde (başlangıç
+  hücresinin bağlı bileşeni, free_cells) işaretlenir.
+
+Alt hücre haritaları bölüm başına ~177 KB'tır (1000x700 piksellik oda).
+Tek robotlu görselleştirme için RobotVacuum kullanılır.
+"""
+
+import math
+import random
+from typing import Optional
+import numpy as np
+from config_space import inflate
+from raycaster import cast_rays_batch
+from robot_vacuum import RobotState
+from room_corpus import RoomCorpus
+from free_cells import FreeCellIndex
+from room_generator import RoomGenerator
+
+# Durum kodları: RobotState sırası
+STATES = list(RobotState)
+EXPLORING = STATES.index(RobotState.EXPLORING)
+STUCK = STATES.index(RobotState.STUCK)
+
+class BatchEnvironment:
+    def __init__(self, episode_count: int, room_width: int = 1000, room_height: int = 700,
+                 seed: Optional[int] = None, corpus: Optional[RoomCorpus] = None):
+        """
+        Toplu ortam sınıfı
+        
+        Args:
+            episode_count: Aynı anda adımlanan bölüm sayısı
+            room_width, room_height: Oda boyutu (piksel; derlem verildiyse derlemden alınır)
+            seed: Oda üretimi ve robot kararları için rastgele sayı üreteci tohumu
+            corpus: Verilirse odalar üretilmez, bu derlemden sırayla alınır
+        """
+        self.episode_count = episode_count
+        self.corpus = corpus
+        self._next_room = 0  # Derlemden alınacak bir sonraki oda
+        if corpus is not None:
+            room_width, room_height = corpus.width, corpus.height
+        self.room_generator = RoomGenerator(room_width, room_height, random.Random(seed))
+        self.grid_size = self.room_generator.grid_size
+        self.rng = np.random.default_rng(seed)
+        
+        # Robot özellikleri (tüm bölümlerde ortak, RobotVacuum ile aynı)
+        self.radius = 8
+        self.speed = 1.5
+        self.sensor_range = 30
+        self.angular_speed = 0.1
+        
+        # Sıkışma tespiti: son 30 pozisyon arasındaki 29 hareketin toplamı
+        self.stuck_window = 29
+        self.stuck_threshold = 20
+        
+        grid_shape = (episode_count, self.room_generator.grid_height, self.room_generator.grid_width)
+        self.cells = np.zeros(grid_shape, dtype=np.uint8)
+        self.free = np.zeros(grid_shape, dtype=bool)
+        # Temizlenebilir hücreler: başlangıç hücresinin bağlı bileşeni
+        self.reachable = np.zeros(grid_shape, dtype=bool)
+        self.cleaned = np.zeros(grid_shape, dtype=bool)
+        
+        # Bölüm başına gövde çarpışma haritası (ConfigurationSpace.blocked ile aynı), dolu
+        # çerçeveli yığın; adım kontrolü ve ön sensör ışınları aynı yığını okur.
+        # Sıfırlanan bölümlerin iç kısmı güncellenir
+        self.subdivisions = 10
+        self.cell_size = self.grid_size / self.subdivisions  # Alt hücre boyutu (piksel)
+        _, grid_height, grid_width = grid_shape
+        self._padded_space = np.ones((episode_count, grid_height * self.subdivisions + 2,
+                                      grid_width * self.subdivisions + 2), dtype=np.uint8)
+        self._space_flat = self._padded_space.reshape(-1)
+        self._space_offsets = np.arange(episode_count) * (self._padded_space.shape[1] *
+                                                          self._padded_space.shape[2])
+        
+        # Robot durumu (bölüm başına bir eleman)
+        n = episode_count
+        self.x = np.zeros(n)
+        self.y = np.zeros(n)
+        self.angle = np.zeros(n)
+        self.target_angle = np.zeros(n)
+        self.battery = np.zeros(n)
+        self.state = np.zeros(n, dtype=np.int8)
+        self.stuck_counter = np.zeros(n, dtype=np.int32)
+        self.direction_change_timer = np.zeros(n, dtype=np.int32)
+        self.wall_following = np.zeros(n, dtype=bool)
+        self.wall_follow_direction = np.ones(n, dtype=np.int8)
+        self.cleaned_tiles = np.zeros(n, dtype=np.int64)
+        self.total_tiles = np.zeros(n, dtype=np.int64)
+        self.ticks = 0
+        
+        # Hareket geçmişi: halka tampon ve bölüm başına hareket toplamı
+        self._move_history = np.zeros((n, self.stuck_window))
+        self._move_sum = np.zeros(n)
+        self._move_count = np.zeros(n, dtype=np.int32)
+        self._history_index = 0
+        
+        self._episodes = np.arange(n)
+        self.reset()
+    
+    def reset(self, mask: Optional[np.ndarray] = None):
+        """
+        Seçilen bölümler için yeni oda oluşturur ve robotu sıfırlar
+        
+        Args:
+            mask: Sıfırlanacak bölümler (boolean dizi); None ise hepsi
+        """
+        episodes = self._episodes if mask is None else np.flatnonzero(mask)
+        if self.corpus is not None:
+            # Derlemden sıradaki odalar tek bir kopyayla yüklenir
+            rooms = (self._next_room + np.arange(len(episodes))) % len(self.corpus)
+            self._next_room = (self._next_room + len(episodes)) % len(self.corpus)
+            self.cells[episodes] = self.corpus.grids[rooms]
+            self.x[episodes] = self.corpus.index['start_x'][rooms]
+            self.y[episodes] = self.corpus.index['start_y'][rooms]
+            self.free[episodes] = self.cells[episodes] == 0
+            self.reachable[episodes] = self.free[episodes]
+            # Sadece birden fazla bileşeni olan odalar etiketlenir
+            for episode, room in zip(episodes, rooms):
+                if self.corpus.index[room]['components'] > 1:
+                    self.reachable[episode] = FreeCellIndex(self.cells[episode]).reachable_from(
+                        [self._start_cell(episode)])
+        else:
+            for episode in episodes:
+                grid, start_pos = self.room_generator.generate_room()
+                self.cells[episode] = grid
+                self.x[episode], self.y[episode] = start_pos
+                self.reachable[episode] = self.room_generator.free_cells(grid).reachable_from(
+                    [self._start_cell(episode)])
+            self.free[episodes] = self.cells[episodes] == 0
+        self.cleaned[episodes] = False
+        self.total_tiles[episodes] = self.reachable[episodes].sum(axis=(1, 2))
+        # Şişirme geçici dizileri bölüm sayısıyla büyüdüğünden parça parça hesaplanır
+        for start in range(0, len(episodes), 64):
+            chunk = episodes[start:start + 64]
+            self._padded_space[chunk, 1:-1, 1:-1] = inflate(self.cells[chunk], self.grid_size,
+                                                            self.radius, self.subdivisions)
+        
+        count = len(episodes)
+        self.angle[episodes] = self.rng.uniform(0, 2 * math.pi, count)
+        self.target_angle[episodes] = self.angle[episodes]
+        self.battery[episodes] = 100
+        self.state[episodes] = EXPLORING
+        self.stuck_counter[episodes] = 0
+        self.direction_change_timer[episodes] = 0
+        self.wall_following[episodes] = False
+        self.cleaned_tiles[episodes] = 0
+        self._move_history[episodes] = 0
+        self._move_sum[episodes] = 0
+        self._move_count[episodes] = 0
+    
+    def _start_cell(self, episode: int):
+        """Bölümün robot konumunun grid hücresi (grid_x, grid_y)"""
+        return (int(self.x[episode] // self.grid_size), int(self.y[episode] // self.grid_size))
+    
+    def step(self):
+        """Tüm bölümleri bir tik ilerletir"""
+        self.ticks += 1
+        self.battery = np.maximum(0, self.battery - 0.02)
+        
+        self._check_if_stuck()
+        
+        exploring = self.state == EXPLORING
+        if exploring.any():
+            self._explore_behavior(np.flatnonzero(exploring))
+        stuck = self.state == STUCK
+        if stuck.any():
+            self._stuck_behavior(np.flatnonzero(stuck))
+        
+        self._move()
+        self._mark_cleaned_area()
+    
+    def run(self, ticks: int) -> dict:
+        """Tüm bölümleri verilen tik sayısı kadar ilerletir"""
+        for _ in range(ticks):
+            self.step()
+        return self.get_status()
+    
+    def _check_if_stuck(self):
+        """Son 29 hareketin toplamı eşiğin altındaysa robotu sıkışmış say"""
+        stuck = (self._move_count >= self.stuck_window) & (self._move_sum < self.stuck_threshold)
+        self.stuck_counter[stuck] = 60
+        self.state[stuck] = STUCK
+    
+    def _explore_behavior(self, episodes: np.ndarray):
+        """Keşif davranışı - engel yakınsa duvar takibi, değilse ara sıra yön değiştir"""
+        self.direction_change_timer[episodes] -= 1
+        
+        front_distance = self._get_front_distance(episodes)
+        near = front_distance < 25
+        
+        # Duvar takip moduna yeni geçenler için rastgele yön
+        near_episodes = episodes[near]
+        starting = near_episodes[~self.wall_following[near_episodes]]
+        self.wall_following[starting] = True
+        self.wall_follow_direction[starting] = self.rng.choice(np.array([1, -1], dtype=np.int8),
+                                                               len(starting))
+        self.target_angle[near_episodes] = (
+            self.angle[near_episodes] + math.pi / 4 * self.wall_follow_direction[near_episodes]
+        )
+        
+        # Açık alanda düz git veya zamanlayıcı dolduğunda %30 şansla yön değiştir
+        open_episodes = episodes[~near]
+        self.wall_following[open_episodes] = False
+        due = open_episodes[self.direction_change_timer[open_episodes] <= 0]
+        turning = due[self.rng.random(len(due)) < 0.3]
+        self.target_angle[turning] += self.rng.uniform(-math.pi / 3, math.pi / 3, len(turning))
+        self.direction_change_timer[turning] = self.rng.integers(30, 121, len(turning))
+    
+    def _stuck_behavior(self, episodes: np.ndarray):
+        """Sıkışma durumu davranışı - rastgele yöne dön, sayaç bitince keşfe dön"""
+        self.target_angle[episodes] += self.rng.uniform(-math.pi, math.pi, len(episodes))
+        self.stuck_counter[episodes] = np.maximum(0, self.stuck_counter[episodes] - 1)
+        recovered = episodes[self.stuck_counter[episodes] == 0]
+        self.state[recovered] = EXPLORING
+    
+    def _get_front_distance(self, episodes: np.ndarray) -> np.ndarray:
+        """
+        Seçilen bölümlerde gövdenin ileri yönde engele değmeden gidebileceği mesafe
+        
+        Işınlar konfigürasyon uzayı yığınında alt hücre boyutunda DDA ile
+        izlenir (RobotVacuum ile aynı ölçüm; açık alanda küre izleme yapılmaz).
+        """
+        angle = self.angle[episodes]
+        return cast_rays_batch(self._padded_space, self.cell_size,
+                               self.x[episodes], self.y[episodes],
+                               np.cos(angle), np.sin(angle), self.sensor_range, episodes)
+    
+    def _move(self):
+        """Tüm robotları hareket ettirir ve hareket geçmişini günceller"""
+        # Açıyı yumuşak geçiş ile güncelle (fark -π..π aralığına sarılır)
+        angle_diff = (self.target_angle - self.angle + math.pi) % (2 * math.pi) - math.pi
+        self.angle += angle_diff * self.angular_speed
+        
+        new_x = self.x + np.cos(self.angle) * self.speed
+        new_y = self.y + np.sin(self.angle) * self.speed
+        
+        # Gövde çarpışma kontrolü: hedef alt hücre konfigürasyon uzayında boş mu (bölüm
+        # başına tek okuma; oda dışı çerçeveye düşer). Aynı alt hücrede kalan adım serbesttir
+        _, padded_height, padded_width = self._padded_space.shape
+        sub_x = np.clip(np.floor(new_x / self.cell_size), -1, padded_width - 2).astype(np.intp)
+        sub_y = np.clip(np.floor(new_y / self.cell_size), -1, padded_height - 2).astype(np.intp)
+        same = (sub_x == np.floor(self.x / self.cell_size)) & (sub_y == np.floor(self.y / self.cell_size))
+        index = self._space_offsets + (sub_y + 1) * padded_width + sub_x + 1
+        valid = same | (self._space_flat[index] == 0)
+        
+        moved = np.where(valid, self.speed, 0.0)
+        self.x = np.where(valid, new_x, self.x)
+        self.y = np.where(valid, new_y, self.y)
+        
+        # Engele çarpanlar yön değiştirir
+        blocked = np.flatnonzero(~valid)
+        self.target_angle[blocked] += self.rng.uniform(math.pi / 2, math.pi, len(blocked))
+        
+        # Halka tamponda en eski hareketi çıkarıp yenisini ekle
+        slot = self._history_index
+        self._move_sum += moved - self._move_history[:, slot]
+        self._move_history[:, slot] = moved
+        self._move_count = np.minimum(self._move_count + 1, self.stuck_window)
+        self._history_index = (slot + 1) % self.stuck_window
+    
+    def _mark_cleaned_area(self):
+        """Robotların çevresindeki 3x3 ulaşılabilir boş hücreyi temizlenmiş olarak işaretle"""
+        _, grid_height, grid_width = self.free.shape
+        grid_x = np.floor(self.x / self.grid_size).astype(np.intp)
+        grid_y = np.floor(self.y / self.grid_size).astype(np.intp)
+        
+        for dx in range(-1, 2):
+            for dy in range(-1, 2):
+                cell_x = grid_x + dx
+                cell_y = grid_y + dy
+                inside = (cell_x >= 0) & (cell_x < grid_width) & (cell_y >= 0) & (cell_y < grid_height)
+                episodes = self._episodes[inside]
+                cell_x = cell_x[inside]
+                cell_y = cell_y[inside]
+                newly = self.reachable[episodes, cell_y, cell_x] & ~self.cleaned[episodes, cell_y, cell_x]
+                self.cleaned[episodes[newly], cell_y[newly], cell_x[newly]] = True
+                self.cleaned_tiles[episodes[newly]] += 1
+    
+    def coverage(self) -> np.ndarray:
+        """Her bölüm için temizlenen boş hücre yüzdesi"""
+        return self.cleaned_tiles / np.maximum(self.total_tiles, 1) * 100
+    
+    def get_status(self) -> dict:
+        """Toplu ortamın özet istatistiklerini döndürür"""
+        coverage = self.coverage()
+        state_counts = np.bincount(self.state, minlength=len(STATES))
+        return {
+            'episodes': self.episode_count,
+            'time': self.ticks,
+            'states': {state.value: int(count) for state, count in zip(STATES, state_counts)},
+            'mean_battery': float(self.battery.mean()),
+            'mean_coverage': float(coverage.mean()),
+            'min_coverage': float(coverage.min()),
+            'max_coverage': float(coverage.max()),
+        }
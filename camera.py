@@ -0,0 +1,85 @@
+"""
+Kamera Modülü
+=============
+Büyük zeminlerin ekranın bir bölgesinde (görüş alanı) kaydırılıp
+yakınlaştırılarak gösterilmesi için dünya <-> ekran dönüşümleri. Çizici
+sadece visible_cells() aralığındaki hücreleri çizer; böylece kare maliyeti
+zeminin toplam alanına değil görüş alanının boyutuna bağlıdır.
+
+pygame'e bağımlı değildir; görüş alanı (x, y, genişlik, yükseklik) demeti
+olarak verilir.
+"""
+
+from typing import Optional, Tuple
+
+class Camera:
+    def __init__(self, view: Tuple[int, int, int, int], world_width: float, world_height: float,
+                 zoom: float = 1.0, min_zoom: float = 0.05, max_zoom: float = 4.0):
+        """
+        Kamera sınıfı
+        
+        Args:
+            view: Ekrandaki görüş alanı (x, y, genişlik, yükseklik)
+            world_width, world_height: Dünya boyutu (piksel, zoom 1'de)
+            zoom: Başlangıç yakınlaştırması (1: dünya pikseli = ekran pikseli)
+            min_zoom, max_zoom: Yakınlaştırma sınırları; min_zoom görüş alanına
+                                sığan dünya alanını, dolayısıyla kare maliyetini sınırlar
+        """
+        self.view_x, self.view_y, self.view_width, self.view_height = view
+        self.world_width = world_width
+        self.world_height = world_height
+        self.min_zoom = min_zoom
+        self.max_zoom = max_zoom
+        self.zoom = max(min_zoom, min(zoom, max_zoom))
+        # Görüş alanının ortasına düşen dünya noktası
+        self.x = world_width / 2
+        self.y = world_height / 2
+    
+    def center_on(self, x: float, y: float):
+        """Görüş alanını dünya noktasına ortalar"""
+        self.x = min(max(x, 0.0), self.world_width)
+        self.y = min(max(y, 0.0), self.world_height)
+    
+    def pan(self, dx: float, dy: float):
+        """Görüş alanını ekran pikseli cinsinden kaydırır"""
+        self.center_on(self.x + dx / self.zoom, self.y + dy / self.zoom)
+    
+    def zoom_by(self, factor: float, anchor: Optional[Tuple[float, float]] = None):
+        """
+        Yakınlaştırmayı çarpanla değiştirir
+        
+        Args:
+            factor: Yakınlaştırma çarpanı (>1 yakınlaştırır)
+            anchor: Ekranda yerinde kalacak nokta (verilmezse görüş alanının ortası)
+        """
+        if anchor is None:
+            self.zoom = max(self.min_zoom, min(self.zoom * factor, self.max_zoom))
+            return
+        world_x, world_y = self.screen_to_world(*anchor)
+        self.zoom = max(self.min_zoom, min(self.zoom * factor, self.max_zoom))
+        # Çapa noktası aynı ekran konumunda kalsın
+        screen_x, screen_y = self.world_to_screen(world_x, world_y)
+        self.pan(screen_x - anchor[0], screen_y - anchor[1])
+    
+    def world_to_screen(self, x: float, y: float) -> Tuple[float, float]:
+        """Dünya noktasının ekran konumu"""
+        return ((x - self.x) * self.zoom + self.view_x + self.view_width / 2,
+                (y - self.y) * self.zoom + self.view_y + self.view_height / 2)
+    
+    def screen_to_world(self, x: float, y: float) -> Tuple[float, float]:
+        """Ekran noktasının dünya konumu"""
+        return ((x - self.view_x - self.view_width / 2) / self.zoom + self.x,
+                (y - self.view_y - self.view_height / 2) / self.zoom + self.y)
+    
+    def visible_rect(self) -> Tuple[float, float, float, float]:
+        """Görüş alanındaki dünya bölgesi (x0, y0, x1, y1), dünya sınırlarına kırpılmış"""
+        half_width = self.view_width / 2 / self.zoom
+        half_height = self.view_height / 2 / self.zoom
+        return (max(self.x - half_width, 0.0), max(self.y - half_height, 0.0),
+                min(self.x + half_width, self.world_width), min(self.y + half_height, self.world_height))
+    
+    def visible_cells(self, cell_size: float) -> Tuple[int, int, int, int]:
+        """Görüş alanına değen hücre aralığı (x0, y0, x1, y1), bitiş hariç"""
+        x0, y0, x1, y1 = self.visible_rect()
+        return (int(x0 // cell_size), int(y0 // cell_size),
+                int(-(-x1 // cell_size)), int(-(-y1 // cell_size)))
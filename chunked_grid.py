@@ -0,0 +1,302 @@
+"""
+Parçalı Grid Modülü
+===================
+Depo ölçeğindeki (ör. 5000x5000 hücre) zeminler için parçalı (chunk) grid
+ve temizlik haritası. Zemin chunk_size x chunk_size hücrelik parçalara
+bölünür; bir parça sadece ilk kullanıldığında oluşturulur (üretici
+fonksiyonla veya sabit değerle doldurulur). Değiştirilmemiş parçalar
+üreticiden tekrar oluşturulabildiği için bellekte en fazla max_chunks
+tanesi tutulur (en uzun süre kullanılmayan atılır). Böylece bellek
+kullanımı zeminin toplam alanıyla değil, kullanılan bölgeyle büyür.
+
+Robotlar ve çizici zemine doğrudan değil, ihtiyaç duydukları bölgenin
+window() ile alınmış yoğun (NumPy) kopyası üzerinden erişir.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, Optional, Tuple
+import numpy as np
+
+# Parça üretici: (chunk_x, chunk_y, chunk_size) -> (chunk_size, chunk_size) uint8 dizi
+ChunkFactory = Callable[[int, int, int], np.ndarray]
+
+class ChunkedGrid:
+    def __init__(self, width: int, height: int, chunk_size: int = 64,
+                 factory: Optional[ChunkFactory] = None, fill: int = 0,
+                 max_chunks: Optional[int] = 1024):
+        """
+        Parçalı grid sınıfı (0=boş, 1=engel/duvar)
+        
+        Args:
+            width, height: Zemin boyutu (hücre)
+            chunk_size: Parça kenar uzunluğu (hücre)
+            factory: Parça içeriğini üreten fonksiyon (verilmezse fill ile dolu)
+            fill: Üretici yoksa parçaların başlangıç değeri
+            max_chunks: Bellekte tutulan değiştirilmemiş parça sayısı üst sınırı
+                        (None: sınırsız). set() ile değiştirilen parçalar atılmaz.
+        """
+        self.width = width
+        self.height = height
+        self.chunk_size = chunk_size
+        self.chunks_x = -(-width // chunk_size)
+        self.chunks_y = -(-height // chunk_size)
+        self.factory = factory
+        self.fill = fill
+        self.max_chunks = max_chunks
+        self.generated = 0  # Üreticinin kaç kez çağrıldığı (atılıp tekrar üretilenler dahil)
+        self._chunks: "OrderedDict[Tuple[int, int], np.ndarray]" = OrderedDict()
+        self._modified = set()
+    
+    def _build(self, chunk_x: int, chunk_y: int) -> np.ndarray:
+        """Parçayı üretir; zemin dışına taşan hücreler duvardır"""
+        size = self.chunk_size
+        if self.factory is not None:
+            chunk = np.array(self.factory(chunk_x, chunk_y, size), dtype=np.uint8)
+        else:
+            chunk = np.full((size, size), self.fill, dtype=np.uint8)
+        self.generated += 1
+        inside_x = self.width - chunk_x * size
+        inside_y = self.height - chunk_y * size
+        if inside_x < size:
+            chunk[:, inside_x:] = 1
+        if inside_y < size:
+            chunk[inside_y:, :] = 1
+        return chunk
+    
+    def chunk(self, chunk_x: int, chunk_y: int) -> np.ndarray:
+        """Parçayı döndürür; bellekte yoksa oluşturur (salt okunur kullanılmalı, yazmak için set)"""
+        key = (chunk_x, chunk_y)
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            return chunk
+        chunk = self._build(chunk_x, chunk_y)
+        self._chunks[key] = chunk
+        self._evict()
+        return chunk
+    
+    def _evict(self):
+        """Sınır aşıldıysa en uzun süre kullanılmayan değiştirilmemiş parçaları atar"""
+        if self.max_chunks is None:
+            return
+        excess = len(self._chunks) - self.max_chunks
+        if excess <= 0:
+            return
+        for key in list(self._chunks):
+            if key not in self._modified:
+                del self._chunks[key]
+                excess -= 1
+                if excess == 0:
+                    break
+    
+    def get(self, x: int, y: int) -> int:
+        """Hücre değeri (zemin dışı duvardır)"""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return 1
+        size = self.chunk_size
+        return int(self.chunk(x // size, y // size)[y % size, x % size])
+    
+    def set(self, x: int, y: int, value: int):
+        """Hücre değerini değiştirir (parça bundan sonra bellekten atılmaz)"""
+        size = self.chunk_size
+        key = (x // size, y // size)
+        self.chunk(*key)[y % size, x % size] = value
+        self._modified.add(key)
+    
+    def chunk_range(self, x0: int, y0: int, x1: int, y1: int) -> Tuple[int, int, int, int]:
+        """[x0, x1) x [y0, y1) hücre bölgesine değen parça aralığı (zemin içine kırpılmış, bitiş hariç)"""
+        size = self.chunk_size
+        return (max(x0 // size, 0), max(y0 // size, 0),
+                min(-(-x1 // size), self.chunks_x), min(-(-y1 // size), self.chunks_y))
+    
+    def window(self, x0: int, y0: int, width: int, height: int) -> np.ndarray:
+        """
+        Zeminin [x0, x0+width) x [y0, y0+height) bölgesinin yoğun kopyası
+        
+        Sadece bölgeye değen parçalar oluşturulur; zemin dışı hücreler duvardır.
+        """
+        window = np.ones((height, width), dtype=np.uint8)
+        size = self.chunk_size
+        start_x, start_y, end_x, end_y = self.chunk_range(x0, y0, x0 + width, y0 + height)
+        for chunk_y in range(start_y, end_y):
+            for chunk_x in range(start_x, end_x):
+                chunk = self.chunk(chunk_x, chunk_y)
+                # Parçanın pencereyle kesişimi (dünya koordinatları)
+                left = max(chunk_x * size, x0)
+                right = min((chunk_x + 1) * size, x0 + width)
+                top = max(chunk_y * size, y0)
+                bottom = min((chunk_y + 1) * size, y0 + height)
+                window[top - y0:bottom - y0, left - x0:right - x0] = \
+                    chunk[top - chunk_y * size:bottom - chunk_y * size, left - chunk_x * size:right - chunk_x * size]
+        return window
+    
+    def iter_chunks(self) -> Iterator[Tuple[Tuple[int, int], np.ndarray]]:
+        """
+        Tüm parçaları sırayla verir
+        
+        Bellekte olmayan parçalar üretilir ama saklanmaz; tüm zemini tarayan
+        işlemler (ör. boş hücre sayımı) bellek kullanımını büyütmez.
+        """
+        for chunk_y in range(self.chunks_y):
+            for chunk_x in range(self.chunks_x):
+                key = (chunk_x, chunk_y)
+                chunk = self._chunks.get(key)
+                yield key, chunk if chunk is not None else self._build(chunk_x, chunk_y)
+    
+    def count_free(self) -> int:
+        """Zemindeki boş hücre sayısı (tüm parçalar taranır)"""
+        return sum(int(np.count_nonzero(chunk == 0)) for _, chunk in self.iter_chunks())
+    
+    @property
+    def materialized(self) -> int:
+        """Bellekteki parça sayısı"""
+        return len(self._chunks)
+    
+    @property
+    def nbytes(self) -> int:
+        """Bellekteki parçaların toplam boyutu (bayt)"""
+        return sum(chunk.nbytes for chunk in self._chunks.values())
+
+class ChunkedCoverage:
+    def __init__(self, grid: ChunkedGrid, total_tiles: Optional[int] = None):
+        """
+        Parçalı temizlik haritası; bir parçanın bit haritası o parçada ilk
+        hücre temizlendiğinde oluşturulur
+        
+        Args:
+            grid: Zemin grid'i (sadece boş hücreler temizlenebilir)
+            total_tiles: Boş hücre sayısı (verilmezse grid taranarak hesaplanır)
+        """
+        self.grid = grid
+        self.chunk_size = grid.chunk_size
+        self.total_tiles = total_tiles if total_tiles is not None else grid.count_free()
+        self.cleaned_count = 0
+        # Parça başına bit haritası ve sürüm (çizim önbellekleri sürümü izler)
+        self._chunks: Dict[Tuple[int, int], np.ndarray] = {}
+        self.versions: Dict[Tuple[int, int], int] = {}
+        self.generation = 0
+    
+    def clear(self):
+        """Tüm işaretleri kaldırır"""
+        self._chunks.clear()
+        self.versions.clear()
+        self.cleaned_count = 0
+        self.generation += 1
+    
+    def mark_area(self, grid_x: int, grid_y: int, radius: int = 1) -> int:
+        """
+        (2*radius+1)² hücrelik kareyi temizlenmiş olarak işaretler (zemin koordinatları)
+        
+        Returns:
+            Yeni temizlenen hücre sayısı
+        """
+        grid = self.grid
+        size = self.chunk_size
+        newly_cleaned = 0
+        for cell_y in range(max(grid_y - radius, 0), min(grid_y + radius + 1, grid.height)):
+            for cell_x in range(max(grid_x - radius, 0), min(grid_x + radius + 1, grid.width)):
+                key = (cell_x // size, cell_y // size)
+                local_x = cell_x % size
+                local_y = cell_y % size
+                if grid.chunk(*key)[local_y, local_x] != 0:
+                    continue
+                cleaned = self._chunks.get(key)
+                if cleaned is None:
+                    cleaned = self._chunks[key] = np.zeros((size, size), dtype=bool)
+                if not cleaned[local_y, local_x]:
+                    cleaned[local_y, local_x] = True
+                    self.versions[key] = self.versions.get(key, 0) + 1
+                    newly_cleaned += 1
+        self.cleaned_count += newly_cleaned
+        return newly_cleaned
+    
+    def is_cleaned(self, grid_x: int, grid_y: int) -> bool:
+        """Hücre temizlenmiş mi (zemin koordinatları)"""
+        size = self.chunk_size
+        cleaned = self._chunks.get((grid_x // size, grid_y // size))
+        return cleaned is not None and bool(cleaned[grid_y % size, grid_x % size])
+    
+    def chunk(self, chunk_x: int, chunk_y: int) -> Optional[np.ndarray]:
+        """Parçanın bit haritası (hiç hücresi temizlenmediyse None)"""
+        return self._chunks.get((chunk_x, chunk_y))
+    
+    def window(self, x0: int, y0: int, width: int, height: int) -> np.ndarray:
+        """[x0, x0+width) x [y0, y0+height) bölgesinin temizlenmiş hücreleri, [y, x] boolean"""
+        window = np.zeros((height, width), dtype=bool)
+        size = self.chunk_size
+        start_x, start_y, end_x, end_y = self.grid.chunk_range(x0, y0, x0 + width, y0 + height)
+        for chunk_y in range(start_y, end_y):
+            for chunk_x in range(start_x, end_x):
+                cleaned = self._chunks.get((chunk_x, chunk_y))
+                if cleaned is None:
+                    continue
+                left = max(chunk_x * size, x0)
+                right = min((chunk_x + 1) * size, x0 + width)
+                top = max(chunk_y * size, y0)
+                bottom = min((chunk_y + 1) * size, y0 + height)
+                window[top - y0:bottom - y0, left - x0:right - x0] = \
+                    cleaned[top - chunk_y * size:bottom - chunk_y * size, left - chunk_x * size:right - chunk_x * size]
+        return window
+    
+    def coverage(self) -> float:
+        """Temizlenen boş hücre yüzdesi"""
+        return self.cleaned_count / self.total_tiles * 100 if self.total_tiles > 0 else 0.0
+    
+    @property
+    def materialized(self) -> int:
+        """Bit haritası oluşturulmuş parça sayısı"""
+        return len(self._chunks)
+    
+    def __len__(self) -> int:
+        return self.cleaned_count
+
+class CoverageView:
+    def __init__(self, coverage: ChunkedCoverage, free: np.ndarray, origin_x: int, origin_y: int):
+        """
+        Parçalı temizlik haritasının bir pencereye bakan görünümü
+        
+        Robot, CoverageMap ile aynı arayüzü pencere koordinatlarında kullanır;
+        işaretler zemin haritasına yazılır.
+        
+        Args:
+            coverage: Zeminin temizlik haritası
+            free: Pencerenin boş hücreleri, [y, x] boolean
+            origin_x, origin_y: Pencerenin sol üst hücresi (zemin koordinatları)
+        """
+        self.coverage = coverage
+        self.free = free
+        self.origin_x = origin_x
+        self.origin_y = origin_y
+        self.grid_height, self.grid_width = free.shape
+        self._last_area = None
+    
+    def mark_area(self, grid_x: int, grid_y: int, radius: int = 1) -> int:
+        """Pencere koordinatlarındaki kareyi işaretler (CoverageMap.mark_area)"""
+        area = (grid_x, grid_y, radius)
+        if area == self._last_area:
+            return 0
+        self._last_area = area
+        return self.coverage.mark_area(grid_x + self.origin_x, grid_y + self.origin_y, radius)
+    
+    def is_cleaned(self, grid_x: int, grid_y: int) -> bool:
+        """Pencere koordinatlarındaki hücre temizlenmiş mi"""
+        if not (0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height):
+            return False
+        return self.coverage.is_cleaned(grid_x + self.origin_x, grid_y + self.origin_y)
+    
+    def nearest_uncleaned(self, grid_x: int, grid_y: int) -> Optional[Tuple[int, int]]:
+        """Pencere içinde verilen hücreye en yakın temizlenmemiş boş hücre; yoksa None"""
+        cleaned = self.coverage.window(self.origin_x, self.origin_y, self.grid_width, self.grid_height)
+        cell_y, cell_x = np.nonzero(self.free & ~cleaned)
+        if len(cell_x) == 0:
+            return None
+        nearest = np.argmin((cell_x - grid_x) ** 2 + (cell_y - grid_y) ** 2)
+        return (int(cell_x[nearest]), int(cell_y[nearest]))
+    
+    def clear(self):
+        """Zeminin tüm temizlik işaretlerini kaldırır"""
+        self.coverage.clear()
+        self._last_area = None
+    
+    def __len__(self) -> int:
+        return self.coverage.cleaned_count
@@ -0,0 +1,227 @@
+"""
+Konfigürasyon Uzayı Modülü
+==========================
+Robot gövdesinin (yarıçaplı daire) çarpışma kontrolü için şişirilmiş engel
+haritası. Oda grid'i hücre başına subdivisions x subdivisions alt hücreye
+bölünür; merkezi alt hücrenin ortasında olan gövde bir engel veya duvar
+hücresine değiyorsa alt hücre dolu işaretlenir. Harita oda başına bir kez
+hesaplanır ve tüm gövde kontrolü tek bir indeksleme kadardır. Alt hücre
+içindeki konuma bağlı hata en fazla yarım alt hücre köşegenidir (2 piksellik
+alt hücrede ~1.4 piksel); alt hücrenin her noktası için en kötü durumu
+almak duvar kenarındaki boş şeridi gereksiz yere daraltır.
+
+Bir adımın tamamı için merkezin izlediği doğru parçasının geçtiği alt
+hücreler DDA ile sırayla kontrol edilir; yüksek hızlarda tek tikte birkaç
+hücre ilerleyen robot ince duvarların içinden geçemez. Aynı yürüyüş ön
+sensör için gövdenin bir yönde engele değmeden gidebileceği mesafeyi verir;
+böylece engelden kaçınma ile çarpışma kontrolü aynı sınırı görür. Odanın
+güvenli yarıçap tablosu (distance_field.clearance_map) verilmişse açık
+alan, gövde yarıçapı düşülmüş güvenli yarıçaplarla küre izleme adımlarıyla
+geçilir; alt hücre yürüyüşü sadece engele yakın kalan kısımda yapılır.
+
+Engeller hücre hizalı olduğundan alt hücre ile komşu bir hücre arasındaki
+en kısa mesafe eksen başına aralık boşluklarından hesaplanır ve her alt
+hücre konumu (faz) için dolu komşu hücre kümesi bir kez bulunur; harita
+faz başına birkaç kaydırılmış grid'in VEYA'sıdır. inflate aynı hesabı
+grid yığınlarında (ör. toplu ortamın bölüm başına odaları) tek seferde yapar.
+"""
+
+import math
+from typing import Dict, FrozenSet, List, Optional, Tuple
+import numpy as np
+
+def inflate(cells: np.ndarray, grid_size: int, radius: float, subdivisions: int = 10) -> np.ndarray:
+    """
+    Engelleri gövde yarıçapı kadar şişirilmiş alt hücre haritasını hesaplar
+    
+    Args:
+        cells: Oda grid'i (..., H, W) (0=boş); önceki eksenler grid yığınıdır, grid dışı dolu sayılır
+        grid_size: Bir grid hücresinin piksel boyutu
+        radius: Robot yarıçapı (piksel)
+        subdivisions: Hücre başına eksen boyunca alt hücre sayısı
+    
+    Returns:
+        (..., H*subdivisions, W*subdivisions) boolean dizi (True: gövde engele değer)
+    """
+    *stack, grid_height, grid_width = cells.shape
+    cell_size = grid_size / subdivisions
+    
+    # Eksen boyunca alt hücre fazının ortası ile komşu hücre arasındaki boşluk (piksel)
+    reach = int(math.ceil(radius / grid_size))
+    offsets = range(-reach, reach + 1)
+    gaps = [[max(0.0, offset * grid_size - (phase + 0.5) * cell_size,
+                 (phase + 0.5) * cell_size - (offset + 1) * grid_size)
+             for offset in offsets] for phase in range(subdivisions)]
+    
+    # Faz başına gövdenin değebileceği komşu hücreler; aynı kümeye sahip fazlar ortak hesaplanır
+    obstacles = np.pad(cells != 0, [(0, 0)] * len(stack) + [(reach, reach)] * 2, constant_values=True)
+    layers: Dict[FrozenSet[Tuple[int, int]], np.ndarray] = {}
+    blocked = np.empty((*stack, grid_height, subdivisions, grid_width, subdivisions), dtype=bool)
+    for phase_y in range(subdivisions):
+        for phase_x in range(subdivisions):
+            neighbours = frozenset(
+                (dx, dy) for dy in offsets for dx in offsets
+                if gaps[phase_x][dx + reach] ** 2 + gaps[phase_y][dy + reach] ** 2 < radius * radius)
+            layer = layers.get(neighbours)
+            if layer is None:
+                layer = np.zeros((*stack, grid_height, grid_width), dtype=bool)
+                for dx, dy in neighbours:
+                    layer |= obstacles[..., reach + dy:reach + dy + grid_height,
+                                       reach + dx:reach + dx + grid_width]
+                layers[neighbours] = layer
+            blocked[..., phase_y, :, phase_x] = layer
+    return blocked.reshape(*stack, grid_height * subdivisions, grid_width * subdivisions)
+
+class ConfigurationSpace:
+    def __init__(self, cells: np.ndarray, grid_size: int, radius: float, subdivisions: int = 10,
+                 clearance: Optional[List[List[float]]] = None):
+        """
+        Konfigürasyon uzayı sınıfı
+        
+        Args:
+            cells: Oda grid'i (2D NumPy dizisi, 0=boş); grid dışı dolu sayılır
+            grid_size: Bir grid hücresinin piksel boyutu
+            radius: Robot yarıçapı (piksel)
+            subdivisions: Hücre başına eksen boyunca alt hücre sayısı
+            clearance: Hücre başına güvenli yarıçap tablosu (distance_field.clearance_map);
+                       verilirse free_distance açık alanda küre izleme ile atlar
+        """
+        grid_height, grid_width = cells.shape
+        self.grid_size = grid_size
+        self.radius = radius
+        self.subdivisions = subdivisions
+        self.width = grid_width * grid_size
+        self.height = grid_height * grid_size
+        self.cell_size = grid_size / subdivisions  # Alt hücre boyutu (piksel)
+        self._scale = subdivisions / grid_size
+        self._stride = grid_width * subdivisions
+        self._sub_height = grid_height * subdivisions
+        self._clearance = clearance
+        
+        # Sıcak döngüde hızlı indeksleme için düz bayt dizisi; blocked aynı belleğe bakan görünüm
+        blocked = inflate(cells, grid_size, radius, subdivisions)
+        self._blocked = blocked.reshape(-1).astype(np.uint8).tobytes()
+        self.blocked = np.frombuffer(self._blocked, dtype=bool).reshape(grid_height * subdivisions,
+                                                                        grid_width * subdivisions)
+    
+    def is_free(self, x: float, y: float) -> bool:
+        """Merkezi (x, y) piksel konumunda olan robot gövdesi engellere değmiyor mu (tek indeksleme)"""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return not self._blocked[int(y * self._scale) * self._stride + int(x * self._scale)]
+    
+    def segment_free(self, x0: float, y0: float, x1: float, y1: float) -> bool:
+        """
+        Robot merkezi (x0, y0) konumundan (x1, y1) konumuna giderken gövde engellere değmiyor mu
+        
+        Merkezin geçtiği alt hücreler DDA ile sırayla kontrol edilir. Başlangıç
+        alt hücresi kontrol edilmez; bir engele fazla yaklaşmış robot (ör. oda
+        değiştikten sonra) boş alt hücrelere doğru çıkabilir.
+        """
+        if not (0 <= x1 < self.width and 0 <= y1 < self.height):
+            return False
+        scale = self._scale
+        start_x = x0 * scale
+        start_y = y0 * scale
+        end_x = x1 * scale
+        end_y = y1 * scale
+        cell_x = math.floor(start_x)
+        cell_y = math.floor(start_y)
+        target_x = int(end_x)
+        target_y = int(end_y)
+        if cell_x == target_x and cell_y == target_y:
+            return True
+        blocked = self._blocked
+        stride = self._stride
+        steps = abs(target_x - cell_x) + abs(target_y - cell_y)
+        if steps == 1:
+            # Komşu alt hücreye adım (normal hızda en sık durum)
+            return not blocked[target_y * stride + target_x]
+        
+        # DDA: parçanın sıradaki dikey veya yatay alt hücre sınırını geçtiği yer
+        dx = end_x - start_x
+        dy = end_y - start_y
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        t_delta_x = abs(1 / dx) if dx else math.inf
+        t_delta_y = abs(1 / dy) if dy else math.inf
+        t_max_x = ((cell_x + (step_x > 0)) - start_x) / dx if dx else math.inf
+        t_max_y = ((cell_y + (step_y > 0)) - start_y) / dy if dy else math.inf
+        for _ in range(steps):
+            if t_max_x < t_max_y:
+                cell_x += step_x
+                t_max_x += t_delta_x
+            else:
+                cell_y += step_y
+                t_max_y += t_delta_y
+            if not (0 <= cell_x < stride and 0 <= cell_y < self._sub_height):
+                return False
+            if blocked[cell_y * stride + cell_x]:
+                return False
+        # Yuvarlama hatasıyla hedef dışında bitildiyse hedef de kontrol edilir
+        return not blocked[target_y * stride + target_x]
+    
+    def free_distance(self, x: float, y: float, angle: float, max_distance: float) -> float:
+        """
+        Merkezi (x, y) olan gövdenin angle yönünde engele değmeden gidebileceği mesafe
+        
+        Güvenli yarıçap tablosu varsa ışın önce küre izleme ile ilerler: gövde
+        yarıçapı düşülmüş güvenli yarıçap içinde gövde hiçbir engele değmez.
+        Kalan kısımda ışın dolu ilk alt hücreye kadar DDA ile yürütülür.
+        Sonuç en fazla max_distance'tır; gövde zaten engele değiyorsa 0 döner.
+        """
+        traced = 0.0
+        clearance = self._clearance
+        if clearance is not None:
+            # Açık alanda çoğu sorgu bir iki tablo okumasıyla biter
+            dir_x = math.cos(angle)
+            dir_y = math.sin(angle)
+            grid_size = self.grid_size
+            while True:
+                point_x = x + dir_x * traced
+                point_y = y + dir_y * traced
+                if not (0 <= point_x < self.width and 0 <= point_y < self.height):
+                    break
+                safe = clearance[int(point_y // grid_size)][int(point_x // grid_size)] - self.radius
+                if safe < self.cell_size:
+                    break
+                traced += safe
+                if traced >= max_distance:
+                    return max_distance
+            x += dir_x * traced
+            y += dir_y * traced
+            max_distance -= traced
+        
+        scale = self._scale
+        start_x = x * scale
+        start_y = y * scale
+        cell_x = math.floor(start_x)
+        cell_y = math.floor(start_y)
+        blocked = self._blocked
+        stride = self._stride
+        height = self._sub_height
+        if not (0 <= cell_x < stride and 0 <= cell_y < height) or blocked[cell_y * stride + cell_x]:
+            return traced
+        
+        dir_x = math.cos(angle)
+        dir_y = math.sin(angle)
+        step_x = 1 if dir_x > 0 else -1
+        step_y = 1 if dir_y > 0 else -1
+        t_delta_x = abs(1 / dir_x) if dir_x else math.inf
+        t_delta_y = abs(1 / dir_y) if dir_y else math.inf
+        t_max_x = ((cell_x + (step_x > 0)) - start_x) / dir_x if dir_x else math.inf
+        t_max_y = ((cell_y + (step_y > 0)) - start_y) / dir_y if dir_y else math.inf
+        limit = max_distance * scale
+        while True:
+            if t_max_x < t_max_y:
+                distance = t_max_x
+                cell_x += step_x
+                t_max_x += t_delta_x
+            else:
+                distance = t_max_y
+                cell_y += step_y
+                t_max_y += t_delta_y
+            if distance >= limit:
+                return traced + max_distance
+            if not (0 <= cell_x < stride and 0 <= cell_y < height) or blocked[cell_y * stride + cell_x]:
+                return traced + distance / scale
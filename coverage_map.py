@@ -0,0 +1,136 @@
+"""
+Temizlik Haritası Modülü
+========================
+Oda grid'i boyutunda temizlenmiş hücre bit haritası. Sadece boş hücreler
+işaretlenir ve temizlenen hücre sayısı artımlı tutulur; kapsama oranı
+okumak O(1)'dir ve bellek kullanımı simülasyon süresinden bağımsızdır.
+
+Harita düz bir bytearray üzerinde tutulur (tek hücre işaretlemesi liste
+indekslemesi kadar hızlı); `cleaned` aynı belleğe bakan [y, x] boolean
+NumPy görünümüdür.
+"""
+
+from typing import Iterator, Optional, Tuple
+import numpy as np
+
+class CoverageMap:
+    def __init__(self, grid: np.ndarray, free: Optional[np.ndarray] = None):
+        """
+        Temizlik haritası sınıfı
+        
+        Args:
+            grid: Oda grid'i (uint8 NumPy dizisi, 0=boş)
+            free: Temizlenebilir hücreler, [y, x] boolean (verilmezse tüm boş
+                  hücreler; ör. sadece robotun ulaşabildiği bileşen verilebilir)
+        """
+        # Harita her sıfırlandığında artar; önbellekler (ör. çizim katmanı) bunu izler
+        self.generation = 0
+        self.reset(grid, free)
+    
+    def reset(self, grid: np.ndarray, free: Optional[np.ndarray] = None):
+        """Haritayı yeni bir oda (veya yeni temizlenebilir hücre kümesi) için baştan oluşturur"""
+        self.generation += 1
+        self.grid_height, self.grid_width = grid.shape
+        if free is None:
+            free = np.asarray(grid) == 0
+        self._free = np.asarray(free, dtype=np.uint8).tobytes()
+        self.free = np.frombuffer(self._free, dtype=bool).reshape(self.grid_height, self.grid_width)
+        self._cleaned = bytearray(self.grid_height * self.grid_width)
+        self.cleaned = np.frombuffer(self._cleaned, dtype=bool).reshape(self.grid_height, self.grid_width)
+        self.total_tiles = self._free.count(1)
+        self.cleaned_count = 0
+        self._last_area = None
+    
+    def clear(self):
+        """Tüm işaretleri kaldırır (oda aynı kalır)"""
+        self.generation += 1
+        self._cleaned[:] = bytes(len(self._cleaned))
+        self.cleaned_count = 0
+        self._last_area = None
+    
+    def load(self, cleaned: np.ndarray):
+        """
+        Temizlenmiş hücreleri verilen [y, x] boolean maskeyle değiştirir
+        
+        Harita başka bir yerde tutulan temizlik durumunu izlerken (ör. işçi
+        süreçten gelen görüntü) kullanılır; sadece maske artıyorsa
+        generation değişmez ve çizim artımlı kalır.
+        """
+        self.cleaned[...] = cleaned
+        self.cleaned_count = int(np.count_nonzero(self.cleaned))
+        self._last_area = None
+    
+    def mark(self, grid_x: int, grid_y: int) -> bool:
+        """
+        Tek bir hücreyi temizlenmiş olarak işaretler
+        
+        Returns:
+            Hücre boşsa ve daha önce temizlenmemişse True
+        """
+        if not (0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height):
+            return False
+        index = grid_y * self.grid_width + grid_x
+        if self._free[index] and not self._cleaned[index]:
+            self._cleaned[index] = 1
+            self.cleaned_count += 1
+            return True
+        return False
+    
+    def mark_area(self, grid_x: int, grid_y: int, radius: int = 1) -> int:
+        """
+        (2*radius+1)² hücrelik kareyi temizlenmiş olarak işaretler
+        
+        Oda dışındaki, engel ve duvar hücreleri atlanır. Robot bir hücreyi
+        birkaç tikte geçtiği için son işaretlenen alan tekrar istenirse
+        hiçbir hücre yeni temizlenemez ve tarama atlanır.
+        
+        Returns:
+            Yeni temizlenen hücre sayısı
+        """
+        area = (grid_x, grid_y, radius)
+        if area == self._last_area:
+            return 0
+        self._last_area = area
+        
+        min_x = max(grid_x - radius, 0)
+        max_x = min(grid_x + radius + 1, self.grid_width)
+        free = self._free
+        cleaned = self._cleaned
+        newly_cleaned = 0
+        for cell_y in range(max(grid_y - radius, 0), min(grid_y + radius + 1, self.grid_height)):
+            row = cell_y * self.grid_width
+            for index in range(row + min_x, row + max_x):
+                if free[index] and not cleaned[index]:
+                    cleaned[index] = 1
+                    newly_cleaned += 1
+        self.cleaned_count += newly_cleaned
+        return newly_cleaned
+    
+    def is_cleaned(self, grid_x: int, grid_y: int) -> bool:
+        """Hücre temizlenmiş mi"""
+        if not (0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height):
+            return False
+        return bool(self._cleaned[grid_y * self.grid_width + grid_x])
+    
+    def nearest_uncleaned(self, grid_x: int, grid_y: int) -> Optional[Tuple[int, int]]:
+        """Verilen hücreye (kuş uçuşu) en yakın temizlenmemiş boş hücre; yoksa None"""
+        cell_y, cell_x = np.nonzero(self.free & ~self.cleaned)
+        if len(cell_x) == 0:
+            return None
+        nearest = np.argmin((cell_x - grid_x) ** 2 + (cell_y - grid_y) ** 2)
+        return (int(cell_x[nearest]), int(cell_y[nearest]))
+    
+    def coverage(self) -> float:
+        """Temizlenen boş hücre yüzdesi"""
+        return self.cleaned_count / self.total_tiles * 100 if self.total_tiles > 0 else 0.0
+    
+    def __len__(self) -> int:
+        return self.cleaned_count
+    
+    def __contains__(self, cell: Tuple[int, int]) -> bool:
+        return self.is_cleaned(*cell)
+    
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        """Temizlenmiş hücrelerin (grid_x, grid_y) koordinatları"""
+        cell_y, cell_x = np.nonzero(self.cleaned)
+        return zip(cell_x.tolist(), cell_y.tolist())
@@ -0,0 +1,66 @@
+"""
+Mesafe Alanı Modülü
+===================
+Oda grid'i için Öklid mesafe dönüşümü (EDT). Her boş hücre, en yakın
+engel veya duvar hücresine olan mesafeyi (hücre merkezleri arası, hücre
+biriminde) saklar. Engel hücrelerinin değeri 0'dır.
+"""
+
+import math
+from typing import List
+import numpy as np
+
+# Aynı hücredeki bir noktanın hücre merkezine en uzak mesafesi ile bir engel
+# hücresinin merkezinden kenarına en uzak mesafenin toplamı (hücre biriminde)
+CELL_MARGIN = math.sqrt(2)
+
+def compute_distance_field(cells: np.ndarray) -> np.ndarray:
+    """
+    Kesin Öklid mesafe dönüşümünü hesaplar
+    
+    İki geçişli ayrılabilir yöntem: önce her sütunda en yakın engele dikey
+    mesafe, ardından her satırda min((x - x')² + g(x')²) ile yatay birleştirme.
+    
+    Args:
+        cells: Oda grid'i (2D NumPy dizisi, 0=boş)
+    
+    Returns:
+        Grid boyutunda float32 mesafe dizisi (hücre biriminde)
+    """
+    grid_height, grid_width = cells.shape
+    far = float(grid_height + grid_width)
+    
+    # Dikey geçiş: aynı sütundaki en yakın engele mesafe
+    vertical = np.where(cells != 0, 0.0, far)
+    for y in range(1, grid_height):
+        np.minimum(vertical[y], vertical[y - 1] + 1, out=vertical[y])
+    for y in range(grid_height - 2, -1, -1):
+        np.minimum(vertical[y], vertical[y + 1] + 1, out=vertical[y])
+    
+    # Yatay geçiş: her satırda tüm sütun adaylarının karesel mesafesinin minimumu
+    columns = np.arange(grid_width)
+    dx_squared = (columns[:, None] - columns[None, :]) ** 2
+    vertical_squared = vertical ** 2
+    distance_squared = np.empty((grid_height, grid_width))
+    for y in range(grid_height):
+        np.min(dx_squared + vertical_squared[y], axis=1, out=distance_squared[y])
+    
+    return np.sqrt(distance_squared).astype(np.float32)
+
+def clearance_map(distance_field: np.ndarray, grid_size: int) -> List[List[float]]:
+    """
+    Her hücre için piksel cinsinden güvenli yarıçap tablosu oluşturur
+    
+    Nokta hücrenin herhangi bir yerinde olabileceği için hücre mesafesinden
+    CELL_MARGIN çıkarılır; sonuç hücredeki her noktanın en yakın engele
+    olan gerçek mesafesinin alt sınırıdır. Tablo sıcak döngülerde hızlı
+    indekslenebilmesi için iç içe liste olarak döner.
+    
+    Args:
+        distance_field: compute_distance_field çıktısı
+        grid_size: Bir grid hücresinin piksel boyutu
+    
+    Returns:
+        [y][x] ile indekslenen güvenli yarıçaplar (engel hücrelerinde 0)
+    """
+    return np.maximum(0.0, (distance_field - CELL_MARGIN) * grid_size).tolist()
@@ -0,0 +1,228 @@
+"""
+Büyük Zemin Görselleştirme Modülü
+=================================
+LargeFloorSimulation için kaydırılıp yakınlaştırılabilen pygame çizici.
+Zemin parça parça çizilir: her parça, hücre başına bir piksel olan küçük
+bir görüntüye (duvar, boş, temizlenmiş renkleri) dönüştürülüp önbelleğe
+alınır ve her karede sadece görüş alanına değen parçaların görünen kısmı
+ölçeklenerek ekrana aktarılır. Kare maliyeti zemin boyutuna değil görüş
+alanındaki parça sayısına bağlıdır.
+"""
+
+import math
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+import numpy as np
+import pygame
+from camera import Camera
+from large_floor import LargeFloorSimulation
+from renderer import FONT_MEDIUM, FONT_SMALL, FONT_TINY
+from text_cache import TextCache
+from timestep import FixedTimestep
+
+# Parça görüntülerinin renkleri (hücre değeri -> renk; 2: temizlenmiş boş hücre)
+FLOOR_PALETTE = np.array([(250, 250, 250), (139, 69, 19), (200, 255, 200)], dtype=np.uint8)
+
+class FloorRenderer:
+    def __init__(self, simulation: LargeFloorSimulation, timestep: Optional[FixedTimestep] = None,
+                 size: Tuple[int, int] = (1200, 800), max_images: int = 512):
+        """
+        Büyük zemin çizici sınıfı
+        
+        Args:
+            simulation: Çizilecek büyük zemin simülasyonu
+            timestep: Hız çarpanı ve tik hızı göstergesi için çalıştırıcı (opsiyonel)
+            size: Ekran boyutu
+            max_images: Önbellekte tutulan parça görüntüsü sayısı üst sınırı
+        """
+        self.simulation = simulation
+        self.timestep = timestep
+        self.text_cache = TextCache()
+        self.max_images = max_images
+        
+        width, height = size
+        self.header_rect = pygame.Rect(0, 0, width, 40)
+        self.view_rect = pygame.Rect(0, 40, width, height - 40)
+        self.hud_rect = pygame.Rect(10, 50, 260, 190)
+        # En uzak görünümde hücre başına bir piksel
+        self.camera = Camera(tuple(self.view_rect), simulation.width, simulation.height,
+                             zoom=0.5, min_zoom=1 / simulation.grid_size)
+        self.follow = True  # Kamera ilk robotu takip eder
+        
+        # Parça görüntüleri: (parça x, parça y) -> (grid kimliği, temizlik sürümü, yüzey)
+        self._images: "OrderedDict[Tuple[int, int], tuple]" = OrderedDict()
+        self._coverage_generation = None
+        self.visible_chunks = 0
+    
+    def invalidate(self):
+        """Parça görüntülerini atar (bir sonraki karede yeniden oluşturulur)"""
+        self._images.clear()
+    
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """
+        Kamera kontrolleri: ok tuşları kaydırır, tekerlek ve PageUp/PageDown
+        yakınlaştırır, F robot takibini açar/kapatır
+        
+        Returns:
+            Olay kamera tarafından kullanıldıysa True
+        """
+        camera = self.camera
+        if event.type == pygame.MOUSEWHEEL:
+            camera.zoom_by(1.25 ** event.y, pygame.mouse.get_pos())
+            return True
+        if event.type != pygame.KEYDOWN:
+            return False
+        pan_x = camera.view_width / 4
+        pan_y = camera.view_height / 4
+        pans = {pygame.K_LEFT: (-pan_x, 0), pygame.K_RIGHT: (pan_x, 0),
+                pygame.K_UP: (0, -pan_y), pygame.K_DOWN: (0, pan_y)}
+        if event.key in pans:
+            # Elle kaydırma takibi kapatır
+            self.follow = False
+            camera.pan(*pans[event.key])
+        elif event.key == pygame.K_PAGEUP:
+            camera.zoom_by(2.0)
+        elif event.key == pygame.K_PAGEDOWN:
+            camera.zoom_by(0.5)
+        elif event.key == pygame.K_f:
+            self.follow = not self.follow
+        else:
+            return False
+        return True
+    
+    def _chunk_image(self, chunk_x: int, chunk_y: int) -> pygame.Surface:
+        """Parçanın hücre başına bir piksellik görüntüsü (temizlik sürümü değişince yeniden oluşturulur)"""
+        sim = self.simulation
+        key = (chunk_x, chunk_y)
+        version = sim.cleaned_area.versions.get(key, 0)
+        cached = self._images.get(key)
+        if cached is not None and cached[0] is sim.grid and cached[1] == version:
+            self._images.move_to_end(key)
+            return cached[2]
+        
+        cells = sim.grid.chunk(chunk_x, chunk_y).copy()
+        cleaned = sim.cleaned_area.chunk(chunk_x, chunk_y)
+        if cleaned is not None:
+            cells[cleaned] = 2
+        image = pygame.surfarray.make_surface(FLOOR_PALETTE[cells].swapaxes(0, 1))
+        self._images[key] = (sim.grid, version, image)
+        if len(self._images) > self.max_images:
+            self._images.popitem(last=False)
+        return image
+    
+    def draw(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        """
+        Zemini, robotları ve bilgi panelini çizer
+        
+        Kamera her karede hareket edebildiğinden tüm ekran güncellenir.
+        
+        Returns:
+            Bu karede değişen ekran bölgeleri (pygame.display.update için)
+        """
+        sim = self.simulation
+        profiler = sim.profiler
+        frame_start = start = profiler.clock() if profiler is not None else 0.0
+        camera = self.camera
+        if self.follow:
+            camera.center_on(sim.robot.x, sim.robot.y)
+        if self._coverage_generation != sim.cleaned_area.generation:
+            self._coverage_generation = sim.cleaned_area.generation
+            self.invalidate()
+        
+        screen.fill((200, 200, 200), self.view_rect)
+        screen.set_clip(self.view_rect)
+        self._draw_floor(screen)
+        if profiler is not None:
+            start = profiler.lap('draw.room', start)
+        for robot in sim.robots:
+            self._draw_robot(screen, robot)
+        screen.set_clip(None)
+        if profiler is not None:
+            start = profiler.lap('draw.robots', start)
+        
+        self._draw_ui(screen)
+        if profiler is not None:
+            now = profiler.lap('draw.ui', start)
+            profiler.record('draw.frame', now - frame_start)
+        return [screen.get_rect()]
+    
+    def _draw_floor(self, screen: pygame.Surface):
+        """Görüş alanına değen parçaların görünen kısımlarını ölçekleyerek çizer"""
+        sim = self.simulation
+        camera = self.camera
+        grid_size = sim.grid_size
+        size = sim.chunk_size
+        x0, y0, x1, y1 = camera.visible_cells(grid_size)
+        start_x, start_y, end_x, end_y = sim.grid.chunk_range(x0, y0, x1, y1)
+        self.visible_chunks = (end_x - start_x) * (end_y - start_y)
+        
+        for chunk_y in range(start_y, end_y):
+            for chunk_x in range(start_x, end_x):
+                # Parçanın görünen hücreleri (zemin koordinatları)
+                left = max(chunk_x * size, x0)
+                right = min((chunk_x + 1) * size, x1, sim.floor_width)
+                top = max(chunk_y * size, y0)
+                bottom = min((chunk_y + 1) * size, y1, sim.floor_height)
+                if left >= right or top >= bottom:
+                    continue
+                # Komşu parçalar arasında boşluk kalmasın diye kenarlar ayrı ayrı yuvarlanır
+                screen_left, screen_top = camera.world_to_screen(left * grid_size, top * grid_size)
+                screen_right, screen_bottom = camera.world_to_screen(right * grid_size, bottom * grid_size)
+                screen_left, screen_top = round(screen_left), round(screen_top)
+                target = (round(screen_right) - screen_left, round(screen_bottom) - screen_top)
+                if target[0] <= 0 or target[1] <= 0:
+                    continue
+                image = self._chunk_image(chunk_x, chunk_y)
+                area = image.subsurface((left - chunk_x * size, top - chunk_y * size, right - left, bottom - top))
+                screen.blit(pygame.transform.scale(area, target), (screen_left, screen_top))
+    
+    def _draw_robot(self, screen: pygame.Surface, robot):
+        """Robotu ve izini görüş alanındaysa çizer"""
+        camera = self.camera
+        x, y = camera.world_to_screen(robot.x, robot.y)
+        radius = max(2, int(robot.radius * camera.zoom))
+        if not self.view_rect.inflate(2 * radius, 2 * radius).collidepoint(x, y):
+            return
+        if len(robot.path_history) > 1:
+            points = [camera.world_to_screen(px, py) for px, py in robot.path_history]
+            pygame.draw.lines(screen, (150, 150, 255), False, points, max(1, int(2 * camera.zoom)))
+        pygame.draw.circle(screen, robot.color, (int(x), int(y)), radius)
+        pygame.draw.circle(screen, (30, 100, 200), (int(x), int(y)), radius, 1 if radius < 6 else 2)
+        end_x = x + math.cos(robot.angle) * (radius + 5 * camera.zoom)
+        end_y = y + math.sin(robot.angle) * (radius + 5 * camera.zoom)
+        pygame.draw.line(screen, (255, 255, 255), (int(x), int(y)), (int(end_x), int(end_y)),
+                         max(1, int(3 * camera.zoom)))
+    
+    def _draw_ui(self, screen: pygame.Surface):
+        """Kontrol satırını ve bilgi panelini çizer"""
+        sim = self.simulation
+        cache = self.text_cache
+        screen.fill((240, 240, 240), self.header_rect)
+        controls = ("Arrows: Pan | Wheel/PgUp/PgDn: Zoom | F: Follow | "
+                    "SPACE: New floor | R: Reset | 1-4 +/-: Speed | ESC: Exit")
+        screen.blit(cache.render(controls, FONT_SMALL, (50, 50, 50)), (10, 12))
+        
+        pygame.draw.rect(screen, (255, 255, 255), self.hud_rect)
+        pygame.draw.rect(screen, (100, 100, 100), self.hud_rect, 2)
+        status = sim.get_status()
+        floor = sim.get_floor_status()
+        lines = [
+            f"Floor: {sim.floor_width}x{sim.floor_height} cells",
+            f"Zoom: {self.camera.zoom * sim.grid_size:.2f} px/cell{'  (follow)' if self.follow else ''}",
+            f"Chunks: {floor['grid_chunks']:,} / {floor['chunks']:,} in memory",
+            f"Visible chunks: {self.visible_chunks}",
+            f"Cleaned: {status['cleaned_tiles']:,} ({status['efficiency']:.3f}%)",
+            f"Mode: {status['state']}  Battery: {status['battery']:.0f}%",
+            f"Robots: {len(sim.robots)}  Time: {status['time']:,}",
+        ]
+        screen.blit(cache.render("Large Floor", FONT_MEDIUM, (0, 0, 0)), (self.hud_rect.x + 10, self.hud_rect.y + 8))
+        for i, line in enumerate(lines):
+            screen.blit(cache.render(line, FONT_TINY, (60, 60, 60)),
+                        (self.hud_rect.x + 10, self.hud_rect.y + 38 + i * 20))
+        
+        if self.timestep is not None:
+            speed_text = (f"Speed: {self.timestep.speed_label}  |  "
+                          f"{self.timestep.ticks_per_second:,.0f} ticks/s")
+            rendered_speed = cache.render(speed_text, FONT_SMALL, (40, 40, 120))
+            screen.blit(rendered_speed, rendered_speed.get_rect(
+                bottomright=(self.view_rect.right - 10, self.view_rect.bottom - 8)))
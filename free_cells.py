@@ -0,0 +1,150 @@
+"""
+Boş Hücre İndeksi Modülü
+========================
+Oda grid'inin boş hücrelerini 4-komşulukla bağlı bileşenlere ayırır ve
+robotun ulaşabileceği hücrelerin indeksini tutar. Oda oluşturulurken bir
+kez hesaplanır:
+
+- Başlangıç pozisyonları en büyük bileşenin, çevresi (artı şeklindeki 5
+  hücre) boş hücrelerinden O(1) rastgele seçilir; rastgele deneme ve oda
+  dışına/duvara düşebilen varsayılan pozisyon yoktur.
+- Kapsama oranı sadece robotun ulaşabildiği bileşendeki hücrelere göre
+  hesaplanır; mobilya arasında kapalı kalmış boş hücreler oranı düşürmez.
+
+Etiketleme satır parçaları üzerinde birleşim-bul ile yapılır: her satırın
+boş hücre parçaları NumPy ile bulunur, üst üste binen komşu satır
+parçaları birleştirilir. Python döngüsü hücre başına değil parça başınadır.
+"""
+
+import random
+from typing import Iterable, Tuple
+import numpy as np
+
+def label_components(free: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Boş hücreleri 4-komşulukla bağlı bileşenlere ayırır
+    
+    Args:
+        free: Boş hücreler, [y, x] boolean
+    
+    Returns:
+        labels: [y, x] int32 bileşen numaraları (0: dolu hücre, 1..n: bileşen)
+        sizes: Bileşen başına hücre sayısı (sizes[0] = 0)
+    """
+    grid_height, grid_width = free.shape
+    # Satır parçaları: başlangıç (dahil) ve bitiş (hariç) sütunları, satır sırasıyla
+    padded = np.zeros((grid_height, grid_width + 2), dtype=np.int8)
+    padded[:, 1:-1] = free
+    edges = np.diff(padded, axis=1)
+    rows, starts = np.nonzero(edges == 1)
+    ends = np.nonzero(edges == -1)[1]
+    run_count = len(starts)
+    if run_count == 0:
+        return np.zeros((grid_height, grid_width), dtype=np.int32), np.zeros(1, dtype=np.int64)
+    
+    # Birleşim-bul; kök her zaman küçük numaralı parçadır (parent[run] <= run)
+    parent = list(range(run_count))
+    
+    def find(run: int) -> int:
+        while parent[run] != run:
+            parent[run] = parent[parent[run]]
+            run = parent[run]
+        return run
+    
+    # Ardışık satırların parçalarını iki işaretçiyle karşılaştır; sütun aralıkları kesişenler bağlıdır
+    row_bounds = np.searchsorted(rows, np.arange(grid_height + 1)).tolist()
+    starts_list = starts.tolist()
+    ends_list = ends.tolist()
+    for y in range(1, grid_height):
+        upper, upper_end = row_bounds[y - 1], row_bounds[y]
+        lower, lower_end = row_bounds[y], row_bounds[y + 1]
+        while upper < upper_end and lower < lower_end:
+            if starts_list[upper] < ends_list[lower] and starts_list[lower] < ends_list[upper]:
+                root_upper = find(upper)
+                root_lower = find(lower)
+                if root_upper < root_lower:
+                    parent[root_lower] = root_upper
+                elif root_lower < root_upper:
+                    parent[root_upper] = root_lower
+            if ends_list[upper] < ends_list[lower]:
+                upper += 1
+            else:
+                lower += 1
+    
+    # parent[run] <= run olduğundan artan sırada tek geçiş tüm yolları kısaltır
+    for run in range(run_count):
+        parent[run] = parent[parent[run]]
+    roots = np.array(parent)
+    # Kökler ilk görülme (artan numara) sırasıyla 1..n olur
+    root_numbers = np.cumsum(roots == np.arange(run_count))
+    run_labels = root_numbers[roots]
+    component_count = int(root_numbers[-1])
+    
+    # Parça etiketlerini hücrelere yay: başlangıçta +etiket, bitişte -etiket, kümülatif toplam
+    lengths = ends - starts
+    flat_starts = rows * grid_width + starts
+    delta = np.zeros(grid_height * grid_width + 1, dtype=np.int32)
+    delta[flat_starts + lengths] = -run_labels
+    delta[flat_starts] += run_labels
+    labels = np.cumsum(delta[:-1], dtype=np.int32)
+    sizes = np.bincount(run_labels, weights=lengths, minlength=component_count + 1).astype(np.int64)
+    return labels.reshape(grid_height, grid_width), sizes
+
+class FreeCellIndex:
+    def __init__(self, grid: np.ndarray, connected: bool = False):
+        """
+        Boş hücre indeksi sınıfı
+        
+        Args:
+            grid: Oda grid'i (uint8 NumPy dizisi, 0=boş)
+            connected: Tüm boş hücrelerin tek bileşen olduğu biliniyorsa (ör. derlem
+                       meta verisinden) etiketleme atlanır
+        """
+        free = np.asarray(grid) == 0
+        self.grid_height, self.grid_width = free.shape
+        if connected:
+            self.labels = free.astype(np.int32)
+            self.sizes = np.array([0, np.count_nonzero(free)], dtype=np.int64)
+        else:
+            self.labels, self.sizes = label_components(free)
+        self.component_count = len(self.sizes) - 1
+        # En büyük bileşen (boş hücre yoksa 0)
+        self.largest = int(np.argmax(self.sizes)) if self.component_count > 0 else 0
+        self.reachable = self.labels == self.largest if self.largest else np.zeros_like(free)
+        self.reachable_count = int(self.sizes[self.largest])
+        self.free_count = int(np.count_nonzero(free))
+        
+        # Başlangıç hücreleri: en büyük bileşende, artı şeklindeki 5 hücresi boş olanlar
+        start = self.reachable.copy()
+        start[0, :] = start[-1, :] = start[:, 0] = start[:, -1] = False
+        start[1:-1, 1:-1] &= (free[:-2, 1:-1] & free[2:, 1:-1] & free[1:-1, :-2] & free[1:-1, 2:])
+        self.start_cells = np.flatnonzero(start)
+        if len(self.start_cells) == 0:
+            # Dar odalarda artı şartını sağlayan hücre yoksa bileşenin herhangi bir hücresi
+            self.start_cells = np.flatnonzero(self.reachable)
+    
+    def random_start_cell(self, rng: random.Random) -> Tuple[int, int]:
+        """
+        En büyük bileşenden rastgele bir başlangıç hücresi (grid_x, grid_y), O(1)
+        
+        Raises:
+            ValueError: Odada boş hücre yoksa
+        """
+        if len(self.start_cells) == 0:
+            raise ValueError("odada boş hücre yok")
+        cell = int(self.start_cells[rng.randrange(len(self.start_cells))])
+        return (cell % self.grid_width, cell // self.grid_width)
+    
+    def reachable_from(self, cells: Iterable[Tuple[int, int]]) -> np.ndarray:
+        """
+        Verilen hücrelerin (ör. robot başlangıçları) bileşenlerindeki hücreler, [y, x] boolean
+        
+        Grid dışındaki ve dolu hücreler yok sayılır; hiçbiri boş değilse en
+        büyük bileşen döner.
+        """
+        labels = {int(self.labels[cell_y, cell_x]) for cell_x, cell_y in cells
+                  if 0 <= cell_x < self.grid_width and 0 <= cell_y < self.grid_height}
+        labels.discard(0)
+        if not labels or labels == {self.largest}:
+            return self.reachable
+        return np.isin(self.labels, list(labels))
@@ -0,0 +1,319 @@
+"""
+Büyük Zemin Modülü
+==================
+Depo ölçeğindeki (ör. 5000x5000 hücre) zeminlerde simülasyon. Zemin
+ChunkedGrid ile parça parça, seed'den deterministik olarak üretilir;
+temizlik haritası da parçalıdır (ChunkedCoverage).
+
+Robotların sensörleri, planlayıcısı ve doluluk haritası tüm zemine değil,
+robotun etrafındaki küçük bir pencereye (FloorWindow) bakar. Pencere,
+robot kenarına yaklaştığında robotun etrafına yeniden ortalanır. Böylece
+tik maliyeti ve bellek kullanımı zemin boyutundan bağımsızdır: sadece
+robotların dolaştığı parçalar oluşturulur.
+
+Robot koordinatları zemin pikselleridir (ekran offset'i yoktur); çizim
+için floor_renderer modülündeki FloorRenderer kullanılır.
+"""
+
+import random
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from chunked_grid import ChunkFactory, ChunkedCoverage, ChunkedGrid, CoverageView
+from profiler import PhaseProfiler
+from robot_vacuum import RobotVacuum, LidarMode
+from room_generator import RoomGenerator
+from spatial_hash import SpatialHash
+
+def warehouse_factory(seed: int, width: int, height: int) -> ChunkFactory:
+    """
+    Depo düzeni üreten parça üretici
+    
+    Her parça (seed, parça konumu) ile tohumlanır; aynı parça her üretimde
+    aynıdır, bu yüzden bellekten atılan parçalar tekrar üretilebilir.
+    Parça kenarlarında 4 hücrelik ana koridorlar, parça içinde 4 hücrelik
+    koridorlarla ayrılmış 2 hücre kalınlığında raf sıraları ve sıralar
+    arasında geçitler vardır; zeminin tüm boş alanı birbirine bağlıdır.
+    
+    Args:
+        seed: Zemin seed'i
+        width, height: Zemin boyutu (hücre); dış duvarlar için
+    """
+    def build(chunk_x: int, chunk_y: int, size: int) -> np.ndarray:
+        rng = random.Random((seed * 1_000_003 + chunk_y) * 1_000_003 + chunk_x)
+        chunk = np.zeros((size, size), dtype=np.uint8)
+        
+        # Raf sıraları: bazıları boş bırakılır (açık alan), her sıra geçitlerle bölünür
+        for top in range(4, size - 5, 6):
+            if rng.random() < 0.15:
+                continue
+            x = 4
+            while x < size - 4:
+                end = min(x + rng.randint(8, 20), size - 4)
+                chunk[top:top + 2, x:end] = 1
+                x = end + rng.randint(2, 4)
+        
+        # Koridorlardaki paletler (tek hücre; koridoru kapatmaz)
+        for _ in range(rng.randint(0, 4)):
+            chunk[rng.randrange(size), rng.randrange(size)] = 1
+        
+        # Zeminin dış duvarları
+        if chunk_x == 0:
+            chunk[:, 0] = 1
+        if chunk_y == 0:
+            chunk[0, :] = 1
+        right = width - 1 - chunk_x * size
+        if 0 <= right < size:
+            chunk[:, right] = 1
+        bottom = height - 1 - chunk_y * size
+        if 0 <= bottom < size:
+            chunk[bottom, :] = 1
+        return chunk
+    return build
+
+class FloorWindow:
+    def __init__(self, grid: ChunkedGrid, coverage: ChunkedCoverage, size: int = 64,
+                 margin: int = 16, rng: Optional[random.Random] = None):
+        """
+        Bir robotun zemine baktığı kayan pencere
+        
+        Args:
+            grid: Zemin grid'i
+            coverage: Zeminin temizlik haritası
+            size: Pencere kenar uzunluğu (hücre)
+            margin: Robot kenara bundan daha yakınsa pencere yeniden ortalanır (hücre)
+            rng: Pencerenin oda üreticisine verilen rastgele sayı üreteci
+        """
+        self.grid = grid
+        self.coverage = coverage
+        self.size = size
+        self.margin = margin
+        # Robotun çarpışma, LiDAR ve planlama katmanları pencere grid'inden üretilir
+        self.generator = RoomGenerator(size * 20, size * 20, rng)
+        self.grid_size = self.generator.grid_size
+        self.origin_x = 0
+        self.origin_y = 0
+        self.room_grid: Optional[np.ndarray] = None
+        self.view: Optional[CoverageView] = None
+        self.moves = 0  # Yeniden ortalama sayısı
+    
+    def needs_recenter(self, cell_x: int, cell_y: int) -> bool:
+        """Hücre pencerenin kenar payı içinde (veya dışında) mı"""
+        if self.room_grid is None:
+            return True
+        local_x = cell_x - self.origin_x
+        local_y = cell_y - self.origin_y
+        return not (self.margin <= local_x < self.size - self.margin and
+                    self.margin <= local_y < self.size - self.margin)
+    
+    def recenter(self, cell_x: int, cell_y: int):
+        """Pencereyi zemin hücresinin etrafına ortalar (zemin dışı kısımlar duvardır)"""
+        self.origin_x = cell_x - self.size // 2
+        self.origin_y = cell_y - self.size // 2
+        self.room_grid = self.grid.window(self.origin_x, self.origin_y, self.size, self.size)
+        self.view = CoverageView(self.coverage, self.room_grid == 0, self.origin_x, self.origin_y)
+        self.moves += 1
+    
+    def attach(self, robot: RobotVacuum):
+        """Robotu pencereye bağlar: offset, temizlik ve çarpışma haritası pencereye göre ayarlanır"""
+        robot.set_simulation_offset(self.origin_x * self.grid_size, self.origin_y * self.grid_size)
+        robot.cleaned_area = self.view
+        robot.config_space = None  # Pencerenin çarpışma haritası ilk harekette oluşturulur
+
+class LargeFloorSimulation:
+    def __init__(self, floor_width: int, floor_height: int, robot_count: int = 1,
+                 lidar_mode: LidarMode = LidarMode.FULL, seed: Optional[int] = None,
+                 chunk_size: int = 64, window_size: int = 64, max_chunks: Optional[int] = 1024):
+        """
+        Büyük zemin simülasyonu sınıfı (Simulation ile aynı arayüz)
+        
+        Args:
+            floor_width, floor_height: Zemin boyutu (hücre)
+            robot_count: Zemini paylaşan robot sayısı
+            lidar_mode: Robotların LiDAR tarama modu
+            seed: Rastgele sayı tohumu (verilmezse rastgele seçilir ve self.seed'de saklanır)
+            chunk_size: Zemin parçalarının kenar uzunluğu (hücre)
+            window_size: Robot penceresinin kenar uzunluğu (hücre)
+            max_chunks: Bellekte tutulan değiştirilmemiş zemin parçası sayısı üst sınırı
+        """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        
+        self.floor_width = floor_width
+        self.floor_height = floor_height
+        self.chunk_size = chunk_size
+        self.window_size = window_size
+        self.max_chunks = max_chunks
+        self.grid_size = 20
+        # Zemin boyutu (piksel); robot koordinatları bu alandadır
+        self.width = floor_width * self.grid_size
+        self.height = floor_height * self.grid_size
+        
+        self._build_floor()
+        
+        self.robots: List[RobotVacuum] = []
+        self.windows: List[FloorWindow] = []
+        for _ in range(robot_count):
+            self.robots.append(RobotVacuum(0, 0, self.grid_size, lidar_mode, self._derive_rng()))
+            self.windows.append(FloorWindow(self.grid, self.cleaned_area, window_size,
+                                            rng=self._derive_rng()))
+        self.robot = self.robots[0]
+        
+        # Pencereler robot başına olduğundan robot-robot sorguları zemin koordinatlarındadır
+        self.spatial_hash = SpatialHash(self.grid_size) if robot_count > 1 else None
+        self._place_robots()
+        
+        self.simulation_time = 0
+        self.profiler: Optional[PhaseProfiler] = None
+    
+    def _derive_rng(self) -> random.Random:
+        """Simülasyon seed'inden bağımsız bir alt rastgele sayı üreteci türetir"""
+        return random.Random(self.rng.getrandbits(64))
+    
+    def _build_floor(self):
+        """Zemini ve temizlik haritasını seed'den (tembel olarak) oluşturur"""
+        self.floor_seed = self.rng.getrandbits(32)
+        self.grid = ChunkedGrid(self.floor_width, self.floor_height, self.chunk_size,
+                                warehouse_factory(self.floor_seed, self.floor_width, self.floor_height),
+                                max_chunks=self.max_chunks)
+        # Boş hücre sayımı tüm zemini bir kez tarar; taranan parçalar saklanmaz
+        self.cleaned_area = ChunkedCoverage(self.grid)
+        self.total_tiles = self.cleaned_area.total_tiles
+    
+    def generate_new_room(self):
+        """Yeni bir zemin oluşturur ve robotları yerleştirir"""
+        self._build_floor()
+        for window in self.windows:
+            window.grid = self.grid
+            window.coverage = self.cleaned_area
+        self._place_robots()
+        self.simulation_time = 0
+    
+    def reset_robot(self):
+        """Robotları mevcut zeminde başlangıç noktasına döndürür"""
+        self._place_robots()
+        self.simulation_time = 0
+    
+    def _start_cell(self, cell_x: int, cell_y: int) -> Tuple[int, int]:
+        """Verilen hücreye en yakın, çevresi (3x3) boş bir hücre"""
+        for radius in range(max(self.floor_width, self.floor_height)):
+            for y in range(cell_y - radius, cell_y + radius + 1):
+                for x in range(cell_x - radius, cell_x + radius + 1):
+                    if max(abs(x - cell_x), abs(y - cell_y)) != radius:
+                        continue
+                    if all(self.grid.get(x + dx, y + dy) == 0 for dx in (-1, 0, 1) for dy in (-1, 0, 1)):
+                        return (x, y)
+        raise ValueError("Zeminde boş hücre yok")
+    
+    def _place_robots(self):
+        """
+        Robotları zeminin ortasındaki ana koridora yerleştirir
+        
+        İlk robot orta parçanın köşesindeki koridora, diğerleri onun
+        çevresindeki boş hücrelere konur.
+        """
+        if self.spatial_hash is not None:
+            self.spatial_hash.clear()
+        size = self.chunk_size
+        center_x = min(self.floor_width // 2 // size * size + 1, self.floor_width - 2)
+        center_y = min(self.floor_height // 2 // size * size + 1, self.floor_height - 2)
+        occupied = set()
+        for robot, window in zip(self.robots, self.windows):
+            cell = self._start_cell(center_x, center_y)
+            while cell in occupied:
+                cell = self._start_cell(cell[0] + 2, cell[1])
+            occupied.add(cell)
+            
+            robot.cleaned_area = self.cleaned_area
+            robot.reset((cell[0] + 0.5) * self.grid_size, (cell[1] + 0.5) * self.grid_size)
+            window.recenter(*cell)
+            window.attach(robot)
+            if self.spatial_hash is not None:
+                self.spatial_hash.insert(robot, robot.x, robot.y)
+    
+    def enable_profiling(self, window: int = 1024) -> PhaseProfiler:
+        """Tik aşamalarının süre ölçümünü açar (Simulation.enable_profiling)"""
+        if self.profiler is None:
+            self.profiler = PhaseProfiler(window)
+        for robot in self.robots:
+            robot.profiler = self.profiler
+        return self.profiler
+    
+    def disable_profiling(self):
+        """Süre ölçümünü kapatır"""
+        self.profiler = None
+        for robot in self.robots:
+            robot.profiler = None
+    
+    def step(self):
+        """Simülasyonu bir tik ilerletir"""
+        profiler = self.profiler
+        start = profiler.clock() if profiler is not None else 0.0
+        self.simulation_time += 1
+        grid_size = self.grid_size
+        
+        for robot, window in zip(self.robots, self.windows):
+            # Robot pencerenin kenarına yaklaştıysa pencereyi kaydır
+            cell_x = int(robot.x // grid_size)
+            cell_y = int(robot.y // grid_size)
+            if window.needs_recenter(cell_x, cell_y):
+                window_start = profiler.clock() if profiler is not None else 0.0
+                window.recenter(cell_x, cell_y)
+                window.attach(robot)
+                if profiler is not None:
+                    profiler.lap('tick.window', window_start)
+            
+            robot.update(window.room_grid, window.generator, self.spatial_hash)
+            robot.path_history.append((int(robot.x), int(robot.y)))
+        if profiler is not None:
+            profiler.lap('tick.total', start)
+    
+    def update(self):
+        """Simülasyonu günceller (step() ile aynı, GUI döngüsü için)"""
+        self.step()
+    
+    def run(self, ticks: int) -> dict:
+        """Simülasyonu verilen tik sayısı kadar çalıştırır ve durumu döndürür"""
+        for _ in range(ticks):
+            self.step()
+        return self.get_status()
+    
+    def get_status(self) -> dict:
+        """Robot durumu ve simülasyon istatistiklerini döndürür"""
+        status = self.robot.get_status()
+        status['time'] = self.simulation_time
+        status['total_tiles'] = self.total_tiles
+        status['efficiency'] = self.cleaned_area.coverage()
+        return status
+    
+    def get_fleet_status(self) -> dict:
+        """Filo genelindeki istatistikleri döndürür"""
+        state_counts = {}
+        for robot in self.robots:
+            state_counts[robot.state.value] = state_counts.get(robot.state.value, 0) + 1
+        
+        return {
+            'robot_count': len(self.robots),
+            'states': state_counts,
+            'mean_battery': sum(robot.battery for robot in self.robots) / len(self.robots),
+            'min_battery': min(robot.battery for robot in self.robots),
+            'cleaned_tiles': self.cleaned_area.cleaned_count,
+            'robot_contacts': sum(robot.robot_contacts for robot in self.robots),
+            'time': self.simulation_time,
+            'total_tiles': self.total_tiles,
+            'efficiency': self.cleaned_area.coverage()
+        }
+    
+    def get_floor_status(self) -> Dict[str, int]:
+        """Parça ve pencere istatistikleri (bellek kullanımı zemin boyutuyla değil kullanılan bölgeyle büyür)"""
+        return {
+            'floor_cells': self.floor_width * self.floor_height,
+            'chunks': self.grid.chunks_x * self.grid.chunks_y,
+            'grid_chunks': self.grid.materialized,
+            'grid_bytes': self.grid.nbytes,
+            'chunks_generated': self.grid.generated,
+            'coverage_chunks': self.cleaned_area.materialized,
+            'coverage_bytes': self.cleaned_area.materialized * self.chunk_size ** 2,
+            'window_moves': sum(window.moves for window in self.windows),
+        }
@@ -5,21 +5,96 @@ Bu simülasyon robot süpürgelerin karar verme mekanizmalarını gösterir.
 Robot rastgele oluşturulan odalarda otonom olarak hareket eder ve temizlik yapar.
 """
 
-import pygame
+import argparse
 import sys
-from robot_vacuum import RobotVacuum
+from typing import Optional, Tuple
+from robot_vacuum import LidarMode, RobotVacuum
 from room_generator import RoomGenerator
+from room_corpus import RoomCorpus
 from simulation import Simulation
 
-def main():
-    """Ana simülasyon döngüsü"""
+# Ekran boyutları
+SCREEN_WIDTH = 1200
+SCREEN_HEIGHT = 800
+FPS = 60
+
+def run_headless(ticks: int, robot_count: int = 1, lidar_mode: LidarMode = LidarMode.FULL,
+                 seed: Optional[int] = None, record_path: Optional[str] = None,
+                 telemetry_dir: Optional[str] = None, telemetry_lidar_every: int = 0,
+                 profile_path: Optional[str] = None, floor_size: Optional[Tuple[int, int]] = None,
+                 corpus: Optional[RoomCorpus] = None, room_index: int = 0):
+    """Simülasyonu pencere açmadan, kare hızı sınırı olmadan çalıştırır"""
+    if floor_size is None:
+        simulation = Simulation(SCREEN_WIDTH, SCREEN_HEIGHT, robot_count, lidar_mode, seed,
+                                corpus, room_index)
+    else:
+        from large_floor import LargeFloorSimulation
+        simulation = LargeFloorSimulation(*floor_size, robot_count, lidar_mode, seed)
+    profiler = simulation.enable_profiling() if profile_path is not None else None
+    
+    # Her tikten sonra çağrılan kaydediciler (tekrar oynatma kaydı, telemetri)
+    writers = []
+    if record_path is not None:
+        from replay import ReplayRecorder
+        writers.append(ReplayRecorder(record_path, simulation))
+    if telemetry_dir is not None:
+        from telemetry import TelemetryWriter
+        writers.append(TelemetryWriter(telemetry_dir, simulation, telemetry_lidar_every))
+    
+    if not writers:
+        status = simulation.run(ticks)
+    else:
+        try:
+            for _ in range(ticks):
+                simulation.step()
+                for writer in writers:
+                    writer.record()
+        finally:
+            for writer in writers:
+                writer.close()
+        status = simulation.get_status()
+    
+    print(f"Seed: {simulation.seed}")
+    if corpus is not None:
+        print(f"Room: {room_index} of {len(corpus)} ({corpus.path})")
+    print(f"Ticks: {status['time']}")
+    if robot_count > 1:
+        fleet = simulation.get_fleet_status()
+        print(f"Robots: {fleet['robot_count']} {fleet['states']}")
+        print(f"Battery: {fleet['mean_battery']:.1f}% mean, {fleet['min_battery']:.1f}% min")
+        print(f"Robot contacts avoided: {fleet['robot_contacts']}")
+    else:
+        print(f"Mode: {status['state']}")
+        print(f"Battery: {status['battery']:.1f}%")
+    print(f"Cleaned: {status['cleaned_tiles']} tiles")
+    print(f"Efficiency: {status['efficiency']:.1f}%")
+    if floor_size is not None:
+        floor = simulation.get_floor_status()
+        print(f"Floor: {floor_size[0]}x{floor_size[1]} cells, "
+              f"{floor['grid_chunks']}/{floor['chunks']} chunks in memory ({floor['grid_bytes'] // 1024} KiB), "
+              f"{floor['coverage_chunks']} coverage chunks, {floor['window_moves']} window moves")
+    if profiler is not None:
+        # Aşama süreleri (son profiler.window tikin yüzdelikleri ve toplam süre)
+        for line in profiler.report():
+            print(line)
+        profiler.save(profile_path)
+
+def main(robot_count: int = 1, lidar_mode: LidarMode = LidarMode.FULL,
+         seed: Optional[int] = None, replay_path: Optional[str] = None,
+         floor_size: Optional[Tuple[int, int]] = None, corpus: Optional[RoomCorpus] = None,
+         room_index: int = 0, worker: bool = False):
+    """
+    Ana simülasyon döngüsü (replay_path verilirse kayıt oynatılır, floor_size verilirse
+    büyük zemin, worker verilirse simülasyon ayrı bir süreçte çalışır)
+    """
+    # pygame sadece GUI modunda gereklidir
+    import pygame
+    from renderer import SimulationRenderer
+    from timestep import FixedTimestep
+    
     # Pygame'i başlat
     pygame.init()
     
-    # Ekran boyutları
-    SCREEN_WIDTH = 1200
-    SCREEN_HEIGHT = 800
-    
     # Ekranı oluştur
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("Robot Vacuum Simulator - Otonom Temizlik")
@@ -28,45 +103,152 @@ def main():
     clock = pygame.time.Clock()
     
     # Simülasyonu başlat
-    simulation = Simulation(SCREEN_WIDTH, SCREEN_HEIGHT)
+    if floor_size is not None:
+        # Büyük zemin: parçalı zemin, kaydırılıp yakınlaştırılabilen görünüm
+        from large_floor import LargeFloorSimulation
+        simulation = LargeFloorSimulation(*floor_size, robot_count, lidar_mode, seed)
+    elif worker:
+        # Tikler işçi süreçte çalışır; bu süreç paylaşılan bellekteki son görüntüyü çizer
+        from sim_worker import WorkerSimulation
+        simulation = WorkerSimulation(SCREEN_WIDTH, SCREEN_HEIGHT, robot_count, lidar_mode, seed,
+                                      corpus, room_index, tick_rate=FPS)
+    elif replay_path is None:
+        # Derlem verildiyse SPACE derlemin bir sonraki odasını yükler
+        simulation = Simulation(SCREEN_WIDTH, SCREEN_HEIGHT, robot_count, lidar_mode, seed,
+                                corpus, room_index)
+    else:
+        # Kayıttan oynatma: robot kararları çalıştırılmaz, kayıttaki durumlar çizilir
+        from replay import ReplayReader, ReplaySimulation
+        simulation = ReplaySimulation(ReplayReader(replay_path))
+    # Simülasyon tikleri kare hızından bağımsız, sabit adımlarla ilerler
+    if worker:
+        from sim_worker import WorkerTimestep
+        timestep = WorkerTimestep(simulation)
+    else:
+        timestep = FixedTimestep(simulation, tick_rate=FPS)
+    if floor_size is not None:
+        from floor_renderer import FloorRenderer
+        renderer = FloorRenderer(simulation, timestep, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    else:
+        renderer = SimulationRenderer(simulation, timestep)
+    speed_keys = {pygame.K_1: 0, pygame.K_2: 1, pygame.K_3: 2, pygame.K_4: 3}
     
     # Ana döngü
     running = True
+    frame_time = 1 / FPS
     while running:
         # Olayları kontrol et
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 running = False
+            elif floor_size is not None and renderer.handle_event(event):
+                # Büyük zeminde kamera kontrolleri (kaydırma, yakınlaştırma, takip)
+                continue
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                # Pencere içeriği kaybolduysa tamamını yeniden çiz
+                renderer.invalidate()
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_SPACE:
                     # Boşluk tuşu ile yeni oda oluştur
                     simulation.generate_new_room()
                 elif event.key == pygame.K_r:
                     # R tuşu ile robotu sıfırla
                     simulation.reset_robot()
+                elif event.key in speed_keys:
+                    # 1-4 tuşları ile hız çarpanı seç (1x, 10x, 100x, MAX)
+                    timestep.set_speed(speed_keys[event.key])
+                elif event.key in (pygame.K_PLUS, pygame.K_EQUALS, pygame.K_KP_PLUS):
+                    timestep.faster()
+                elif event.key in (pygame.K_MINUS, pygame.K_KP_MINUS):
+                    timestep.slower()
+                elif floor_size is not None:
+                    continue
+                elif event.key == pygame.K_m:
+                    # M tuşu ile robotun doluluk haritasını göster/gizle
+                    renderer.toggle_occupancy()
+                elif event.key == pygame.K_p:
+                    # P tuşu ile tik ve çizim aşamalarının sürelerini göster/gizle
+                    renderer.toggle_profile()
         
-        # Simülasyonu güncelle
-        simulation.update()
-        
-        # Ekranı temizle
-        screen.fill((240, 240, 240))  # Açık gri arka plan
+        # Simülasyonu geçen süre ve hız çarpanı kadar ilerlet
+        timestep.advance(frame_time)
         
-        # Simülasyonu çiz
-        simulation.draw(screen)
-        
-        # Kontrol bilgilerini göster
-        font = pygame.font.Font(None, 36)
-        text1 = font.render("SPACE: Yeni Oda | R: Robot Sıfırla", True, (50, 50, 50))
-        text2 = font.render("Robot Otonom Hareket Ediyor", True, (50, 50, 50))
-        screen.blit(text1, (10, 10))
-        screen.blit(text2, (10, 45))
+        # Simülasyonu çiz; sadece değişen bölgeler ekrana aktarılır
+        dirty_rects = renderer.draw(screen)
         
         # Ekranı güncelle
-        pygame.display.flip()
-        clock.tick(60)  # 60 FPS
+        pygame.display.update(dirty_rects)
+        frame_time = clock.tick(FPS) / 1000  # 60 FPS
     
+    if worker:
+        simulation.close()
     pygame.quit()
     sys.exit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Robot Vacuum Simulator")
+    parser.add_argument("--headless", action="store_true",
+                        help="pygame olmadan, kare hızı sınırı olmadan çalıştır")
+    parser.add_argument("--ticks", type=int, default=3600,
+                        help="headless modda çalıştırılacak tik sayısı")
+    parser.add_argument("--robots", type=int, default=1,
+                        help="aynı odayı paylaşan robot sayısı (filo modu)")
+    parser.add_argument("--lidar-mode", choices=[mode.value for mode in LidarMode],
+                        default=LidarMode.FULL.value,
+                        help="LiDAR tarama modu (büyük filolarda 'sweep' veya 'off' daha hızlıdır)")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="rastgele sayı tohumu (aynı seed aynı odaları ve robot kararlarını üretir)")
+    parser.add_argument("--record", metavar="PATH", default=None,
+                        help="headless modda tik başına robot durumlarını ikili kayıt dosyasına yaz")
+    parser.add_argument("--replay", metavar="PATH", default=None,
+                        help="kayıt dosyasını simülasyonu yeniden çalıştırmadan oynat")
+    parser.add_argument("--telemetry", metavar="DIR", default=None,
+                        help="headless modda tik başına durumu sütun bazlı telemetri dizinine yaz")
+    parser.add_argument("--telemetry-lidar-every", type=int, default=0, metavar="N",
+                        help="telemetriye her N tikte bir LiDAR görüntüsü ekle (0: ekleme)")
+    parser.add_argument("--profile", metavar="PATH", default=None,
+                        help="headless modda tik aşamalarının sürelerini (p50/p99) ölç ve JSON dosyasına yaz")
+    parser.add_argument("--floor", metavar="WxH", default=None,
+                        help="parçalı büyük zemin (ör. 5000x5000 hücre); kaydırma ve yakınlaştırma ile gösterilir")
+    parser.add_argument("--corpus", metavar="PATH", default=None,
+                        help="odaları üretmek yerine room_corpus.py ile oluşturulmuş derlemden yükle")
+    parser.add_argument("--room", type=int, default=0, metavar="K",
+                        help="derlemden yüklenecek ilk oda")
+    parser.add_argument("--worker", action="store_true",
+                        help="simülasyonu ayrı bir süreçte çalıştır; pencere paylaşılan bellekteki son durumu çizer")
+    args = parser.parse_args()
+    lidar_mode = LidarMode(args.lidar_mode)
+    corpus = None
+    if args.corpus is not None:
+        if args.floor or args.replay:
+            parser.error("--corpus, --floor/--replay ile birlikte kullanılamaz")
+        try:
+            corpus = RoomCorpus(args.corpus)
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+        if (corpus.width, corpus.height) != (SCREEN_WIDTH - 200, SCREEN_HEIGHT - 100):
+            parser.error(f"derlem odaları {corpus.width}x{corpus.height}, pencerenin simülasyon alanı "
+                         f"{SCREEN_WIDTH - 200}x{SCREEN_HEIGHT - 100}")
+        if not 0 <= args.room < len(corpus):
+            parser.error(f"--room 0 ile {len(corpus) - 1} arasında olmalı")
+    if args.worker and (args.headless or args.floor or args.replay):
+        parser.error("--worker, --headless/--floor/--replay ile birlikte kullanılamaz")
+    floor_size = None
+    if args.floor is not None:
+        try:
+            floor_size = tuple(int(value) for value in args.floor.lower().split("x"))
+        except ValueError:
+            floor_size = ()
+        if len(floor_size) != 2 or min(floor_size) < 16:
+            parser.error("--floor WxH biçiminde olmalı (ör. 5000x5000, kenar en az 16 hücre)")
+        if args.record or args.replay or args.telemetry:
+            parser.error("--floor, --record/--replay/--telemetry ile birlikte kullanılamaz")
+    
+    if args.headless:
+        run_headless(args.ticks, args.robots, lidar_mode, args.seed, args.record,
+                     args.telemetry, args.telemetry_lidar_every, args.profile, floor_size,
+                     corpus, args.room)
+    else:
+        main(args.robots, lidar_mode, args.seed, args.replay, floor_size, corpus, args.room, args.worker)
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+Doluluk Haritası Modülü
+=======================
+LiDAR taramalarından oda grid'i ile hizalı bir log-odds doluluk haritası
+oluşturur. Her hücre log(p / (1 - p)) değerini tutar: 0 bilinmiyor,
+pozitif dolu, negatif boş demektir.
+
+Bir taramadaki tüm ışınlar tek bir toplu NumPy işlemiyle işlenir: ışın
+boyunca çarpma noktasından önceki örnek noktaların düştüğü hücreler boş,
+çarpma noktasının hücresi dolu olarak güncellenir. Her hücre bir taramada
+en fazla bir kez güncellenir (aynı hücreye düşen çok sayıda ışın güveni
+şişirmez). Hücre başına Python döngüsü yoktur.
+"""
+
+from typing import Iterable, Optional, Tuple
+import numpy as np
+
+class OccupancyGrid:
+    def __init__(self, grid_width: int, grid_height: int, grid_size: int,
+                 hit_log_odds: float = 0.85, miss_log_odds: float = -0.4,
+                 min_log_odds: float = -4.0, max_log_odds: float = 4.0,
+                 occupied_log_odds: float = 0.4):
+        """
+        Doluluk haritası sınıfı
+        
+        Args:
+            grid_width, grid_height: Harita boyutu (hücre, oda grid'i ile aynı)
+            grid_size: Hücre boyutu (piksel)
+            hit_log_odds: Çarpma hücresine eklenen log-odds
+            miss_log_odds: Işının geçtiği boş hücrelere eklenen log-odds
+            min_log_odds, max_log_odds: Değerlerin sınırları (harita değişime açık kalsın)
+            occupied_log_odds: Bu değerin üstündeki hücreler dolu sayılır
+        """
+        self.grid_width = grid_width
+        self.grid_height = grid_height
+        self.grid_size = grid_size
+        self.hit_log_odds = hit_log_odds
+        self.miss_log_odds = miss_log_odds
+        self.min_log_odds = min_log_odds
+        self.max_log_odds = max_log_odds
+        self.occupied_log_odds = occupied_log_odds
+        # Işın boyunca boş alan örnekleri arası mesafe (yarım hücre)
+        self.sample_step = grid_size / 2
+        self._offsets = None  # Son kullanılan yön dizileri için örnek konumları
+        # Güncelleme kodu -> log-odds değişimi
+        self._update_table = np.array([0.0, miss_log_odds, hit_log_odds], dtype=np.float32)
+        
+        self.log_odds = np.zeros((grid_height, grid_width), dtype=np.float32)
+        self._flat = self.log_odds.reshape(-1)
+        # Her güncellemede artar; çizim gibi önbellekler bunu izler
+        self.version = 0
+    
+    def reset(self):
+        """Haritayı tamamen bilinmeyen duruma döndürür"""
+        self.log_odds.fill(0)
+        self.version += 1
+    
+    def _ray_offsets(self, dir_x: np.ndarray, dir_y: np.ndarray,
+                     max_range: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Işın boyunca boş alan örneklerinin tarama konumuna göre hücre cinsinden konumları
+        
+        Aynı yön dizileriyle (ör. robotun tam tur yön tablosu) yapılan
+        taramalar için bir kez hesaplanır.
+        """
+        cached = self._offsets
+        if cached is not None and cached[0] is dir_x and cached[1] is dir_y and cached[2] == max_range:
+            return cached[3:]
+        samples = np.arange(0.0, max_range, self.sample_step)
+        offset_x = dir_x[:, None] * (samples / self.grid_size)
+        offset_y = dir_y[:, None] * (samples / self.grid_size)
+        self._offsets = (dir_x, dir_y, max_range, samples, offset_x, offset_y)
+        return samples, offset_x, offset_y
+    
+    def _cell_indices(self, cell_x: np.ndarray, cell_y: np.ndarray, valid: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Hücre cinsinden konumlardan harita içindekilerin düz hücre indeksleri
+        
+        -1'den büyük değerlerde +1 kaydırıp kesmek floor ile aynıdır; daha
+        küçük değerler zaten harita dışıdır. Negatifler işaretsiz görünümde
+        çok büyük sayılar olduğundan sınır kontrolü tek karşılaştırmadır.
+        """
+        cell_x = (cell_x + 1).astype(np.intp) - 1
+        cell_y = (cell_y + 1).astype(np.intp) - 1
+        inside = (cell_x.view(np.uintp) < self.grid_width) & (cell_y.view(np.uintp) < self.grid_height)
+        if valid is not None:
+            inside &= valid
+        return cell_y[inside] * self.grid_width + cell_x[inside]
+    
+    def integrate(self, x, y, dir_x: np.ndarray, dir_y: np.ndarray,
+                  distances: np.ndarray, max_range: float):
+        """
+        Bir LiDAR taramasını haritaya işler
+        
+        Sabit maliyet ışın sayısına göre baskın olduğundan az ışınlı
+        taramalar biriktirilip tek çağrıda işlenmelidir; bunun için konum
+        ışın başına dizi olarak verilebilir.
+        
+        Args:
+            x, y: Tarama konumu (oda koordinatları, piksel); tek değer veya ışın başına dizi
+            dir_x, dir_y: Işın yön vektörleri
+            distances: Ölçülen mesafeler (max_range: çarpma yok)
+            max_range: LiDAR menzili
+        """
+        samples, offset_x, offset_y = self._ray_offsets(dir_x, dir_y, max_range)
+        origin_x = np.asarray(x, dtype=np.float64) / self.grid_size
+        origin_y = np.asarray(y, dtype=np.float64) / self.grid_size
+        per_ray = origin_x.ndim == 1
+        
+        # Boş alan: her ışının çarpma noktasından önceki örnekleri
+        before_hit = samples < distances[:, None] - 1e-6
+        if per_ray:
+            free = self._cell_indices(origin_x[:, None] + offset_x, origin_y[:, None] + offset_y, before_hit)
+        else:
+            free = self._cell_indices(origin_x + offset_x, origin_y + offset_y, before_hit)
+        
+        # Çarpmalar: ışın çarpılan hücrenin sınırında durur; sınırın çok az
+        # ötesi o hücrenin içindedir (yarım piksel gibi büyük bir pay köşeye
+        # teğet ışınlarda komşu boş hücreye taşabilir)
+        hits = distances < max_range
+        reach = (distances[hits] + 1e-3) / self.grid_size
+        if per_ray:
+            origin_x = origin_x[hits]
+            origin_y = origin_y[hits]
+        occupied = self._cell_indices(origin_x + dir_x[hits] * reach, origin_y + dir_y[hits] * reach)
+        
+        # Hücre başına tek güncelleme kodu (0: yok, 1: boş, 2: dolu); dolu boşu ezer
+        updates = np.zeros(self._flat.size, dtype=np.intp)
+        updates[free] = 1
+        updates[occupied] = 2
+        flat = self._flat
+        flat += self._update_table[updates]
+        np.clip(flat, self.min_log_odds, self.max_log_odds, out=flat)
+        self.version += 1
+    
+    def mark_occupied(self, cells: Iterable[Tuple[int, int]]):
+        """Kesin dolu bilinen hücreleri (ör. çarpılan hücre) en yüksek değere çeker"""
+        changed = False
+        for cell_x, cell_y in cells:
+            if 0 <= cell_x < self.grid_width and 0 <= cell_y < self.grid_height:
+                self.log_odds[cell_y, cell_x] = self.max_log_odds
+                changed = True
+        if changed:
+            self.version += 1
+    
+    def probability(self) -> np.ndarray:
+        """Hücre başına doluluk olasılığı (0.5: bilinmiyor)"""
+        return 1.0 / (1.0 + np.exp(-self.log_odds))
+    
+    def occupied(self) -> np.ndarray:
+        """Dolu sayılan hücreler, [y, x] boolean dizi"""
+        return self.log_odds > self.occupied_log_odds
+    
+    def known(self) -> np.ndarray:
+        """En az bir kez gözlenmiş hücreler, [y, x] boolean dizi"""
+        return self.log_odds != 0
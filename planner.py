@@ -0,0 +1,269 @@
+"""
+Yol Planlayıcı Modülü
+=====================
+Oda grid'i üzerinde artımlı yol planlama (D* Lite, Koenig & Likhachev 2002).
+Arama hedeften başlangıca doğru yapılır; robot ilerledikçe başlangıç
+değişir, LiDAR yeni engeller gösterdikçe sadece etkilenen hücreler
+güncellenir ve önceki aramanın sonuçları yeniden kullanılır. Böylece
+yeniden planlama, A*'ın baştan çalıştırılmasına göre çok daha az hücre
+genişletir.
+
+Grid 8-bağlantılıdır (düz adım 1, çapraz adım √2); çapraz adımlar engel
+köşesinden geçemez. Hücreler (x, y) grid koordinatlarıyla verilir.
+Karşılaştırma için aynı maliyetlerle çalışan astar() fonksiyonu da vardır.
+"""
+
+import heapq
+import math
+from typing import Iterable, List, Optional, Tuple
+
+INF = math.inf
+SQRT2 = math.sqrt(2)
+
+# (dx, dy, maliyet) komşu adımları
+NEIGHBOR_STEPS = (
+    (1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+    (1, 1, SQRT2), (1, -1, SQRT2), (-1, 1, SQRT2), (-1, -1, SQRT2),
+)
+
+def octile_distance(x0: int, y0: int, x1: int, y1: int) -> float:
+    """8-bağlantılı grid'de engelsiz en kısa yol uzunluğu (tutarlı sezgisel)"""
+    dx = abs(x1 - x0)
+    dy = abs(y1 - y0)
+    return max(dx, dy) + (SQRT2 - 1) * min(dx, dy)
+
+def _neighbors(blocked: bytearray, width: int, height: int, index: int):
+    """Geçilebilir komşular ve adım maliyetleri (engel hücrelerinin kenarları sonsuz)"""
+    y, x = divmod(index, width)
+    for dx, dy, cost in NEIGHBOR_STEPS:
+        nx = x + dx
+        ny = y + dy
+        if not (0 <= nx < width and 0 <= ny < height):
+            continue
+        neighbor = ny * width + nx
+        if blocked[neighbor]:
+            continue
+        # Çapraz adımda iki yan hücre de boş olmalı (köşe kesme yok)
+        if dx and dy and (blocked[y * width + nx] or blocked[ny * width + x]):
+            continue
+        yield neighbor, cost
+
+class DStarLite:
+    def __init__(self, width: int, height: int, start: Tuple[int, int], goal: Tuple[int, int],
+                 blocked: Optional[bytearray] = None):
+        """
+        D* Lite planlayıcı sınıfı
+        
+        Args:
+            width, height: Grid boyutu (hücre)
+            start: Başlangıç hücresi (x, y)
+            goal: Hedef hücresi (x, y)
+            blocked: Satır sıralı engel haritası (1=engel); verilmezse tamamı boş.
+                     Planlayıcı bu diziyi paylaşır, set_blocked onu da günceller.
+        """
+        self.width = width
+        self.height = height
+        self.blocked = blocked if blocked is not None else bytearray(width * height)
+        self.goal = goal[1] * width + goal[0]
+        self.start = start[1] * width + start[0]
+        self._last_start = self.start
+        self.km = 0.0
+        self.expansions = 0  # Toplam genişletilen hücre sayısı (ölçüm için)
+        
+        self.g = [INF] * (width * height)
+        self.rhs = [INF] * (width * height)
+        self.rhs[self.goal] = 0.0
+        # Öncelik kuyruğu: (k1, k2, hücre); güncelliğini yitiren girdiler _queued ile ayıklanır
+        self._queue: List[Tuple[float, float, int]] = []
+        self._queued = {}
+        self._push(self.goal)
+    
+    def _heuristic(self, a: int, b: int) -> float:
+        """İki hücre arası octile mesafe"""
+        ay, ax = divmod(a, self.width)
+        by, bx = divmod(b, self.width)
+        return octile_distance(ax, ay, bx, by)
+    
+    def _key(self, cell: int) -> Tuple[float, float]:
+        """Hücrenin öncelik anahtarı"""
+        best = min(self.g[cell], self.rhs[cell])
+        return (best + self._heuristic(self.start, cell) + self.km, best)
+    
+    def _push(self, cell: int):
+        """Hücreyi güncel anahtarıyla kuyruğa ekler"""
+        key = self._key(cell)
+        self._queued[cell] = key
+        heapq.heappush(self._queue, (key[0], key[1], cell))
+    
+    def _top(self) -> Tuple[Tuple[float, float], int]:
+        """Kuyruktaki en küçük güncel anahtar ve hücresi (kuyruk boşsa sonsuz)"""
+        queue = self._queue
+        while queue:
+            k1, k2, cell = queue[0]
+            if self._queued.get(cell) == (k1, k2):
+                return (k1, k2), cell
+            heapq.heappop(queue)  # Eski girdi
+        return (INF, INF), -1
+    
+    def _update_vertex(self, cell: int):
+        """Hücrenin rhs değerini komşularından yeniden hesaplar ve kuyruk durumunu düzeltir"""
+        if cell != self.goal:
+            best = INF
+            if not self.blocked[cell]:
+                g = self.g
+                for neighbor, cost in _neighbors(self.blocked, self.width, self.height, cell):
+                    value = cost + g[neighbor]
+                    if value < best:
+                        best = value
+            self.rhs[cell] = best
+        self._queued.pop(cell, None)
+        if self.g[cell] != self.rhs[cell]:
+            self._push(cell)
+    
+    def _predecessors(self, cell: int) -> Iterable[int]:
+        """Hücreye kenarı olan komşular (grid yönsüz olduğu için komşularla aynı)"""
+        if self.blocked[cell]:
+            return ()
+        return [neighbor for neighbor, _ in _neighbors(self.blocked, self.width, self.height, cell)]
+    
+    def plan(self) -> bool:
+        """
+        En kısa yolu hesaplar veya değişikliklerden sonra onarır
+        
+        Returns:
+            Başlangıçtan hedefe bir yol varsa True
+        """
+        g = self.g
+        rhs = self.rhs
+        while True:
+            top_key, cell = self._top()
+            start_key = self._key(self.start)
+            if not (top_key < start_key or rhs[self.start] != g[self.start]):
+                break
+            heapq.heappop(self._queue)
+            del self._queued[cell]
+            self.expansions += 1
+            
+            new_key = self._key(cell)
+            if top_key < new_key:
+                # Anahtar km değiştiği için eskidi; güncel anahtarla geri koy
+                self._push(cell)
+            elif g[cell] > rhs[cell]:
+                g[cell] = rhs[cell]
+                for neighbor in self._predecessors(cell):
+                    self._update_vertex(neighbor)
+            else:
+                g[cell] = INF
+                for neighbor in self._predecessors(cell):
+                    self._update_vertex(neighbor)
+                self._update_vertex(cell)
+        return g[self.start] < INF
+    
+    def move_start(self, cell: Tuple[int, int]):
+        """Robotun bulunduğu hücreyi yeni başlangıç yapar"""
+        self.start = cell[1] * self.width + cell[0]
+        self.km += self._heuristic(self._last_start, self.start)
+        self._last_start = self.start
+    
+    def set_blocked(self, cells: Iterable[Tuple[int, int]], blocked: bool = True) -> int:
+        """
+        Hücrelerin engel durumunu değiştirir; sonraki plan() yolu onarır
+        
+        Returns:
+            Durumu gerçekten değişen hücre sayısı
+        """
+        width = self.width
+        changed = []
+        for x, y in cells:
+            if 0 <= x < width and 0 <= y < self.height:
+                index = y * width + x
+                if bool(self.blocked[index]) != blocked:
+                    self.blocked[index] = 1 if blocked else 0
+                    changed.append(index)
+        for index in changed:
+            # Hücrenin ve (köşe kesme kuralı nedeniyle) tüm 8 komşusunun kenarları değişti
+            y, x = divmod(index, width)
+            for dy in (-1, 0, 1):
+                for dx in (-1, 0, 1):
+                    nx = x + dx
+                    ny = y + dy
+                    if 0 <= nx < width and 0 <= ny < self.height:
+                        self._update_vertex(ny * width + nx)
+        return len(changed)
+    
+    @property
+    def cost(self) -> float:
+        """Başlangıçtan hedefe yol uzunluğu (hücre; yol yoksa sonsuz)"""
+        return self.g[self.start]
+    
+    def next_cell(self, cell: Optional[Tuple[int, int]] = None) -> Optional[Tuple[int, int]]:
+        """
+        Verilen hücreden (varsayılan: başlangıç) yol üzerindeki bir sonraki hücre
+        
+        Returns:
+            Sonraki hücre; hedefteyse veya yol yoksa None
+        """
+        index = self.start if cell is None else cell[1] * self.width + cell[0]
+        if index == self.goal:
+            return None
+        best = INF
+        best_neighbor = -1
+        for neighbor, cost in _neighbors(self.blocked, self.width, self.height, index):
+            value = cost + self.g[neighbor]
+            if value < best:
+                best = value
+                best_neighbor = neighbor
+        if best_neighbor < 0 or best == INF:
+            return None
+        y, x = divmod(best_neighbor, self.width)
+        return (x, y)
+    
+    def path(self, max_length: Optional[int] = None) -> List[Tuple[int, int]]:
+        """Başlangıçtan hedefe hücre listesi (yol yoksa sadece başlangıç)"""
+        y, x = divmod(self.start, self.width)
+        cells = [(x, y)]
+        limit = max_length if max_length is not None else self.width * self.height
+        while len(cells) < limit:
+            cell = self.next_cell(cells[-1])
+            if cell is None:
+                break
+            cells.append(cell)
+        return cells
+
+def astar(blocked: bytearray, width: int, height: int, start: Tuple[int, int],
+          goal: Tuple[int, int]) -> Tuple[List[Tuple[int, int]], int]:
+    """
+    Baştan A* araması (DStarLite ile aynı bağlantı ve maliyetler)
+    
+    Returns:
+        (başlangıçtan hedefe hücre listesi veya boş liste, genişletilen hücre sayısı)
+    """
+    start_index = start[1] * width + start[0]
+    goal_index = goal[1] * width + goal[0]
+    goal_x, goal_y = goal
+    g = {start_index: 0.0}
+    parent = {start_index: -1}
+    closed = bytearray(width * height)
+    queue = [(octile_distance(start[0], start[1], goal_x, goal_y), 0.0, start_index)]
+    expansions = 0
+    while queue:
+        _, cost, cell = heapq.heappop(queue)
+        if closed[cell]:
+            continue
+        closed[cell] = 1
+        expansions += 1
+        if cell == goal_index:
+            path = []
+            while cell >= 0:
+                y, x = divmod(cell, width)
+                path.append((x, y))
+                cell = parent[cell]
+            return path[::-1], expansions
+        for neighbor, step in _neighbors(blocked, width, height, cell):
+            new_cost = cost + step
+            if new_cost < g.get(neighbor, INF):
+                g[neighbor] = new_cost
+                parent[neighbor] = cell
+                y, x = divmod(neighbor, width)
+                heapq.heappush(queue, (new_cost + octile_distance(x, y, goal_x, goal_y), new_cost, neighbor))
+    return [], expansions
@@ -0,0 +1,134 @@
+"""
+Aşama Profilleyici Modülü
+=========================
+Simülasyon tikinin ve çizimin aşamalarını (sıkışma kontrolü, davranış,
+hareket, LiDAR, temizlik; oda, robotlar, radar, arayüz) ölçen, isteğe
+bağlı düşük maliyetli zamanlayıcı.
+
+Her aşamanın son `window` süresi sabit boyutlu bir halka tamponda tutulur;
+p50/p99 gibi yüzdelikler sadece istendiğinde bu pencereden hesaplanır.
+Kayıt yolu tek bir perf_counter çağrısı ve dizi ataması kadardır.
+Profilleyici bağlı değilken ölçülen kod aşama başına yalnızca bir
+`if` kontrolü öder:
+    
+    profiler = self.profiler
+    start = profiler.clock() if profiler is not None else 0.0
+    ...
+    if profiler is not None:
+        start = profiler.lap('tick.move', start)
+"""
+
+import json
+from array import array
+from time import perf_counter
+from typing import Dict, List, Optional
+import numpy as np
+
+class PhaseTimer:
+    def __init__(self, window: int):
+        """
+        Tek bir aşamanın son window süresini tutan halka tampon
+        
+        Args:
+            window: Yüzdeliklerin hesaplandığı en son ölçüm sayısı
+        """
+        self.window = window
+        self._samples = array('d', bytes(8 * window))
+        self._index = 0
+        self.count = 0  # Toplam ölçüm sayısı (pencereden taşanlar dahil)
+        self.total = 0.0  # Toplam süre (saniye)
+    
+    def add(self, seconds: float):
+        """Bir ölçüm ekler; pencere doluysa en eskisinin üzerine yazılır"""
+        self._samples[self._index] = seconds
+        self._index += 1
+        if self._index == self.window:
+            self._index = 0
+        self.count += 1
+        self.total += seconds
+    
+    def samples(self) -> np.ndarray:
+        """Penceredeki ölçümler (saniye, sırasız)"""
+        return np.frombuffer(self._samples, dtype=np.float64)[:min(self.count, self.window)]
+    
+    def stats(self) -> dict:
+        """
+        Penceredeki ölçümlerin özeti
+        
+        Returns:
+            count, mean_us, p50_us, p99_us, max_us ve toplam süre (total_s)
+        """
+        samples = self.samples()
+        if samples.size == 0:
+            return {'count': self.count, 'mean_us': 0.0, 'p50_us': 0.0, 'p99_us': 0.0,
+                    'max_us': 0.0, 'total_s': self.total}
+        p50, p99 = np.percentile(samples, (50, 99))
+        return {
+            'count': self.count,
+            'mean_us': float(samples.mean()) * 1e6,
+            'p50_us': float(p50) * 1e6,
+            'p99_us': float(p99) * 1e6,
+            'max_us': float(samples.max()) * 1e6,
+            'total_s': self.total,
+        }
+
+class PhaseProfiler:
+    def __init__(self, window: int = 1024):
+        """
+        Aşama profilleyici sınıfı
+        
+        Args:
+            window: Her aşama için yüzdeliklerin hesaplandığı son ölçüm sayısı
+        """
+        self.window = window
+        self.timers: Dict[str, PhaseTimer] = {}
+        self.clock = perf_counter
+    
+    def timer(self, phase: str) -> PhaseTimer:
+        """Aşamanın zamanlayıcısı (ilk kullanımda oluşturulur)"""
+        timer = self.timers.get(phase)
+        if timer is None:
+            timer = self.timers[phase] = PhaseTimer(self.window)
+        return timer
+    
+    def record(self, phase: str, seconds: float):
+        """Aşamaya bir süre ekler"""
+        self.timer(phase).add(seconds)
+    
+    def lap(self, phase: str, start: float) -> float:
+        """
+        start'tan bu yana geçen süreyi aşamaya ekler
+        
+        Returns:
+            Şimdiki zaman (bir sonraki aşamanın başlangıcı)
+        """
+        now = perf_counter()
+        self.timer(phase).add(now - start)
+        return now
+    
+    def reset(self):
+        """Tüm ölçümleri siler"""
+        self.timers.clear()
+    
+    def summary(self, prefix: Optional[str] = None) -> Dict[str, dict]:
+        """
+        Aşama başına özet (PhaseTimer.stats), aşama adına göre sıralı
+        
+        Args:
+            prefix: Verilirse sadece bu önekle başlayan aşamalar (ör. 'tick.')
+        """
+        return {phase: timer.stats() for phase, timer in sorted(self.timers.items())
+                if prefix is None or phase.startswith(prefix)}
+    
+    def report(self) -> List[str]:
+        """Özetin yazdırılabilir tablo satırları"""
+        lines = [f"{'phase':<20} {'count':>9} {'p50 us':>9} {'p99 us':>9} {'max us':>9} {'total s':>8}"]
+        for phase, stats in self.summary().items():
+            lines.append(f"{phase:<20} {stats['count']:>9,} {stats['p50_us']:>9.1f} {stats['p99_us']:>9.1f} "
+                         f"{stats['max_us']:>9.1f} {stats['total_s']:>8.2f}")
+        return lines
+    
+    def save(self, path: str):
+        """Özeti JSON dosyasına yazar"""
+        with open(path, 'w') as file:
+            json.dump({'window': self.window, 'phases': self.summary()}, file, indent=2)
@@ -0,0 +1,321 @@
+"""
+Işın İzleme Modülü
+==================
+Oda grid'i üzerinde hücre-kesin ışın izleme (Amanatides & Woo, 1987).
+Işın her grid hücresini tam olarak bir kez ziyaret eder ve ilk dolu
+hücrenin kenarına olan kesin mesafeyi döndürür. cast_rays aynı algoritmayı
+NumPy ile tüm LiDAR ışınlarına birlikte uygular.
+"""
+
+import math
+from typing import List, Optional, Tuple
+import numpy as np
+
+def cast_ray(room_grid: List[List[int]], grid_size: int, x: float, y: float,
+             angle: float, max_distance: float) -> float:
+    """
+    Verilen noktadan verilen açıda ışın gönderir
+    
+    Args:
+        room_grid: Oda grid'i (0=boş, 1=engel, 2=duvar)
+        grid_size: Bir grid hücresinin piksel boyutu
+        x, y: Işının başlangıç noktası (oda koordinatları, offset olmadan)
+        angle: Işın açısı (radyan)
+        max_distance: Maksimum ölçüm mesafesi
+    
+    Returns:
+        İlk engele veya oda sınırına olan mesafe (en fazla max_distance)
+    """
+    grid_height = len(room_grid)
+    grid_width = len(room_grid[0])
+    
+    cell_x = int(x // grid_size)
+    cell_y = int(y // grid_size)
+    
+    # Başlangıç noktası zaten engelin içinde veya oda dışında
+    if not (0 <= cell_x < grid_width and 0 <= cell_y < grid_height):
+        return 0.0
+    if room_grid[cell_y][cell_x] != 0:
+        return 0.0
+    
+    dir_x = math.cos(angle)
+    dir_y = math.sin(angle)
+    
+    # Her eksende bir sonraki hücre sınırına olan mesafe (t_max)
+    # ve bir hücre boyunca ilerlemenin maliyeti (t_delta)
+    if dir_x > 0:
+        step_x = 1
+        t_max_x = ((cell_x + 1) * grid_size - x) / dir_x
+        t_delta_x = grid_size / dir_x
+    elif dir_x < 0:
+        step_x = -1
+        t_max_x = (cell_x * grid_size - x) / dir_x
+        t_delta_x = -grid_size / dir_x
+    else:
+        step_x = 0
+        t_max_x = math.inf
+        t_delta_x = math.inf
+    
+    if dir_y > 0:
+        step_y = 1
+        t_max_y = ((cell_y + 1) * grid_size - y) / dir_y
+        t_delta_y = grid_size / dir_y
+    elif dir_y < 0:
+        step_y = -1
+        t_max_y = (cell_y * grid_size - y) / dir_y
+        t_delta_y = -grid_size / dir_y
+    else:
+        step_y = 0
+        t_max_y = math.inf
+        t_delta_y = math.inf
+    
+    while True:
+        # Hangi eksenin sınırı daha yakınsa o yönde bir hücre ilerle
+        if t_max_x < t_max_y:
+            distance = t_max_x
+            cell_x += step_x
+            t_max_x += t_delta_x
+        else:
+            distance = t_max_y
+            cell_y += step_y
+            t_max_y += t_delta_y
+        
+        if distance >= max_distance:
+            return max_distance
+        
+        if not (0 <= cell_x < grid_width and 0 <= cell_y < grid_height):
+            return distance
+        if room_grid[cell_y][cell_x] != 0:
+            return distance
+
+def lidar_directions(resolution: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    LiDAR ışınları için önceden hesaplanmış yön tablolarını döndürür
+    
+    Args:
+        resolution: Tam tur başına ışın sayısı
+    
+    Returns:
+        (cos, sin) dizileri; i. ışının açısı i / resolution * 2π
+    """
+    angles = np.arange(resolution) * (2 * math.pi / resolution)
+    return np.cos(angles), np.sin(angles)
+
+def pad_cells(cells: np.ndarray) -> np.ndarray:
+    """
+    Grid'in (veya grid yığınının) etrafına tek hücrelik duvar çerçevesi ekler
+    
+    Oda dışı bu çerçeveyle temsil edilir; böylece ışın izleme sırasında
+    her adımda ayrıca sınır kontrolü yapmak gerekmez.
+    """
+    padding = [(0, 0)] * (cells.ndim - 2) + [(1, 1), (1, 1)]
+    return np.pad(cells, padding, constant_values=2)
+
+def cast_rays(cells: np.ndarray, grid_size: int, x: float, y: float,
+              dir_x: np.ndarray, dir_y: np.ndarray, max_distance: float) -> np.ndarray:
+    """
+    Aynı noktadan çok sayıda ışını tek seferde izler (vektörize DDA)
+    
+    Tüm ışınlar aynı anda bir hücre sınırı ilerletilir; döngü ışın başına
+    değil, en uzun ışının geçtiği hücre sayısı kadar döner.
+    
+    Args:
+        cells: Oda grid'i (2D NumPy dizisi, 0=boş)
+        grid_size: Bir grid hücresinin piksel boyutu
+        x, y: Işınların başlangıç noktası (oda koordinatları)
+        dir_x, dir_y: Işın yön vektörleri (birim uzunlukta)
+        max_distance: Maksimum ölçüm mesafesi
+    
+    Returns:
+        Her ışın için ilk engele olan mesafe (float64 dizi)
+    """
+    return cast_rays_padded(pad_cells(cells), grid_size, x, y, dir_x, dir_y, max_distance)
+
+def cast_rays_padded(padded_cells: np.ndarray, grid_size: int, x: float, y: float,
+                     dir_x: np.ndarray, dir_y: np.ndarray, max_distance: float) -> np.ndarray:
+    """
+    cast_rays ile aynı; grid önceden pad_cells ile çerçevelenmiş olarak verilir
+    
+    Aynı odada her tik tarama yapan çağıranlar çerçeveli grid'i bir kez
+    oluşturup saklayarak her çağrıdaki kopyalamadan kaçınır.
+    """
+    padded_height, padded_width = padded_cells.shape
+    cell_x = min(max(int(x // grid_size), -1), padded_width - 2)
+    cell_y = min(max(int(y // grid_size), -1), padded_height - 2)
+    return _traverse(padded_cells.ravel(), padded_width, 0, grid_size,
+                     x, y, cell_x, cell_y, dir_x, dir_y, max_distance)
+
+def cast_rays_batch(padded_cells: np.ndarray, grid_size: int, x: np.ndarray, y: np.ndarray,
+                    dir_x: np.ndarray, dir_y: np.ndarray, max_distance: float,
+                    rooms: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Her biri kendi odasında olan N ışını tek seferde izler
+    
+    Args:
+        padded_cells: pad_cells ile çerçevelenmiş (R, H+2, W+2) grid yığını
+        grid_size: Bir grid hücresinin piksel boyutu
+        x, y: Her ışının başlangıç noktası (N uzunluğunda, oda koordinatları)
+        dir_x, dir_y: Işın yön vektörleri (N uzunluğunda, birim uzunlukta)
+        max_distance: Maksimum ölçüm mesafesi
+        rooms: Işınların yığındaki oda indeksleri (verilmezse i. ışın i. odada);
+               yığın kopyalanmaz, ışınlar düzleştirilmiş yığında oda başlangıcından izlenir
+    
+    Returns:
+        i. ışının kendi odasındaki ilk engele olan mesafesi (float64 dizi)
+    """
+    room_count, padded_height, padded_width = padded_cells.shape
+    if rooms is None:
+        rooms = np.arange(room_count)
+    room_offsets = rooms * (padded_height * padded_width)
+    # Oda dışındaki başlangıç noktaları çerçeveye sıkıştırılır (engel sayılır)
+    cell_x = np.clip(np.floor(x / grid_size), -1, padded_width - 2).astype(np.intp)
+    cell_y = np.clip(np.floor(y / grid_size), -1, padded_height - 2).astype(np.intp)
+    return _traverse(padded_cells.ravel(), padded_width, room_offsets, grid_size,
+                     x, y, cell_x, cell_y, dir_x, dir_y, max_distance)
+
+def _traverse(padded: np.ndarray, row_stride: int, room_offsets, grid_size: int,
+              x, y, cell_x, cell_y, dir_x: np.ndarray, dir_y: np.ndarray,
+              max_distance: float) -> np.ndarray:
+    """
+    Vektörize DDA çekirdeği
+    
+    room_offsets, x, y, cell_x ve cell_y ışın başına dizi ya da tüm ışınlar
+    için ortak skaler olabilir.
+    
+    Args:
+        padded: Çerçevelenmiş grid(ler)in düzleştirilmiş hali
+        row_stride: Çerçevelenmiş bir satırın uzunluğu
+        room_offsets: Işının odasının düzleştirilmiş dizideki başlangıcı
+        cell_x, cell_y: Başlangıç hücresi (-1..W / -1..H aralığına sıkıştırılmış)
+        (diğerleri cast_rays ile aynı)
+    """
+    ray_count = dir_x.shape[0]
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inv_x = 1.0 / dir_x
+        inv_y = 1.0 / dir_y
+        step_x = np.sign(dir_x).astype(np.intp)
+        step_y = np.sign(dir_y).astype(np.intp) * row_stride
+        t_delta_x = np.abs(grid_size * inv_x)
+        t_delta_y = np.abs(grid_size * inv_y)
+        t_max_x = np.where(dir_x > 0, ((cell_x + 1) * grid_size - x) * inv_x,
+                           np.where(dir_x < 0, (cell_x * grid_size - x) * inv_x, np.inf))
+        t_max_y = np.where(dir_y > 0, ((cell_y + 1) * grid_size - y) * inv_y,
+                           np.where(dir_y < 0, (cell_y * grid_size - y) * inv_y, np.inf))
+    
+    flat_index = np.broadcast_to(room_offsets + (cell_y + 1) * row_stride + cell_x + 1,
+                                 (ray_count,))
+    
+    # Başlangıç noktası engelin içinde olan ışınların mesafesi 0
+    running = padded[flat_index] == 0
+    distances = np.where(running, float(max_distance), 0.0)
+    
+    # Sadece henüz bir şeye çarpmamış ışınlar işlenir (rays = ışın indeksleri)
+    rays = np.arange(ray_count)
+    
+    # Bir ışın en fazla bu kadar hücre sınırı geçebilir
+    max_steps = int(max_distance * math.sqrt(2) / grid_size) + 2
+    for _ in range(max_steps):
+        if not running.all():
+            if not running.any():
+                break
+            rays = rays[running]
+            flat_index = flat_index[running]
+            step_x = step_x[running]
+            step_y = step_y[running]
+            t_max_x = t_max_x[running]
+            t_max_y = t_max_y[running]
+            t_delta_x = t_delta_x[running]
+            t_delta_y = t_delta_y[running]
+        
+        along_x = t_max_x < t_max_y
+        distance = np.where(along_x, t_max_x, t_max_y)
+        
+        flat_index = flat_index + np.where(along_x, step_x, step_y)
+        t_max_x = np.where(along_x, t_max_x + t_delta_x, t_max_x)
+        t_max_y = np.where(along_x, t_max_y, t_max_y + t_delta_y)
+        
+        blocked = padded[flat_index] != 0
+        in_range = distance < max_distance
+        hit = blocked & in_range
+        distances[rays[hit]] = distance[hit]
+        
+        # Çarpan veya menzil dışına çıkan ışınlar bir sonraki adımdan çıkarılır
+        running = in_range & ~blocked
+    
+    return distances
+
+def sphere_trace(room_grid: List[List[int]], clearance: List[List[float]], grid_size: int,
+                 x: float, y: float, angle: float, max_distance: float) -> float:
+    """
+    Mesafe alanı yardımıyla büyük güvenli adımlarla ışın izler
+    
+    Açık alanda ışın, mesafe alanının garanti ettiği güvenli yarıçap kadar
+    atlar; engellerin yakınında güvenli yarıçap sıfıra indiğinde hücre
+    sınırına kadar DDA adımı atılır. Sonuç cast_ray ile aynı kesin mesafedir.
+    Kısa menzilli sensörlerde açık alanda tek adımda biter; uzun ışınlarda
+    cast_ray genellikle daha hızlıdır (bkz. benchmark.py).
+    
+    Args:
+        room_grid: Oda grid'i (0=boş, 1=engel, 2=duvar)
+        clearance: Hücre başına güvenli yarıçap tablosu (distance_field.clearance_map)
+        grid_size: Bir grid hücresinin piksel boyutu
+        x, y: Işının başlangıç noktası (oda koordinatları)
+        angle: Işın açısı (radyan)
+        max_distance: Maksimum ölçüm mesafesi
+    
+    Returns:
+        İlk engele veya oda sınırına olan mesafe (en fazla max_distance)
+    """
+    grid_height = len(room_grid)
+    grid_width = len(room_grid[0])
+    
+    cell_x = int(x // grid_size)
+    cell_y = int(y // grid_size)
+    if not (0 <= cell_x < grid_width and 0 <= cell_y < grid_height):
+        return 0.0
+    if room_grid[cell_y][cell_x] != 0:
+        return 0.0
+    
+    dir_x = math.cos(angle)
+    dir_y = math.sin(angle)
+    distance = 0.0
+    
+    while True:
+        safe = clearance[cell_y][cell_x]
+        if safe > 0:
+            # Güvenli yarıçap kadar atla - bu daire içinde engel yok
+            distance += safe
+            if distance >= max_distance:
+                return max_distance
+            cell_x = int((x + dir_x * distance) // grid_size)
+            cell_y = int((y + dir_y * distance) // grid_size)
+            continue
+        
+        # Engele yakın: bulunulan hücrenin çıkış kenarına kadar ilerle
+        if dir_x > 0:
+            t_x = ((cell_x + 1) * grid_size - x) / dir_x
+        elif dir_x < 0:
+            t_x = (cell_x * grid_size - x) / dir_x
+        else:
+            t_x = math.inf
+        if dir_y > 0:
+            t_y = ((cell_y + 1) * grid_size - y) / dir_y
+        elif dir_y < 0:
+            t_y = (cell_y * grid_size - y) / dir_y
+        else:
+            t_y = math.inf
+        
+        if t_x < t_y:
+            distance = t_x
+            cell_x += 1 if dir_x > 0 else -1
+        else:
+            distance = t_y
+            cell_y += 1 if dir_y > 0 else -1
+        
+        if distance >= max_distance:
+            return max_distance
+        if not (0 <= cell_x < grid_width and 0 <= cell_y < grid_height):
+            return distance
+        if room_grid[cell_y][cell_x] != 0:
+            return distance
@@ -0,0 +1,718 @@
+"""
+Görselleştirme Modülü
+=====================
+Headless simülasyon çekirdeğinin üzerine oturan isteğe bağlı pygame
+katmanı. Oda, robot, LiDAR radar görüntüsü ve kullanıcı arayüzünü çizer.
+"""
+
+import pygame
+import math
+import time
+from typing import List, Optional, Tuple
+import numpy as np
+from robot_vacuum import RobotVacuum
+from simulation import Simulation
+from text_cache import TextCache
+from timestep import FixedTimestep
+
+# Font boyutları
+FONT_HEADER = 36
+FONT_LARGE = 32
+FONT_MEDIUM = 24
+FONT_SMALL = 20
+FONT_TINY = 16
+
+class SimulationRenderer:
+    def __init__(self, simulation: Simulation, timestep: Optional[FixedTimestep] = None):
+        """
+        Simülasyon çizici sınıfı
+        
+        Çizim katmanlıdır: pencere çerçevesi, oda, panel kutuları ve radar
+        arka planı bir kez statik katmana çizilir ve sadece oda değiştiğinde
+        yeniden oluşturulur. Temizlenen hücreler statik katmanın bir kopyası olan
+        zemin katmanına, ilk temizlendikleri karede bir kez boyanır. Her karede
+        yalnızca değişen bölgeler (robotlar, izler, yeni temizlenen hücreler,
+        LiDAR görüntüsü, durum yazıları) katmanlardan geri yüklenip yeniden
+        çizilir; draw() bu bölgeleri pygame.display.update için döndürür.
+        
+        Args:
+            simulation: Çizilecek simülasyon
+            timestep: Hız çarpanı ve tik hızı göstergesi için çalıştırıcı (opsiyonel)
+        """
+        self.simulation = simulation
+        self.timestep = timestep
+        
+        # Fontlar ve render edilmiş yazılar (her karede değişmeyen yazılar tekrar render edilmez)
+        self.text_cache = TextCache()
+        
+        # Yerleşim: simülasyon alanı ve üstüne binen paneller
+        sim = simulation
+        self.sim_rect = pygame.Rect(sim.sim_offset_x, sim.sim_offset_y, sim.sim_width, sim.sim_height)
+        # Robot çizimleri (sensör noktaları) oda kenarından birkaç piksel taşabilir
+        self.world_rect = self.sim_rect.inflate(48, 48)
+        lidar_view_size = 180
+        self.lidar_view_rect = pygame.Rect(sim.width - lidar_view_size - 10, 50,
+                                           lidar_view_size, lidar_view_size)
+        self.status_box = pygame.Rect(5, 75, 180, 160)
+        self.info_box = pygame.Rect(sim.width - 195, 245, 185, 300)
+        # Her karede değişen yazı bölgeleri
+        self.status_rect = pygame.Rect(10, 115, 180, 160)
+        self.lidar_info_rect = pygame.Rect(sim.width - 185, 280, 175, 80)
+        # Kontrol bilgileri simülasyon alanının üst kenarına taşar
+        self.header_texts = [("SPACE: Yeni Oda | R: Robot Sıfırla", (10, 10)),
+                             ("Robot Otonom Hareket Ediyor", (10, 45))]
+        header_font = self.text_cache.font(FONT_HEADER)
+        self.header_rect = pygame.Rect(10, 10, 0, 0).unionall(
+            [pygame.Rect(position, header_font.size(text)) for text, position in self.header_texts])
+        # Kontrol listesi sağ panelin altından simülasyon alanına taşar
+        self.controls_info = [
+            "• SPACE: New room",
+            "• R: Reset robot",
+            "• 1-4: Speed 1x/10x/100x/MAX",
+            "• +/-: Faster / slower",
+            "• M: Occupancy map",
+            "• P: Profiler",
+            "• ESC: Exit"
+        ]
+        self.controls_rect = pygame.Rect(sim.width - 190, 520, 185, 30 + len(self.controls_info) * 16)
+        self._overlays = [self.status_box, self.info_box, self.lidar_view_rect, self.header_rect,
+                          self.controls_rect]
+        self._dynamic_rects = [self.status_rect, self.lidar_info_rect, self.lidar_view_rect]
+        # Alt çubuğun sağında hız göstergesi
+        self.speed_rect = pygame.Rect(sim.width - 250, sim.height - 33, 240, 31)
+        if timestep is not None:
+            self._dynamic_rects.append(self.speed_rect)
+        
+        # Statik katman, zemin katmanı (oda + temizlenmiş hücreler) ve önceki karenin durumu
+        self._static_layer = None
+        self._static_grid = None
+        self._floor_layer = None
+        self._floor_generation = None
+        self._painted = None
+        self._painted_count = 0
+        self._previous_world_rect = None
+        self._full_redraw = True
+        
+        # Aşama süreleri paneli (P tuşu); yazılar birkaç karede bir yenilenir
+        self.show_profile = False
+        self.profile_rect = pygame.Rect(5, 290, 250, 190)
+        self.profile_refresh = 15
+        self._profile_lines: List[str] = []
+        self._profile_frame = 0
+        self._owns_profiler = False
+        
+        # Robotun doluluk haritası katmanı (M tuşu); harita değiştikçe yeniden oluşturulur
+        self.show_occupancy = False
+        self._occupancy_surface = None
+        self._occupancy_pixels = None
+        self._occupancy_key = None
+    
+    def invalidate(self):
+        """Bir sonraki karede tüm ekranın yeniden çizilmesini sağlar"""
+        self._full_redraw = True
+    
+    def toggle_occupancy(self):
+        """Doluluk haritası katmanını açar/kapatır"""
+        self.show_occupancy = not self.show_occupancy
+        self._occupancy_surface = None
+        self._occupancy_pixels = None
+        self._occupancy_key = None
+        self.invalidate()
+    
+    def toggle_profile(self):
+        """
+        Aşama süreleri panelini açar/kapatır
+        
+        Simülasyonda profilleyici açık değilse panelle birlikte açılır ve
+        panel kapanınca tekrar kapatılır.
+        """
+        sim = self.simulation
+        self.show_profile = not self.show_profile
+        if self.show_profile:
+            if sim.profiler is None:
+                sim.enable_profiling()
+                self._owns_profiler = True
+            self._dynamic_rects.append(self.profile_rect)
+            self._profile_lines = []
+            self._profile_frame = 0
+        else:
+            if self._owns_profiler:
+                sim.disable_profiling()
+                self._owns_profiler = False
+            self._dynamic_rects.remove(self.profile_rect)
+        self.invalidate()
+    
+    def draw(self, screen: pygame.Surface) -> List[pygame.Rect]:
+        """
+        Simülasyonu çizer
+        
+        Simülasyonda profilleyici açıksa çizim aşamalarının (oda, robotlar,
+        radar, arayüz) süreleri de ölçülür.
+        
+        Returns:
+            Bu karede değişen ekran bölgeleri (pygame.display.update için)
+        """
+        sim = self.simulation
+        profiler = sim.profiler
+        frame_start = start = profiler.clock() if profiler is not None else 0.0
+        
+        # Oda değiştiyse statik katmanı yeniden oluştur
+        if self._static_grid is not sim.room_grid or self._static_layer is None:
+            self._static_layer = self._build_static_layer(screen.get_size())
+            self._static_grid = sim.room_grid
+            self._full_redraw = True
+        
+        # Oda değiştiyse veya temizlik haritası sıfırlandıysa zemin katmanını baştan kur
+        if self._full_redraw or self._floor_generation != sim.cleaned_area.generation:
+            self._reset_floor_layer()
+            self._full_redraw = True
+        painted_rect = self._paint_new_cells()
+        
+        full_redraw = self._full_redraw
+        self._full_redraw = False
+        if full_redraw:
+            screen.blit(self._static_layer, (0, 0))
+        
+        # Dinamik bölgelerin altını statik katmandan geri yükle
+        for rect in self._dynamic_rects:
+            screen.blit(self._static_layer, rect, rect)
+        
+        # Simülasyon alanında değişen bölgeler: robotlar ve izleri (önceki ve
+        # şimdiki kare) ile simülasyon alanına taşan panel bölgeleri
+        robot_rects = [self._robot_bounds(robot) for robot in sim.robots]
+        robots_rect = robot_rects[0].unionall(robot_rects[1:])
+        world_rect = robots_rect
+        if self._previous_world_rect is not None:
+            world_rect = world_rect.union(self._previous_world_rect)
+        self._previous_world_rect = robots_rect
+        occupancy_rect = self._update_occupancy_surface()
+        if full_redraw:
+            world_rect = self.world_rect
+        world_rects = [world_rect.clip(self.world_rect)]
+        if painted_rect is not None:
+            world_rects.append(painted_rect)
+        if occupancy_rect is not None:
+            world_rects.append(occupancy_rect)
+        world_rects += [rect.clip(self.world_rect) for rect in self._dynamic_rects
+                        if rect.colliderect(self.world_rect)]
+        
+        robot_time = 0.0
+        for rect in world_rects:
+            robot_time += self._draw_world(screen, rect, robot_rects, profiler is not None)
+        
+        # Simülasyon alanının üstüne binen panelleri geri yükle
+        for rect in world_rects:
+            for overlay in self._overlays:
+                area = overlay.clip(rect)
+                if area.width and area.height:
+                    screen.blit(self._static_layer, area, area)
+        if profiler is not None:
+            now = profiler.clock()
+            profiler.record('draw.room', now - start - robot_time)
+            profiler.record('draw.robots', robot_time)
+            start = now
+        
+        # LiDAR görüntüsünü ve değişen yazıları çiz
+        self._draw_lidar_view(screen, sim.robot, self.lidar_view_rect)
+        if profiler is not None:
+            start = profiler.lap('draw.radar', start)
+        self._draw_ui(screen)
+        if self.show_profile and profiler is not None:
+            self._draw_profile(screen, profiler)
+        if profiler is not None:
+            now = profiler.lap('draw.ui', start)
+            profiler.record('draw.frame', now - frame_start)
+        
+        if full_redraw:
+            return [screen.get_rect()]
+        return world_rects + self._dynamic_rects
+    
+    def _build_static_layer(self, size: Tuple[int, int]) -> pygame.Surface:
+        """Oda ve sabit arayüz öğelerini tek bir yüzeye çizer"""
+        sim = self.simulation
+        layer = pygame.Surface(size)
+        if pygame.display.get_surface() is not None:
+            layer = layer.convert()  # Ekran formatında hızlı blit
+        layer.fill((240, 240, 240))  # Açık gri arka plan
+        
+        # Arka plan
+        pygame.draw.rect(layer, (250, 250, 250), self.sim_rect)
+        pygame.draw.rect(layer, (200, 200, 200), self.sim_rect, 2)
+        
+        # Odayı çiz
+        self._draw_room(layer)
+        
+        # Panelleri ve radar arka planını çiz
+        self._draw_lidar_background(layer, sim.robot, self.lidar_view_rect)
+        self._draw_panels(layer)
+        
+        # Kontrol bilgileri (her şeyin üstünde)
+        for text, position in self.header_texts:
+            layer.blit(self.text_cache.render(text, FONT_HEADER, (50, 50, 50)), position)
+        return layer
+    
+    def _reset_floor_layer(self):
+        """Zemin katmanını temizlenmiş hücre içermeyen statik katmandan yeniden oluşturur"""
+        cleaned_area = self.simulation.cleaned_area
+        self._floor_layer = self._static_layer.copy()
+        self._floor_generation = cleaned_area.generation
+        self._painted = np.zeros_like(cleaned_area.cleaned)
+        self._painted_count = 0
+    
+    def _paint_new_cells(self) -> Optional[pygame.Rect]:
+        """
+        Son kareden beri temizlenen hücreleri zemin katmanına boyar
+        
+        Returns:
+            Boyanan hücrelerin ekran sınır kutusu (yeni hücre yoksa None)
+        """
+        sim = self.simulation
+        cleaned_area = sim.cleaned_area
+        if cleaned_area.cleaned_count == self._painted_count:
+            return None
+        
+        grid_size = sim.room_generator.grid_size
+        cell_y, cell_x = np.nonzero(cleaned_area.cleaned & ~self._painted)
+        self._painted |= cleaned_area.cleaned
+        self._painted_count = cleaned_area.cleaned_count
+        
+        for gx, gy in zip(cell_x.tolist(), cell_y.tolist()):
+            rect = pygame.Rect(
+                gx * grid_size + sim.sim_offset_x, 
+                gy * grid_size + sim.sim_offset_y, 
+                grid_size, 
+                grid_size
+            )
+            pygame.draw.rect(self._floor_layer, (200, 255, 200), rect)
+        
+        return pygame.Rect(
+            int(cell_x.min()) * grid_size + sim.sim_offset_x,
+            int(cell_y.min()) * grid_size + sim.sim_offset_y,
+            int(cell_x.max() - cell_x.min() + 1) * grid_size,
+            int(cell_y.max() - cell_y.min() + 1) * grid_size
+        )
+    
+    def _update_occupancy_surface(self) -> Optional[pygame.Rect]:
+        """
+        Doluluk haritası katmanını haritanın son sürümüne göre yeniden oluşturur
+        
+        Boş hücreler açık mavi, dolu hücreler koyu gri, bilinmeyen hücreler
+        saydamdır; renk yoğunluğu hücrenin log-odds değerinin büyüklüğüyle
+        artar. Değerleri sınıra ulaşan hücrelerin rengi değişmez, bu yüzden
+        her karede sadece rengi değişen hücreler yeniden çizilir.
+        
+        Returns:
+            Rengi değişen hücrelerin ekran sınır kutusu (değişiklik yoksa None)
+        """
+        sim = self.simulation
+        occupancy = sim.robot.occupancy_map if self.show_occupancy else None
+        if occupancy is None:
+            if self._occupancy_surface is None:
+                return None
+            # Harita kaldırıldı (ör. robot sıfırlandı); katmanın kapladığı alan temizlenir
+            self._occupancy_surface = None
+            self._occupancy_pixels = None
+            self._occupancy_key = None
+            return self.sim_rect.copy()
+        key = (id(occupancy), occupancy.version)
+        if key == self._occupancy_key:
+            return None
+        self._occupancy_key = key
+        
+        log_odds = occupancy.log_odds
+        strength = np.minimum(np.abs(log_odds) / max(occupancy.max_log_odds, -occupancy.min_log_odds), 1.0)
+        occupied = log_odds > 0
+        pixels = np.zeros(log_odds.shape + (4,), dtype=np.uint8)
+        pixels[occupied, :3] = (60, 60, 60)
+        pixels[~occupied, :3] = (80, 140, 255)
+        pixels[..., 3] = (strength * np.where(occupied, 220, 110)).astype(np.uint8)
+        
+        previous = self._occupancy_pixels
+        if previous is not None and previous.shape == pixels.shape:
+            changed_y, changed_x = np.nonzero((pixels != previous).any(axis=2))
+            if changed_x.size == 0:
+                return None
+        else:
+            changed_y = changed_x = None
+        self._occupancy_pixels = pixels
+        
+        height, width = log_odds.shape
+        grid_size = occupancy.grid_size
+        surface = pygame.image.frombuffer(pixels.tobytes(), (width, height), 'RGBA')
+        surface = pygame.transform.scale(surface, (width * grid_size, height * grid_size))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()  # Ekran formatında hızlı blit
+        self._occupancy_surface = surface
+        if changed_x is None:
+            return self.sim_rect.copy()
+        return pygame.Rect(
+            int(changed_x.min()) * grid_size + sim.sim_offset_x,
+            int(changed_y.min()) * grid_size + sim.sim_offset_y,
+            int(changed_x.max() - changed_x.min() + 1) * grid_size,
+            int(changed_y.max() - changed_y.min() + 1) * grid_size
+        )
+    
+    def _robot_bounds(self, robot: RobotVacuum) -> pygame.Rect:
+        """Robotun, izinin ve yeni temizlenebilecek hücrelerin sınır kutusu"""
+        # Robot hücresinin çevresindeki 3x3 hücre merkeze en fazla iki hücre uzaklıktadır
+        margin = 2 * robot.grid_size
+        points = robot.path_history
+        min_x = min(robot.x, min((p[0] for p in points), default=robot.x))
+        max_x = max(robot.x, max((p[0] for p in points), default=robot.x))
+        min_y = min(robot.y, min((p[1] for p in points), default=robot.y))
+        max_y = max(robot.y, max((p[1] for p in points), default=robot.y))
+        return pygame.Rect(int(min_x) - margin, int(min_y) - margin,
+                           int(max_x - min_x) + 2 * margin + 1,
+                           int(max_y - min_y) + 2 * margin + 1)
+    
+    def _draw_world(self, screen: pygame.Surface, rect: pygame.Rect, robot_rects: List[pygame.Rect],
+                    timed: bool = False) -> float:
+        """
+        Simülasyon alanının verilen bölgesini katmanlardan yeniden oluşturur
+        
+        Returns:
+            timed ise robot çizimine harcanan süre (saniye), değilse 0
+        """
+        if not (rect.width and rect.height):
+            return 0.0
+        screen.set_clip(rect)
+        # Oda ve temizlenmiş alanlar (filo tek haritayı paylaşır)
+        screen.blit(self._floor_layer, rect, rect)
+        if self._occupancy_surface is not None:
+            sim = self.simulation
+            screen.blit(self._occupancy_surface, (sim.sim_offset_x, sim.sim_offset_y))
+        
+        # Robotları çiz (bölgeye değmeyenler atlanır)
+        start = time.perf_counter() if timed else 0.0
+        for robot, robot_rect in zip(self.simulation.robots, robot_rects):
+            if robot_rect.colliderect(rect):
+                self._draw_robot(screen, robot)
+        screen.set_clip(None)
+        return time.perf_counter() - start if timed else 0.0
+    
+    def _draw_profile(self, screen: pygame.Surface, profiler):
+        """Aşama sürelerini (p50 / p99, mikro saniye) panel olarak çizer"""
+        # Yüzdelikler her karede değil, profile_refresh karede bir hesaplanır
+        if self._profile_frame % self.profile_refresh == 0 or not self._profile_lines:
+            self._profile_lines = [(phase, f"{stats['p50_us']:.0f}", f"{stats['p99_us']:.0f}")
+                                   for phase, stats in profiler.summary().items()]
+        self._profile_frame += 1
+        
+        rect = self.profile_rect
+        pygame.draw.rect(screen, (30, 30, 30), rect)
+        pygame.draw.rect(screen, (0, 200, 0), rect, 1)
+        # Sayılar sağa hizalı iki sütun
+        p50_right = rect.right - 70
+        p99_right = rect.right - 8
+        screen.blit(self.text_cache.render("PROFILE (us)", FONT_TINY, (0, 255, 0)), (rect.x + 6, rect.y + 5))
+        for text, right in (("p50", p50_right), ("p99", p99_right)):
+            surface = self.text_cache.render(text, FONT_TINY, (0, 255, 0))
+            screen.blit(surface, (right - surface.get_width(), rect.y + 5))
+        for i, (phase, p50, p99) in enumerate(self._profile_lines[:(rect.height - 28) // 14]):
+            y = rect.y + 24 + i * 14
+            screen.blit(self.text_cache.render(phase, FONT_TINY, (220, 220, 220)), (rect.x + 6, y))
+            for text, right in ((p50, p50_right), (p99, p99_right)):
+                surface = self.text_cache.render(text, FONT_TINY, (220, 220, 220))
+                screen.blit(surface, (right - surface.get_width(), y))
+    
+    def _draw_room(self, surface: pygame.Surface):
+        """Odayı çizer"""
+        sim = self.simulation
+        grid_size = sim.room_generator.grid_size
+        rows = sim.room_generator.grid_rows(sim.room_grid)
+        
+        for y in range(len(rows)):
+            for x in range(len(rows[0])):
+                rect = pygame.Rect(
+                    x * grid_size + sim.sim_offset_x,
+                    y * grid_size + sim.sim_offset_y,
+                    grid_size,
+                    grid_size
+                )
+                
+                cell_value = rows[y][x]
+                
+                if cell_value == 1:  # Engel
+                    pygame.draw.rect(surface, (139, 69, 19), rect)  # Kahverengi
+                    pygame.draw.rect(surface, (101, 67, 33), rect, 1)
+                elif cell_value == 2:  # Duvar
+                    pygame.draw.rect(surface, (64, 64, 64), rect)  # Koyu gri
+                    pygame.draw.rect(surface, (32, 32, 32), rect, 1)
+    
+    def _draw_panels(self, surface: pygame.Surface):
+        """Panel kutularını, başlıkları ve sabit yazıları çizer"""
+        sim = self.simulation
+        
+        # Sol panel - Robot durumu (kompakt)
+        panel_x = 10
+        panel_y = 80
+        
+        # Ana durum kutusu
+        pygame.draw.rect(surface, (240, 240, 240), self.status_box)
+        pygame.draw.rect(surface, (180, 180, 180), self.status_box, 2)
+        
+        # Başlık
+        title = self.text_cache.render("🤖 ROBOT STATUS", FONT_LARGE, (50, 50, 50))
+        surface.blit(title, (panel_x, panel_y))
+        
+        # Sağ panel - LiDAR ve Algoritma bilgileri (LiDAR görüntüsünün altında)
+        right_panel_x = sim.width - 190
+        right_panel_y = 250  # LiDAR görüntüsünün altında
+        
+        # Sağ panel kutusu
+        pygame.draw.rect(surface, (245, 245, 245), self.info_box)
+        pygame.draw.rect(surface, (180, 180, 180), self.info_box, 2)
+        
+        # LiDAR başlığı (bilgi satırları her karede _draw_ui ile çizilir)
+        lidar_title = self.text_cache.render("📡 LIDAR SYSTEM", FONT_MEDIUM, (50, 50, 50))
+        surface.blit(lidar_title, (right_panel_x, right_panel_y))
+        right_panel_y += 30
+        right_panel_y += self.lidar_info_rect.height + 25
+        
+        # Algoritma başlığı
+        algorithm_title = self.text_cache.render("🧠 AI BEHAVIOR", FONT_MEDIUM, (50, 50, 50))
+        surface.blit(algorithm_title, (right_panel_x, right_panel_y))
+        right_panel_y += 30
+        
+        algorithm_info = [
+            "• Autonomous navigation",
+            "• Wall following",
+            "• Obstacle avoidance", 
+            "• Stuck detection",
+            "• Path optimization"
+        ]
+        
+        for i, info in enumerate(algorithm_info):
+            rendered_info = self.text_cache.render(info, FONT_SMALL, (80, 80, 80))
+            surface.blit(rendered_info, (right_panel_x + 5, right_panel_y + i * 16))
+        
+        # Kontrollar başlığı
+        right_panel_y = self.controls_rect.y
+        controls_title = self.text_cache.render("🎮 CONTROLS", FONT_MEDIUM, (50, 50, 50))
+        surface.blit(controls_title, (right_panel_x, right_panel_y))
+        right_panel_y += 30
+        
+        for i, info in enumerate(self.controls_info):
+            rendered_info = self.text_cache.render(info, FONT_SMALL, (80, 80, 80))
+            surface.blit(rendered_info, (right_panel_x + 5, right_panel_y + i * 16))
+        
+        # Alt bilgi çubuğu
+        bottom_rect = pygame.Rect(0, sim.height - 35, sim.width, 35)
+        pygame.draw.rect(surface, (220, 220, 220), bottom_rect)
+        pygame.draw.line(surface, (180, 180, 180), (0, sim.height - 35), (sim.width, sim.height - 35), 2)
+        
+        bottom_y = sim.height - 25
+        status_text = "🤖 AUTONOMOUS ROBOT VACUUM SIMULATION - NO HUMAN INTERVENTION"
+        control_text = self.text_cache.render(status_text, FONT_SMALL, (80, 80, 80))
+        text_rect = control_text.get_rect(center=(sim.width // 2, bottom_y))
+        surface.blit(control_text, text_rect)
+    
+    def _draw_ui(self, screen: pygame.Surface):
+        """Her karede değişen arayüz yazılarını çizer"""
+        sim = self.simulation
+        
+        # Robot durumu
+        status = sim.robot.get_status()
+        
+        # Durum bilgileri (daha kompakt)
+        panel_x = self.status_rect.x
+        panel_y = self.status_rect.y
+        lidar_angle_deg = int((status['lidar_rotation'] * 180 / math.pi) % 360)
+        info_texts = [
+            f"Mode: {status['state'].upper()}",
+            f"Battery: {status['battery']:.0f}%",
+            f"Cleaned: {status['cleaned_tiles']} tiles",
+            f"Position: ({status['position'][0]}, {status['position'][1]})",
+            f"LiDAR: {lidar_angle_deg}°",
+            f"Time: {sim.simulation_time // 60}:{sim.simulation_time % 60:02d}",
+        ]
+        
+        for i, text in enumerate(info_texts):
+            color = (60, 60, 60)
+            if i == 0:  # Durum rengini ayarla
+                if status['state'] == 'exploring':
+                    color = (0, 150, 0)
+                elif status['state'] == 'stuck':
+                    color = (200, 0, 0)
+                elif status['state'] == 'cleaning':
+                    color = (0, 0, 200)
+                elif status['state'] == 'returning':
+                    color = (200, 120, 0)
+            
+            rendered_text = self.text_cache.render(text, FONT_SMALL, color)
+            screen.blit(rendered_text, (panel_x + 5, panel_y + i * 20))
+        
+        # Batarya çubuğu
+        battery_rect = pygame.Rect(panel_x + 5, panel_y + len(info_texts) * 20 + 5, 100, 8)
+        pygame.draw.rect(screen, (100, 100, 100), battery_rect)
+        battery_fill = int((status['battery'] / 100) * 100)
+        battery_color = (0, 200, 0) if status['battery'] > 50 else (200, 200, 0) if status['battery'] > 20 else (200, 0, 0)
+        pygame.draw.rect(screen, battery_color, pygame.Rect(battery_rect.x, battery_rect.y, battery_fill, 8))
+        
+        # Temizlik verimliliği
+        if sim.total_tiles > 0:
+            efficiency = (status['cleaned_tiles'] / sim.total_tiles) * 100
+            efficiency_text = f"Efficiency: {efficiency:.1f}%"
+            
+            color = (0, 150, 0) if efficiency > 80 else (200, 150, 0) if efficiency > 50 else (200, 0, 0)
+            rendered_efficiency = self.text_cache.render(efficiency_text, FONT_SMALL, color)
+            screen.blit(rendered_efficiency, (panel_x + 5, panel_y + len(info_texts) * 20 + 20))
+        
+        # LiDAR bilgileri
+        lidar_info = [
+            f"• Range: {sim.robot.lidar_range}px",
+            f"• Resolution: {sim.robot.lidar_resolution} rays",
+            f"• Rotation: {lidar_angle_deg}°",
+            "• Real-time mapping",
+            "• Obstacle detection"
+        ]
+        
+        for i, info in enumerate(lidar_info):
+            rendered_info = self.text_cache.render(info, FONT_SMALL, (80, 80, 80))
+            screen.blit(rendered_info, (self.lidar_info_rect.x, self.lidar_info_rect.y + i * 16))
+        
+        # Hız çarpanı ve gerçekleşen tik hızı
+        if self.timestep is not None:
+            speed_text = (f"Speed: {self.timestep.speed_label}  |  "
+                          f"{self.timestep.ticks_per_second:,.0f} ticks/s")
+            rendered_speed = self.text_cache.render(speed_text, FONT_SMALL, (40, 40, 120))
+            screen.blit(rendered_speed, rendered_speed.get_rect(midright=self.speed_rect.midright))
+    
+    def _draw_robot(self, screen: pygame.Surface, robot: RobotVacuum):
+        """Robotu çizer"""
+        # Yol geçmişini tek çağrıda çiz
+        if len(robot.path_history) > 1:
+            pygame.draw.lines(screen, (150, 150, 255), False, robot.path_history, 2)
+        
+        # Robot gövdesini çiz
+        pygame.draw.circle(screen, robot.color, (int(robot.x), int(robot.y)), robot.radius)
+        pygame.draw.circle(screen, (30, 100, 200), (int(robot.x), int(robot.y)), robot.radius, 2)
+        
+        # LiDAR modülünü çiz (üstte dönen küçük daire)
+        lidar_radius = 4
+        lidar_y = robot.y - 2  # Robot merkezinin biraz üstünde
+        pygame.draw.circle(screen, (20, 20, 20), (int(robot.x), int(lidar_y)), lidar_radius)
+        pygame.draw.circle(screen, (255, 0, 0), (int(robot.x), int(lidar_y)), lidar_radius, 1)
+        
+        # LiDAR rotasyon göstergesi
+        lidar_indicator_x = robot.x + math.cos(robot.lidar_rotation) * (lidar_radius - 1)
+        lidar_indicator_y = lidar_y + math.sin(robot.lidar_rotation) * (lidar_radius - 1)
+        pygame.draw.circle(screen, (255, 100, 100), 
+                          (int(lidar_indicator_x), int(lidar_indicator_y)), 2)
+        
+        # Yön göstergesi
+        end_x = robot.x + math.cos(robot.angle) * (robot.radius + 5)
+        end_y = robot.y + math.sin(robot.angle) * (robot.radius + 5)
+        pygame.draw.line(screen, (255, 255, 255), 
+                        (int(robot.x), int(robot.y)), 
+                        (int(end_x), int(end_y)), 3)
+        
+        # Sensör alanını göster (debug)
+        sensor_points = []
+        for angle_offset in [-math.pi/6, 0, math.pi/6]:
+            sensor_angle = robot.angle + angle_offset
+            sensor_x = robot.x + math.cos(sensor_angle) * 20
+            sensor_y = robot.y + math.sin(sensor_angle) * 20
+            sensor_points.append((sensor_x, sensor_y))
+        
+        for point in sensor_points:
+            pygame.draw.circle(screen, (255, 200, 100), (int(point[0]), int(point[1])), 3)
+    
+    def _radar_geometry(self, view_rect: pygame.Rect) -> Tuple[int, int, int]:
+        """Radar merkezi ve en büyük yarıçap"""
+        center_x = view_rect.x + view_rect.width // 2
+        center_y = view_rect.y + view_rect.height // 2
+        max_radius = view_rect.width // 2 - 15
+        return center_x, center_y, max_radius
+    
+    def _draw_lidar_background(self, surface: pygame.Surface, robot: RobotVacuum, view_rect: pygame.Rect):
+        """LiDAR görüntüsünün sabit kısmını çizer - çerçeve, başlık, mesafe halkaları"""
+        # LiDAR görüntü alanı
+        pygame.draw.rect(surface, (0, 0, 0), view_rect)  # Siyah arka plan
+        pygame.draw.rect(surface, (0, 255, 0), view_rect, 2)  # Yeşil çerçeve (radar tarzı)
+        
+        # Başlık
+        title = self.text_cache.render("RADAR VIEW", FONT_SMALL, (0, 255, 0))
+        surface.blit(title, (view_rect.x + 5, view_rect.y - 22))
+        
+        # Merkez noktası (robot pozisyonu)
+        center_x, center_y, max_radius = self._radar_geometry(view_rect)
+        
+        # Radar çemberleri (mesafe göstergesi)
+        for i, radius in enumerate([max_radius//3, (max_radius*2)//3, max_radius]):
+            pygame.draw.circle(surface, (0, 100, 0), (center_x, center_y), radius, 1)
+            # Mesafe etiketleri
+            distance_label = f"{int((radius/max_radius) * robot.lidar_range)}px"
+            label_surface = self.text_cache.render(distance_label, FONT_TINY, (0, 150, 0))
+            surface.blit(label_surface, (center_x + radius - 25, center_y - 8))
+        
+        # Radar tarama çizgileri (sabit 8 yön)
+        for i in range(8):
+            angle = (i / 8) * 2 * math.pi
+            end_x = center_x + math.cos(angle) * max_radius
+            end_y = center_y + math.sin(angle) * max_radius
+            pygame.draw.line(surface, (0, 80, 0), (center_x, center_y), (int(end_x), int(end_y)), 1)
+    
+    def _draw_lidar_view(self, screen: pygame.Surface, robot: RobotVacuum, view_rect: pygame.Rect):
+        """LiDAR görüntüsünü çizer - robotun gözünden radar tarzı"""
+        view_x, view_y, view_size = view_rect.x, view_rect.y, view_rect.width
+        center_x, center_y, max_radius = self._radar_geometry(view_rect)
+        
+        # LiDAR verilerini engel noktaları olarak çiz
+        obstacle_points = []
+        for i, distance in enumerate(robot.lidar_data):
+            if distance < robot.lidar_range * 0.95:  # Sadece gerçek engelleri göster
+                angle = (i / robot.lidar_resolution) * 2 * math.pi
+                
+                # Mesafeyi görüntü alanına ölçekle
+                scaled_distance = (distance / robot.lidar_range) * max_radius
+                
+                # Engel noktasını hesapla
+                point_x = center_x + math.cos(angle) * scaled_distance
+                point_y = center_y + math.sin(angle) * scaled_distance
+                
+                # Mesafeye göre parlaklık (yakın=parlak yeşil, uzak=koyu yeşil)
+                distance_ratio = distance / robot.lidar_range
+                if distance_ratio < 0.3:  # Çok yakın - kırmızı
+                    color = (255, int(100 + distance_ratio * 155), 0)
+                    size = 3
+                elif distance_ratio < 0.6:  # Orta mesafe - sarı
+                    color = (255, 255, int(distance_ratio * 255))
+                    size = 2
+                else:  # Uzak - yeşil
+                    color = (0, int(150 + distance_ratio * 105), 0)
+                    size = 2
+                
+                obstacle_points.append((int(point_x), int(point_y), color, size))
+        
+        # Engel noktalarını çiz
+        for point_x, point_y, color, size in obstacle_points:
+            pygame.draw.circle(screen, color, (point_x, point_y), size)
+            # Yakın engeller için glow efekti
+            if color[0] > 200:  # Kırmızı renkli yakın engeller
+                pygame.draw.circle(screen, (color[0]//3, color[1]//3, color[2]//3), 
+                                 (point_x, point_y), size + 2, 1)
+        
+        # Robot merkezi
+        pygame.draw.circle(screen, (255, 255, 255), (center_x, center_y), 4)
+        pygame.draw.circle(screen, (0, 255, 0), (center_x, center_y), 4, 1)
+        
+        # Robot yön göstergesi (dinamik)
+        direction_length = 20
+        direction_x = center_x + math.cos(robot.angle) * direction_length
+        direction_y = center_y + math.sin(robot.angle) * direction_length
+        pygame.draw.line(screen, (255, 255, 0), 
+                        (center_x, center_y), 
+                        (int(direction_x), int(direction_y)), 3)
+        
+        # LiDAR döner çizgi (tarama konumu)
+        scan_line_x = center_x + math.cos(robot.lidar_rotation) * max_radius
+        scan_line_y = center_y + math.sin(robot.lidar_rotation) * max_radius
+        pygame.draw.line(screen, (0, 255, 255), 
+                        (center_x, center_y), 
+                        (int(scan_line_x), int(scan_line_y)), 2)
+        
+        # Durumu göster
+        status_text = f"Objects: {len(obstacle_points)}"
+        status_surface = self.text_cache.render(status_text, FONT_TINY, (0, 200, 0))
+        screen.blit(status_surface, (view_x + 5, view_y + view_size - 20))
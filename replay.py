@@ -0,0 +1,193 @@
+"""
+Tekrar Oynatma Modülü
+=====================
+Simülasyon kayıtlarını küçük, sabit genişlikli bir ikili dosyaya yazar ve
+bu dosyadan simülasyonu yeniden çalıştırmadan oynatır. Pahalı headless
+koşular kaydedilip sonradan neredeyse bedavaya incelenebilir.
+
+Dosya biçimi (little-endian):
+    başlık:  HEADER (sihirli sözcük, sürüm, robot sayısı, seed, ekran ve grid boyutları)
+    oda:     grid_height * grid_width bayt uint8 oda grid'i
+    kayıtlar: her tik için robot başına bir RECORD_DTYPE kaydı (25 bayt)
+
+İlk kayıt grubu robotların başlangıç durumudur; sonraki her grup bir
+simulation.step() sonrasındaki durumdur. Kayıtlar sabit genişlikli olduğu
+için okuyucu dosyayı np.memmap ile açar ve herhangi bir tike O(1) erişir.
+"""
+
+import math
+import os
+import struct
+import numpy as np
+from robot_vacuum import LidarMode, RobotState
+from simulation import Simulation
+
+MAGIC = b"RVRP"
+VERSION = 1
+HEADER = struct.Struct("<4sHHqHHHHH")
+
+# Robot başına tik kaydı: konum tam hassasiyetle tutulur ki temizlenen hücreler birebir aynı çıksın
+RECORD_DTYPE = np.dtype([
+    ('x', '<f8'),
+    ('y', '<f8'),
+    ('angle', '<f4'),
+    ('battery', '<f4'),
+    ('state', 'u1'),
+])
+RECORD = struct.Struct("<ddffB")
+
+# Durumlar dosyada sıra numarasıyla saklanır
+STATES = list(RobotState)
+STATE_INDEX = {state: index for index, state in enumerate(STATES)}
+
+class ReplayRecorder:
+    def __init__(self, path: str, simulation: Simulation, buffer_size: int = 1 << 16):
+        """
+        Kayıt sınıfı; başlığı, odayı ve başlangıç durumunu hemen yazar
+        
+        Args:
+            path: Kayıt dosyasının yolu
+            simulation: Kaydedilen simülasyon
+            buffer_size: Diske yazmadan önce bellekte biriktirilen en fazla bayt
+        """
+        self.simulation = simulation
+        self.buffer_size = buffer_size
+        self.tick_count = 0
+        self._room_grid = simulation.room_grid
+        self._buffer = bytearray()
+        self._file = open(path, "wb")
+        
+        room_generator = simulation.room_generator
+        self._file.write(HEADER.pack(
+            MAGIC, VERSION, len(simulation.robots), simulation.seed,
+            simulation.width, simulation.height, room_generator.grid_size,
+            room_generator.grid_width, room_generator.grid_height
+        ))
+        self._file.write(np.ascontiguousarray(room_generator.grid_array(simulation.room_grid)).tobytes())
+        self._append_frame()
+    
+    def record(self):
+        """Simülasyonun son tikten sonraki durumunu kaydeder"""
+        if self.simulation.room_grid is not self._room_grid:
+            raise ValueError("kayıt sırasında oda değişti; her kayıt tek bir oda içerir")
+        self._append_frame()
+        self.tick_count += 1
+    
+    def _append_frame(self):
+        """Tüm robotların durumunu tampona ekler"""
+        pack = RECORD.pack
+        buffer = self._buffer
+        for robot in self.simulation.robots:
+            buffer += pack(robot.x, robot.y, robot.angle, robot.battery, STATE_INDEX[robot.state])
+        if len(buffer) >= self.buffer_size:
+            self.flush()
+    
+    def flush(self):
+        """Tampondaki kayıtları dosyaya yazar"""
+        self._file.write(self._buffer)
+        self._buffer.clear()
+    
+    def close(self):
+        """Kalan kayıtları yazar ve dosyayı kapatır"""
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+    
+    def __enter__(self) -> "ReplayRecorder":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+class ReplayReader:
+    def __init__(self, path: str):
+        """
+        Kayıt okuyucu sınıfı
+        
+        Args:
+            path: ReplayRecorder ile yazılmış kayıt dosyasının yolu
+        """
+        with open(path, "rb") as file:
+            header = file.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"kayıt dosyası değil: {path}")
+            (magic, version, self.robot_count, self.seed, self.width, self.height,
+             self.grid_size, grid_width, grid_height) = HEADER.unpack(header)
+            if magic != MAGIC:
+                raise ValueError(f"kayıt dosyası değil: {path}")
+            if version != VERSION:
+                raise ValueError(f"desteklenmeyen kayıt sürümü: {version}")
+            self.grid = np.frombuffer(file.read(grid_width * grid_height), dtype=np.uint8)
+            self.grid = self.grid.reshape(grid_height, grid_width).copy()
+        
+        # Yarım yazılmış son tik grubu (ör. kesilen koşu) yok sayılır
+        offset = HEADER.size + self.grid.size
+        frame_size = RECORD_DTYPE.itemsize * self.robot_count
+        frame_count = (os.path.getsize(path) - offset) // frame_size
+        if frame_count < 1:
+            raise ValueError(f"kayıt dosyasında başlangıç durumu yok: {path}")
+        self.frames = np.memmap(path, dtype=RECORD_DTYPE, mode='r', offset=offset,
+                                shape=(frame_count, self.robot_count))
+    
+    @property
+    def tick_count(self) -> int:
+        """Kayıttaki tik sayısı (başlangıç durumu hariç)"""
+        return len(self.frames) - 1
+    
+    def frame(self, tick: int) -> np.ndarray:
+        """Verilen tikten sonraki robot durumları (tick=0 başlangıç durumu)"""
+        return self.frames[tick]
+
+class ReplaySimulation(Simulation):
+    def __init__(self, reader: ReplayReader):
+        """
+        Kayıttan oynatılan simülasyon
+        
+        Simulation ile aynı arayüzü sunar, böylece SimulationRenderer ve
+        FixedTimestep değişmeden kullanılır. step() robot kararlarını
+        çalıştırmaz; robotlar kayıttaki duruma taşınır ve temizlenen alan
+        kayıtlı konumlardan işaretlenir. LiDAR kaydedilmediği için kapalıdır.
+        
+        Args:
+            reader: Oynatılacak kayıt
+        """
+        super().__init__(reader.width, reader.height, reader.robot_count, LidarMode.OFF, reader.seed)
+        self.reader = reader
+        first = reader.frame(0)[0]
+        start_pos = (int(first['x']) - self.sim_offset_x, int(first['y']) - self.sim_offset_y)
+        self.load_room(reader.grid, start_pos)
+        self._apply_frame(0)
+    
+    @property
+    def finished(self) -> bool:
+        """Kaydın sonuna gelindi mi"""
+        return self.simulation_time >= self.reader.tick_count
+    
+    def step(self):
+        """Kayıttaki bir sonraki tiki uygular (kayıt bittiyse hiçbir şey yapmaz)"""
+        if self.finished:
+            return
+        self.simulation_time += 1
+        self._apply_frame(self.simulation_time)
+        for robot in self.robots:
+            robot.path_history.append((int(robot.x), int(robot.y)))
+            robot._mark_cleaned_area()
+    
+    def _apply_frame(self, tick: int):
+        """Robotları kayıttaki tik durumuna taşır"""
+        for robot, record in zip(self.robots, self.reader.frame(tick).tolist()):
+            robot.x, robot.y, robot.angle, robot.battery, state = record
+            robot.state = STATES[state]
+            robot.lidar_rotation = (robot.lidar_rotation + robot.lidar_speed) % (2 * math.pi)
+    
+    def generate_new_room(self):
+        """Kayıt tek bir oda içerdiğinden oynatmayı baştan başlatır"""
+        self.reset_robot()
+    
+    def reset_robot(self):
+        """Oynatmayı baştan başlatır"""
+        self.cleaned_area.clear()
+        for robot in self.robots:
+            robot.path_history.clear()
+        self.simulation_time = 0
+        self._apply_frame(0)
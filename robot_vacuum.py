@@ -5,11 +5,17 @@ Otonom robot süpürge sınıfı. Robot kendi kararlarını verir,
 engelleri algılar ve sistematik temizlik yapar.
 """
 
-import pygame
 import math
 import random
-from typing import List, Tuple, Set
+from collections import deque
+from typing import List, Optional, Tuple, Set
 from enum import Enum
+import numpy as np
+from config_space import ConfigurationSpace
+from coverage_map import CoverageMap
+from occupancy_grid import OccupancyGrid
+from planner import DStarLite
+from raycaster import cast_ray, cast_rays_padded, lidar_directions
 
 class RobotState(Enum):
     EXPLORING = "exploring"
@@ -17,15 +23,24 @@ class RobotState(Enum):
     RETURNING = "returning"
     STUCK = "stuck"
 
+class LidarMode(Enum):
+    FULL = "full"    # Her tikte tüm ışınlar tek NumPy işlemiyle taranır
+    SWEEP = "sweep"  # Her tikte dönen kafanın önündeki dilim taranır
+    OFF = "off"      # Tarama yapılmaz (LiDAR verisi kullanılmayan büyük filolar için)
+
 class RobotVacuum:
-    def __init__(self, x: int, y: int, grid_size: int):
+    def __init__(self, x: int, y: int, grid_size: int, lidar_mode: LidarMode = LidarMode.FULL,
+                 rng: Optional[random.Random] = None):
         """
         Robot süpürge sınıfı
         
         Args:
             x, y: Başlangıç pozisyonu (ekran koordinatları)
             grid_size: Grid boyutu
+            lidar_mode: LiDAR tarama modu (tam tur veya dönen dilim)
+            rng: Robot kararlarında kullanılan rastgele sayı üreteci (verilmezse yeni bir tane)
         """
+        self.rng = rng if rng is not None else random.Random()
         self.x = float(x)
         self.y = float(y)
         self.start_x = x
@@ -44,60 +59,118 @@ class RobotVacuum:
         self.lidar_resolution = 360  # Tam 360 derece için 360 ışın
         self.lidar_rotation = 0
         self.lidar_speed = 0.12  # Dönüş hızı
-        self.lidar_data = [self.lidar_range] * self.lidar_resolution  # Mesafe verileri
+        self.lidar_mode = lidar_mode
+        self.lidar_sweep_width = 30  # SWEEP modunda tik başına taranan açı sayısı
+        self.lidar_data = np.full(self.lidar_resolution, float(self.lidar_range))  # Mesafe verileri
+        # Işın yön tabloları (cos, sin) bir kez hesaplanır
+        self._lidar_dir_x, self._lidar_dir_y = lidar_directions(self.lidar_resolution)
         
         # Hareket ve yön
-        self.angle = random.uniform(0, 2 * math.pi)
+        self.angle = self.rng.uniform(0, 2 * math.pi)
         self.target_angle = self.angle
         self.angular_speed = 0.1
         
         # Robot durumu
         self.state = RobotState.EXPLORING
         self.battery = 100
-        self.cleaned_area = set()
-        self.path_history = []
+        # Temizlik haritası oda ile birlikte Simulation tarafından atanır (filoda ortak)
+        self.cleaned_area: Optional[CoverageMap] = None
+        # Gövde çarpışma haritası: oda değiştiğinde Simulation tarafından sıfırlanır ve ilk
+        # harekette odanın katmanından bir kez alınır; sonraki tikler doğrudan kullanır
+        self.config_space: Optional[ConfigurationSpace] = None
+        self.path_history = deque()
         
         # Karar verme mekanizması
+        self.robot_contacts = 0  # Filo modunda önlenen robot-robot çarpışmaları
         self.stuck_counter = 0
-        self.last_positions = []
+        self.last_positions = deque()
         self.direction_change_timer = 0
         self.wall_following = False
         self.wall_follow_direction = 1  # 1: sağ, -1: sol
         
+        # Planlı gezinme (D* Lite): şarj için başlangıca dönüş ve temizlenmemiş bölgeye gitme
+        self.return_battery = 20  # Batarya bunun altına inince başlangıç noktasına dön
+        self.seek_after = 300  # Bu kadar tik yeni hücre temizlenmezse temizlenmemiş bölgeye git
+        self.navigation_timeout = 1500  # Hedefe bu kadar tikte ulaşılamazsa vazgeç
+        self.planner: Optional[DStarLite] = None
+        self.navigation_goal: Optional[Tuple[int, int]] = None
+        # LiDAR ve çarpmalardan oluşturulan log-odds doluluk haritası (ilk kullanımda oluşturulur)
+        self.occupancy_map: Optional[OccupancyGrid] = None
+        # Haritaya henüz işlenmemiş dönen tarama ölçümleri: (x, y, açı indeksleri, mesafeler)
+        self._pending_rays: List[Tuple[float, float, List[int], np.ndarray]] = []
+        # Planlayıcının engel haritası (1=engel): doluluk haritasının dolu hücreleri;
+        # bilinmeyen hücreler boş varsayılır
+        self.known_obstacles: Optional[bytearray] = None
+        self._bumped_cell: Optional[Tuple[int, int]] = None
+        self._sensed_cell: Optional[Tuple[int, int]] = None
+        self._ticks_since_clean = 0
+        self._navigation_ticks = 0
+        self._navigation_cooldown = 0
+        
+        # Geçmiş pencereleri: sabit boyutlu halka tamponlar
+        self.stuck_threshold = 20  # Pencere boyunca bundan az hareket = sıkışma
+        self.configure_history()
+        
+        # Aşama süresi ölçümü (opsiyonel, Simulation.enable_profiling ile bağlanır)
+        self.profiler = None
+        
         # Renk ve görsellik
         self.color = (50, 150, 250)  # Mavi
         self.trail_color = (100, 200, 100, 50)  # Yeşil iz
         
-    def update(self, room_grid: List[List[int]], room_generator):
-        """Robot durumunu günceller"""
+    def update(self, room_grid: np.ndarray, room_generator, spatial_hash=None):
+        """
+        Robot durumunu günceller
+        
+        Args:
+            room_grid: Oda grid'i
+            room_generator: Grid sorguları için oda üretici
+            spatial_hash: Filo modunda diğer robotları içeren uzamsal hash (opsiyonel)
+        """
+        # Aşama süreleri sadece profilleyici bağlıysa ölçülür
+        profiler = self.profiler
+        start = profiler.clock() if profiler is not None else 0.0
+        
         self.battery = max(0, self.battery - 0.02)
         
         # Pozisyon geçmişini tut
-        self.last_positions.append((self.x, self.y))
-        if len(self.last_positions) > 50:
-            self.last_positions.pop(0)
+        self._record_position()
         
         # Sıkışma kontrolü
         self._check_if_stuck()
+        if profiler is not None:
+            start = profiler.lap('tick.stuck_check', start)
+        
+        # Şarj veya temizlenmemiş bölge hedefi gerekiyorsa planlı gezinmeye geç
+        if self.state == RobotState.EXPLORING:
+            self._select_navigation_goal(room_generator)
         
         # Durum makinesine göre hareket et
         if self.state == RobotState.EXPLORING:
             self._explore_behavior(room_grid, room_generator)
-        elif self.state == RobotState.CLEANING:
-            self._cleaning_behavior(room_grid, room_generator)
+        elif self.state in (RobotState.RETURNING, RobotState.CLEANING):
+            self._navigate_behavior(room_grid, room_generator)
         elif self.state == RobotState.STUCK:
             self._stuck_behavior(room_grid, room_generator)
+        if profiler is not None:
+            start = profiler.lap('tick.behavior', start)
         
         # Hareketi uygula
-        self._move(room_grid, room_generator)
+        self._move(room_grid, room_generator, spatial_hash)
+        if profiler is not None:
+            start = profiler.lap('tick.move', start)
         
         # LiDAR'ı güncelle
         self._update_lidar(room_grid, room_generator)
+        if profiler is not None:
+            start = profiler.lap('tick.lidar', start)
         
         # Temizliği kaydet
         self._mark_cleaned_area()
+        if profiler is not None:
+            profiler.lap('tick.clean', start)
     
-    def _explore_behavior(self, room_grid: List[List[int]], room_generator):
+    def _explore_behavior(self, room_grid: np.ndarray, room_generator):
         """Keşif davranışı - sistematik temizlik"""
         self.direction_change_timer -= 1
         
@@ -108,7 +181,7 @@ class RobotVacuum:
             if not self.wall_following:
                 # Duvar takip moduna geç
                 self.wall_following = True
-                self.wall_follow_direction = random.choice([1, -1])
+                self.wall_follow_direction = self.rng.choice([1, -1])
             
             # Duvar boyunca git
             self._follow_wall(room_grid, room_generator)
@@ -117,32 +190,155 @@ class RobotVacuum:
             
             # Düz git veya yön değiştir
             if self.direction_change_timer <= 0:
-                if random.random() < 0.3:  # %30 şans ile yön değiştir
-                    self.target_angle += random.uniform(-math.pi/3, math.pi/3)
-                    self.direction_change_timer = random.randint(30, 120)
+                if self.rng.random() < 0.3:  # %30 şans ile yön değiştir
+                    self.target_angle += self.rng.uniform(-math.pi/3, math.pi/3)
+                    self.direction_change_timer = self.rng.randint(30, 120)
+    
+    def _current_cell(self) -> Tuple[int, int]:
+        """Robotun bulunduğu grid hücresi"""
+        return (int((self.x - self.sim_offset_x) // self.grid_size),
+                int((self.y - self.sim_offset_y) // self.grid_size))
+    
+    def _select_navigation_goal(self, room_generator):
+        """
+        Keşif sırasında planlı gezinme hedefi seçer
+        
+        Batarya azaldığında başlangıç noktasına (RETURNING), uzun süre yeni
+        hücre temizlenmediğinde en yakın temizlenmemiş hücreye (CLEANING) gider.
+        """
+        if self._navigation_cooldown > 0:
+            self._navigation_cooldown -= 1
+            return
+        
+        cell = self._current_cell()
+        if self.battery < self.return_battery:
+            dock = (int((self.start_x - self.sim_offset_x) // self.grid_size),
+                    int((self.start_y - self.sim_offset_y) // self.grid_size))
+            self._start_navigation(dock, RobotState.RETURNING, room_generator)
+        elif self._ticks_since_clean >= self.seek_after and self.cleaned_area is not None:
+            goal = self.cleaned_area.nearest_uncleaned(*cell)
+            if goal is None:
+                self._navigation_cooldown = self.seek_after
+            else:
+                self._start_navigation(goal, RobotState.CLEANING, room_generator)
     
-    def _cleaning_behavior(self, room_grid: List[List[int]], room_generator):
-        """Sistematik temizlik davranışı"""
-        # Spiral hareket veya zigzag temizlik
-        if random.random() < 0.1:  # Zaman zaman yön değiştir
-            self.target_angle += math.pi / 6
+    def _start_navigation(self, goal: Tuple[int, int], state: RobotState, room_generator):
+        """Hedefe planlı gezinmeyi başlatır; aynı hedefin planı varsa artımlı olarak sürdürülür"""
+        if not (0 <= goal[0] < room_generator.grid_width and 0 <= goal[1] < room_generator.grid_height):
+            # Hedef robotun grid'inin dışında (ör. büyük zeminde yerel pencerenin dışındaki şarj noktası)
+            self._navigation_cooldown = self.seek_after
+            return
+        occupancy = self._ensure_map(room_generator)
+        if self.known_obstacles is None:
+            self.known_obstacles = bytearray(room_generator.grid_width * room_generator.grid_height)
+        cell = self._current_cell()
+        if self.planner is None or self.navigation_goal != goal:
+            # Yeni planlayıcı haritanın güncel halinden başlar
+            np.frombuffer(self.known_obstacles, dtype=np.uint8)[:] = occupancy.occupied().ravel()
+            self.planner = DStarLite(room_generator.grid_width, room_generator.grid_height,
+                                     cell, goal, self.known_obstacles)
+            self.navigation_goal = goal
+        self.state = state
+        self.wall_following = False
+        self._navigation_ticks = 0
+        self._sensed_cell = None
     
-    def _stuck_behavior(self, room_grid: List[List[int]], room_generator):
+    def _finish_navigation(self, arrived: bool):
+        """Planlı gezinmeyi bitirir ve keşfe döner"""
+        if arrived and self.state == RobotState.RETURNING:
+            self.battery = 100  # Başlangıç noktasında şarj olur
+        elif not arrived:
+            # Ulaşılamayan hedefi hemen tekrar denememek için bekle
+            self._navigation_cooldown = self.seek_after
+        self.state = RobotState.EXPLORING
+        self._ticks_since_clean = 0
+    
+    def _navigate_behavior(self, room_grid: np.ndarray, room_generator):
+        """Planlı gezinme davranışı - D* Lite yolunun bir sonraki hücresine yönel"""
+        cell = self._current_cell()
+        if cell == self.navigation_goal:
+            self._finish_navigation(arrived=True)
+            return
+        if self.state == RobotState.CLEANING and self.cleaned_area.is_cleaned(*self.navigation_goal):
+            # Hedef bu arada (ör. başka bir robot tarafından) temizlendi
+            self._finish_navigation(arrived=True)
+            return
+        self._navigation_ticks += 1
+        if self._navigation_ticks > self.navigation_timeout:
+            self._finish_navigation(arrived=False)
+            return
+        
+        planner = self.planner
+        planner.move_start(cell)
+        self._sense_obstacles(room_grid, room_generator, cell)
+        # Değişiklik yoksa plan() hemen döner; yeni engeller sadece etkilenen hücreleri günceller
+        if not planner.plan():
+            self._finish_navigation(arrived=False)
+            return
+        
+        waypoint = planner.next_cell()
+        if waypoint is None:
+            self._finish_navigation(arrived=False)
+            return
+        target_x = (waypoint[0] + 0.5) * self.grid_size + self.sim_offset_x
+        target_y = (waypoint[1] + 0.5) * self.grid_size + self.sim_offset_y
+        self.target_angle = math.atan2(target_y - self.y, target_x - self.x)
+    
+    def _sense_obstacles(self, room_grid: np.ndarray, room_generator, cell: Tuple[int, int]):
+        """
+        Doluluk haritasındaki değişiklikleri planlayıcının engel haritasına aktarır
+        
+        Çarpılan hücre ve yeni girilen hücrenin 8 komşusu (yakınlık
+        sensörleri) haritaya kesin dolu olarak işlenir; LiDAR taramaları
+        haritaya _update_lidar içinde işlenir. Planlayıcıya sadece durumu
+        değişen hücreler verilir.
+        """
+        occupancy = self.occupancy_map
+        seen = []
+        if self._bumped_cell is not None:
+            seen.append(self._bumped_cell)
+            self._bumped_cell = None
+        
+        if cell != self._sensed_cell:
+            self._sensed_cell = cell
+            rows = room_generator.grid_rows(room_grid)
+            cell_x, cell_y = cell
+            for y in range(max(cell_y - 1, 0), min(cell_y + 2, room_generator.grid_height)):
+                row = rows[y]
+                for x in range(max(cell_x - 1, 0), min(cell_x + 2, room_generator.grid_width)):
+                    if row[x] != 0:
+                        seen.append((x, y))
+        if seen:
+            occupancy.mark_occupied(seen)
+        
+        occupied = occupancy.occupied().ravel()
+        known = np.frombuffer(self.known_obstacles, dtype=bool)
+        changed = np.flatnonzero(occupied != known)
+        if changed.size:
+            width = room_generator.grid_width
+            newly = changed[occupied[changed]]
+            freed = changed[~occupied[changed]]
+            if newly.size:
+                self.planner.set_blocked(zip((newly % width).tolist(), (newly // width).tolist()))
+            if freed.size:
+                self.planner.set_blocked(zip((freed % width).tolist(), (freed // width).tolist()), False)
+    
+    def _stuck_behavior(self, room_grid: np.ndarray, room_generator):
         """Sıkışma durumu davranışı"""
         # Rastgele yöne dön
-        self.target_angle += random.uniform(-math.pi, math.pi)
+        self.target_angle += self.rng.uniform(-math.pi, math.pi)
         self.stuck_counter = max(0, self.stuck_counter - 1)
         
         if self.stuck_counter == 0:
             self.state = RobotState.EXPLORING
     
-    def _follow_wall(self, room_grid: List[List[int]], room_generator):
+    def _follow_wall(self, room_grid: np.ndarray, room_generator):
         """Duvar takip algoritması"""
         # Sağa veya sola dön (duvar takip yönüne göre)
         turn_angle = math.pi / 4 * self.wall_follow_direction
         self.target_angle = self.angle + turn_angle
     
-    def _move(self, room_grid: List[List[int]], room_generator):
+    def _move(self, room_grid: np.ndarray, room_generator, spatial_hash=None):
         """Robotu hareket ettirir"""
         # Açıyı yumuşak geçiş ile güncelle
         angle_diff = self.target_angle - self.angle
@@ -157,89 +353,173 @@ class RobotVacuum:
         new_x = self.x + math.cos(self.angle) * self.speed
         new_y = self.y + math.sin(self.angle) * self.speed
         
-        # Grid koordinatlarına dönüştür (offset olmadan)
-        grid_check_x = int(new_x - self.sim_offset_x)
-        grid_check_y = int(new_y - self.sim_offset_y)
-        
-        # Çarpışma kontrolü
-        if room_generator.is_valid_position(room_grid, grid_check_x, grid_check_y):
+        # Gövde çarpışma kontrolü: merkezin adım boyunca izlediği parça şişirilmiş
+        # engel haritasında (konfigürasyon uzayı) kontrol edilir
+        space = self.config_space
+        if space is None:
+            space = self.config_space = room_generator.config_space(room_grid, self.radius)
+        if not space.segment_free(self.x - self.sim_offset_x, self.y - self.sim_offset_y,
+                                  new_x - self.sim_offset_x, new_y - self.sim_offset_y):
+            # Engele çarptı, yön değiştir (planlı gezinmede gövdenin önündeki engel hücresi haritaya eklenir)
+            self._bumped_cell = self._cell_ahead(room_grid, room_generator)
+            self.target_angle += self.rng.uniform(math.pi/2, math.pi)
+        elif spatial_hash is not None and self._robot_in_way(new_x, new_y, spatial_hash):
+            # Başka bir robota çarpacak, yerinde kal ve yön değiştir
+            self.robot_contacts += 1
+            self.target_angle += self.rng.uniform(math.pi/2, math.pi)
+        else:
             self.x = new_x
             self.y = new_y
-        else:
-            # Engele çarptı, yön değiştir
-            self.target_angle += random.uniform(math.pi/2, math.pi)
+            if spatial_hash is not None:
+                spatial_hash.move(self, self.x, self.y)
     
-    def _get_front_distance(self, room_grid: List[List[int]], room_generator) -> float:
-        """Önündeki engele olan mesafeyi ölçer"""
-        for distance in range(5, self.sensor_range, 5):
-            check_x = self.x + math.cos(self.angle) * distance
-            check_y = self.y + math.sin(self.angle) * distance
-            
-            # Grid koordinatlarına dönüştür
-            grid_check_x = int(check_x - self.sim_offset_x)
-            grid_check_y = int(check_y - self.sim_offset_y)
-            
-            if not room_generator.is_valid_position(room_grid, grid_check_x, grid_check_y):
-                return distance
+    def _cell_ahead(self, room_grid: np.ndarray, room_generator) -> Optional[Tuple[int, int]]:
+        """Gövdenin hareket yönündeki ucunun bulunduğu hücre, engelse (değilse None)"""
+        cell_x = int((self.x - self.sim_offset_x + math.cos(self.angle) * (self.radius + 1)) // self.grid_size)
+        cell_y = int((self.y - self.sim_offset_y + math.sin(self.angle) * (self.radius + 1)) // self.grid_size)
+        if (0 <= cell_x < room_generator.grid_width and 0 <= cell_y < room_generator.grid_height and
+                room_generator.grid_rows(room_grid)[cell_y][cell_x] != 0):
+            return (cell_x, cell_y)
+        return None
+    
+    def _robot_in_way(self, new_x: float, new_y: float, spatial_hash) -> bool:
+        """Yeni pozisyonda başka bir robotun gövdesiyle çakışma var mı kontrol eder"""
+        min_distance = 2 * self.radius
+        for other in spatial_hash.query(new_x, new_y, min_distance):
+            if other is self:
+                continue
+            dx = other.x - new_x
+            dy = other.y - new_y
+            if dx * dx + dy * dy < min_distance * min_distance:
+                # Sadece yaklaşan hareketleri engelle; zaten çakışan robotlar ayrılabilsin
+                if dx * dx + dy * dy < (other.x - self.x) ** 2 + (other.y - self.y) ** 2:
+                    return True
+        return False
+    
+    def _get_front_distance(self, room_grid: np.ndarray, room_generator) -> float:
+        """
+        Önündeki engele olan mesafeyi ölçer
         
-        return self.sensor_range
+        Mesafe gövdenin (merkezin değil) ileri yönde engele değmeden
+        gidebileceği yoldur; çarpışma kontrolüyle aynı konfigürasyon uzayında
+        ölçülür, böylece engele yanaşık açıyla yaklaşan robot da çarpmadan
+        önce duvar takibine geçer. Açık alanda mesafe alanı sayesinde (küre
+        izleme, güvenli yarıçaptan gövde yarıçapı düşülür) tek adımda sonuçlanır.
+        """
+        space = self.config_space
+        if space is None:
+            space = self.config_space = room_generator.config_space(room_grid, self.radius)
+        return space.free_distance(self.x - self.sim_offset_x, self.y - self.sim_offset_y,
+                                   self.angle, self.sensor_range)
+    
+    def configure_history(self, stuck_window: int = 30, trail_length: int = 500):
+        """
+        Geçmiş tamponlarını verilen pencere boyutlarıyla yeniden oluşturur
+        
+        Tamponlar deque(maxlen) olduğundan eklemeler O(1)'dir ve bellek
+        pencere boyutuyla sınırlıdır; uzun pencereler tik başına maliyeti
+        artırmaz.
+        
+        Args:
+            stuck_window: Sıkışma kontrolünde bakılan son pozisyon sayısı
+            trail_length: Çizilen yol izindeki en fazla nokta sayısı
+        """
+        self.stuck_window = stuck_window
+        self.last_positions = deque(self.last_positions, maxlen=stuck_window)
+        self.path_history = deque(self.path_history, maxlen=trail_length)
+        # Ardışık pozisyonlar arası adım uzunlukları ve pencere toplamı
+        self._step_lengths = deque(maxlen=max(stuck_window - 1, 1))
+        positions = list(self.last_positions)
+        for (x0, y0), (x1, y1) in zip(positions, positions[1:]):
+            self._step_lengths.append(math.hypot(x1 - x0, y1 - y0))
+        self._movement_sum = math.fsum(self._step_lengths)
+        self._steps_since_resync = 0
+    
+    def _record_position(self):
+        """Pozisyonu geçmişe ekler ve pencere hareket toplamını günceller"""
+        if self.last_positions:
+            last_x, last_y = self.last_positions[-1]
+            step = math.hypot(self.x - last_x, self.y - last_y)
+            step_lengths = self._step_lengths
+            if len(step_lengths) == step_lengths.maxlen:
+                self._movement_sum -= step_lengths[0]
+            step_lengths.append(step)
+            self._movement_sum += step
+            
+            # Ekle-çıkar yuvarlama hatası birikmesin: her tam turda toplamı yeniden hesapla
+            self._steps_since_resync += 1
+            if self._steps_since_resync >= step_lengths.maxlen:
+                self._movement_sum = math.fsum(step_lengths)
+                self._steps_since_resync = 0
+        self.last_positions.append((self.x, self.y))
     
     def _check_if_stuck(self):
         """Robot sıkışmış mı kontrol eder"""
-        if len(self.last_positions) >= 30:
-            # Son 30 pozisyonun ortalama hareketi
-            recent_positions = self.last_positions[-30:]
-            total_movement = 0
-            
-            for i in range(1, len(recent_positions)):
-                dx = recent_positions[i][0] - recent_positions[i-1][0]
-                dy = recent_positions[i][1] - recent_positions[i-1][1]
-                total_movement += math.sqrt(dx*dx + dy*dy)
-            
-            if total_movement < 20:  # Çok az hareket
+        # Son stuck_window pozisyon boyunca toplam hareket (O(1), artımlı toplam)
+        if len(self.last_positions) >= self.stuck_window:
+            if self._movement_sum < self.stuck_threshold:  # Çok az hareket
                 self.stuck_counter = 60
                 self.state = RobotState.STUCK
     
-    def _update_lidar(self, room_grid: List[List[int]], room_generator):
+    def _update_lidar(self, room_grid: np.ndarray, room_generator):
         """LiDAR sistemini günceller"""
         # LiDAR rotasyonu
         self.lidar_rotation += self.lidar_speed
         if self.lidar_rotation >= 2 * math.pi:
             self.lidar_rotation = 0
         
-        # Sadece dönen bölümdeki açıları güncelle (performans için)
-        scan_width = 30  # Aynı anda 30 açı tara
+        if self.lidar_mode == LidarMode.OFF:
+            return
+        
+        occupancy = self._ensure_map(room_generator)
+        room_x = self.x - self.sim_offset_x
+        room_y = self.y - self.sim_offset_y
+        if self.lidar_mode == LidarMode.FULL:
+            # Tüm ışınları tek seferde tara - lidar_data her tikte tamamen güncel
+            self.lidar_data = cast_rays_padded(
+                room_generator.padded_array(room_grid), room_generator.grid_size,
+                room_x, room_y, self._lidar_dir_x, self._lidar_dir_y, self.lidar_range
+            )
+            occupancy.integrate(room_x, room_y, self._lidar_dir_x, self._lidar_dir_y,
+                                self.lidar_data, self.lidar_range)
+            return
+        
+        # Sadece dönen bölümdeki açıları güncelle
         start_angle_index = int((self.lidar_rotation / (2 * math.pi)) * self.lidar_resolution)
         
-        for i in range(scan_width):
-            angle_index = (start_angle_index + i) % self.lidar_resolution
+        indices = [(start_angle_index + i) % self.lidar_resolution for i in range(self.lidar_sweep_width)]
+        for angle_index in indices:
             angle = (angle_index / self.lidar_resolution) * 2 * math.pi
             distance = self._lidar_scan(angle, room_grid, room_generator)
             self.lidar_data[angle_index] = distance
+        
+        # Haritaya işleme maliyeti büyük ölçüde sabit olduğundan ışınlar bir
+        # tur dolana kadar biriktirilip tek seferde işlenir
+        pending = self._pending_rays
+        pending.append((room_x, room_y, indices, self.lidar_data[indices]))
+        if len(pending) * self.lidar_sweep_width >= self.lidar_resolution:
+            indices = np.concatenate([ray[2] for ray in pending])
+            occupancy.integrate(
+                np.repeat([ray[0] for ray in pending], self.lidar_sweep_width),
+                np.repeat([ray[1] for ray in pending], self.lidar_sweep_width),
+                self._lidar_dir_x[indices], self._lidar_dir_y[indices],
+                np.concatenate([ray[3] for ray in pending]), self.lidar_range
+            )
+            pending.clear()
     
-    def _lidar_scan(self, angle: float, room_grid: List[List[int]], room_generator) -> float:
+    def _ensure_map(self, room_generator) -> OccupancyGrid:
+        """Doluluk haritasını odanın grid boyutlarıyla (gerekirse) oluşturur"""
+        if self.occupancy_map is None:
+            self.occupancy_map = OccupancyGrid(room_generator.grid_width, room_generator.grid_height,
+                                               room_generator.grid_size)
+        return self.occupancy_map
+    
+    def _lidar_scan(self, angle: float, room_grid: np.ndarray, room_generator) -> float:
         """Belirli açıda LiDAR taraması yapar"""
-        step_size = 1  # Daha hassas tarama
-        
-        for distance in range(self.radius + 2, self.lidar_range, step_size):
-            scan_x = self.x + math.cos(angle) * distance
-            scan_y = self.y + math.sin(angle) * distance
-            
-            # Grid koordinatlarına dönüştür
-            grid_scan_x = int(scan_x - self.sim_offset_x)
-            grid_scan_y = int(scan_y - self.sim_offset_y)
-            
-            # Sınır kontrolü
-            if (grid_scan_x < 0 or grid_scan_y < 0 or 
-                grid_scan_x >= room_generator.grid_width * room_generator.grid_size or 
-                grid_scan_y >= room_generator.grid_height * room_generator.grid_size):
-                return distance
-            
-            # Engel kontrolü
-            if not room_generator.is_valid_position(room_grid, grid_scan_x, grid_scan_y):
-                return distance
-        
-        return self.lidar_range
+        # Hücre-kesin ışın izleme: her grid hücresi bir kez ziyaret edilir
+        return cast_ray(room_generator.grid_rows(room_grid), room_generator.grid_size,
+                        self.x - self.sim_offset_x, self.y - self.sim_offset_y,
+                        angle, self.lidar_range)
     
     def _mark_cleaned_area(self):
         """Mevcut pozisyonu temizlenmiş olarak işaretle"""
@@ -247,186 +527,72 @@ class RobotVacuum:
         grid_x = int((self.x - self.sim_offset_x) // self.grid_size)
         grid_y = int((self.y - self.sim_offset_y) // self.grid_size)
         
-        # Robot çevresindeki alanı temizle
-        for dx in range(-1, 2):
-            for dy in range(-1, 2):
-                self.cleaned_area.add((grid_x + dx, grid_y + dy))
-    
-    def draw(self, screen: pygame.Surface):
-        """Robotu çizer"""
-        # Temizlenmiş alanları çiz
-        for (gx, gy) in self.cleaned_area:
-            rect = pygame.Rect(
-                gx * self.grid_size + self.sim_offset_x, 
-                gy * self.grid_size + self.sim_offset_y, 
-                self.grid_size, 
-                self.grid_size
-            )
-            pygame.draw.rect(screen, (200, 255, 200), rect)
-        
-        # Yol geçmişini çiz
-        if len(self.path_history) > 1:
-            for i in range(1, len(self.path_history)):
-                start_pos = self.path_history[i-1]
-                end_pos = self.path_history[i]
-                alpha = min(255, 50 + i * 2)  # Yakın geçmiş daha parlak
-                pygame.draw.line(screen, (150, 150, 255), start_pos, end_pos, 2)
-        
-        # Robot gövdesini çiz
-        pygame.draw.circle(screen, self.color, (int(self.x), int(self.y)), self.radius)
-        pygame.draw.circle(screen, (30, 100, 200), (int(self.x), int(self.y)), self.radius, 2)
-        
-        # LiDAR modülünü çiz (üstte dönen küçük daire)
-        lidar_radius = 4
-        lidar_y = self.y - 2  # Robot merkezinin biraz üstünde
-        pygame.draw.circle(screen, (20, 20, 20), (int(self.x), int(lidar_y)), lidar_radius)
-        pygame.draw.circle(screen, (255, 0, 0), (int(self.x), int(lidar_y)), lidar_radius, 1)
-        
-        # LiDAR rotasyon göstergesi
-        lidar_indicator_x = self.x + math.cos(self.lidar_rotation) * (lidar_radius - 1)
-        lidar_indicator_y = lidar_y + math.sin(self.lidar_rotation) * (lidar_radius - 1)
-        pygame.draw.circle(screen, (255, 100, 100), 
-                          (int(lidar_indicator_x), int(lidar_indicator_y)), 2)
-        
-        # Yön göstergesi
-        end_x = self.x + math.cos(self.angle) * (self.radius + 5)
-        end_y = self.y + math.sin(self.angle) * (self.radius + 5)
-        pygame.draw.line(screen, (255, 255, 255), 
-                        (int(self.x), int(self.y)), 
-                        (int(end_x), int(end_y)), 3)
-        
-        # Sensör alanını göster (debug)
-        sensor_points = []
-        for angle_offset in [-math.pi/6, 0, math.pi/6]:
-            sensor_angle = self.angle + angle_offset
-            sensor_x = self.x + math.cos(sensor_angle) * 20
-            sensor_y = self.y + math.sin(sensor_angle) * 20
-            sensor_points.append((sensor_x, sensor_y))
-        
-        for point in sensor_points:
-            pygame.draw.circle(screen, (255, 200, 100), (int(point[0]), int(point[1])), 3)
+        # Robot çevresindeki 3x3 alanı temizle (sadece boş hücreler sayılır)
+        if self.cleaned_area is not None:
+            if self.cleaned_area.mark_area(grid_x, grid_y):
+                self._ticks_since_clean = 0
+            else:
+                self._ticks_since_clean += 1
     
     def set_simulation_offset(self, offset_x: int, offset_y: int):
-        """Simülasyon offset değerlerini ayarlar"""
+        """
+        Simülasyon offset değerlerini ayarlar
+        
+        Offset değişirse (ör. büyük zeminde robotun yerel penceresi kaydığında)
+        hücre koordinatlarıyla tutulan harita ve plan geçersizdir ve atılır.
+        """
+        if (offset_x, offset_y) != (self.sim_offset_x, self.sim_offset_y):
+            self._clear_local_maps()
+            if self.state in (RobotState.RETURNING, RobotState.CLEANING):
+                self.state = RobotState.EXPLORING
         self.sim_offset_x = offset_x
         self.sim_offset_y = offset_y
     
+    def _clear_local_maps(self):
+        """Hücre koordinatlı durumu (doluluk haritası, planlayıcı, algılanan hücreler) atar"""
+        self.planner = None
+        self.navigation_goal = None
+        self.occupancy_map = None
+        self._pending_rays.clear()
+        self.known_obstacles = None
+        self._bumped_cell = None
+        self._sensed_cell = None
+    
     def reset(self, x: int, y: int):
         """Robotu sıfırlar"""
         self.x = float(x)
         self.y = float(y)
-        self.angle = random.uniform(0, 2 * math.pi)
+        self.start_x = x
+        self.start_y = y
+        self.angle = self.rng.uniform(0, 2 * math.pi)
         self.target_angle = self.angle
         self.state = RobotState.EXPLORING
         self.battery = 100
-        self.cleaned_area.clear()
+        if self.cleaned_area is not None:
+            self.cleaned_area.clear()
         self.path_history.clear()
         self.last_positions.clear()
+        self._step_lengths.clear()
+        self._movement_sum = 0.0
+        self._steps_since_resync = 0
         self.stuck_counter = 0
+        self.robot_contacts = 0
         self.wall_following = False
+        self._clear_local_maps()
+        self._ticks_since_clean = 0
+        self._navigation_ticks = 0
+        self._navigation_cooldown = 0
         
         # LiDAR'ı sıfırla
         self.lidar_rotation = 0
-        self.lidar_data = [0] * self.lidar_resolution
-    
-    def draw_lidar_view(self, screen: pygame.Surface, view_x: int, view_y: int, view_size: int):
-        """LiDAR görüntüsünü çizer - robotun gözünden radar tarzı"""
-        # LiDAR görüntü alanı
-        view_rect = pygame.Rect(view_x, view_y, view_size, view_size)
-        pygame.draw.rect(screen, (0, 0, 0), view_rect)  # Siyah arka plan
-        pygame.draw.rect(screen, (0, 255, 0), view_rect, 2)  # Yeşil çerçeve (radar tarzı)
-        
-        # Başlık
-        font = pygame.font.Font(None, 20)
-        title = font.render("RADAR VIEW", True, (0, 255, 0))
-        screen.blit(title, (view_x + 5, view_y - 22))
-        
-        # Merkez noktası (robot pozisyonu)
-        center_x = view_x + view_size // 2
-        center_y = view_y + view_size // 2
-        max_radius = view_size // 2 - 15
-        
-        # Radar çemberleri (mesafe göstergesi)
-        for i, radius in enumerate([max_radius//3, (max_radius*2)//3, max_radius]):
-            pygame.draw.circle(screen, (0, 100, 0), (center_x, center_y), radius, 1)
-            # Mesafe etiketleri
-            distance_label = f"{int((radius/max_radius) * self.lidar_range)}px"
-            label_surface = pygame.font.Font(None, 16).render(distance_label, True, (0, 150, 0))
-            screen.blit(label_surface, (center_x + radius - 25, center_y - 8))
-        
-        # Radar tarama çizgileri (sabit 8 yön)
-        for i in range(8):
-            angle = (i / 8) * 2 * math.pi
-            end_x = center_x + math.cos(angle) * max_radius
-            end_y = center_y + math.sin(angle) * max_radius
-            pygame.draw.line(screen, (0, 80, 0), (center_x, center_y), (int(end_x), int(end_y)), 1)
-        
-        # LiDAR verilerini engel noktaları olarak çiz
-        obstacle_points = []
-        for i, distance in enumerate(self.lidar_data):
-            if distance < self.lidar_range * 0.95:  # Sadece gerçek engelleri göster
-                angle = (i / self.lidar_resolution) * 2 * math.pi
-                
-                # Mesafeyi görüntü alanına ölçekle
-                scaled_distance = (distance / self.lidar_range) * max_radius
-                
-                # Engel noktasını hesapla
-                point_x = center_x + math.cos(angle) * scaled_distance
-                point_y = center_y + math.sin(angle) * scaled_distance
-                
-                # Mesafeye göre parlaklık (yakın=parlak yeşil, uzak=koyu yeşil)
-                distance_ratio = distance / self.lidar_range
-                if distance_ratio < 0.3:  # Çok yakın - kırmızı
-                    color = (255, int(100 + distance_ratio * 155), 0)
-                    size = 3
-                elif distance_ratio < 0.6:  # Orta mesafe - sarı
-                    color = (255, 255, int(distance_ratio * 255))
-                    size = 2
-                else:  # Uzak - yeşil
-                    color = (0, int(150 + distance_ratio * 105), 0)
-                    size = 2
-                
-                obstacle_points.append((int(point_x), int(point_y), color, size))
-        
-        # Engel noktalarını çiz
-        for point_x, point_y, color, size in obstacle_points:
-            pygame.draw.circle(screen, color, (point_x, point_y), size)
-            # Yakın engeller için glow efekti
-            if color[0] > 200:  # Kırmızı renkli yakın engeller
-                pygame.draw.circle(screen, (color[0]//3, color[1]//3, color[2]//3), 
-                                 (point_x, point_y), size + 2, 1)
-        
-        # Robot merkezi
-        pygame.draw.circle(screen, (255, 255, 255), (center_x, center_y), 4)
-        pygame.draw.circle(screen, (0, 255, 0), (center_x, center_y), 4, 1)
-        
-        # Robot yön göstergesi (dinamik)
-        direction_length = 20
-        direction_x = center_x + math.cos(self.angle) * direction_length
-        direction_y = center_y + math.sin(self.angle) * direction_length
-        pygame.draw.line(screen, (255, 255, 0), 
-                        (center_x, center_y), 
-                        (int(direction_x), int(direction_y)), 3)
-        
-        # LiDAR döner çizgi (tarama konumu)
-        scan_line_x = center_x + math.cos(self.lidar_rotation) * max_radius
-        scan_line_y = center_y + math.sin(self.lidar_rotation) * max_radius
-        pygame.draw.line(screen, (0, 255, 255), 
-                        (center_x, center_y), 
-                        (int(scan_line_x), int(scan_line_y)), 2)
-        
-        # Durumu göster
-        status_font = pygame.font.Font(None, 16)
-        status_text = f"Objects: {len(obstacle_points)}"
-        status_surface = status_font.render(status_text, True, (0, 200, 0))
-        screen.blit(status_surface, (view_x + 5, view_y + view_size - 20))
+        self.lidar_data = np.zeros(self.lidar_resolution)
     
     def get_status(self) -> dict:
         """Robot durumu bilgilerini döndürür"""
         return {
             'state': self.state.value,
             'battery': self.battery,
-            'cleaned_tiles': len(self.cleaned_area),
+            'cleaned_tiles': len(self.cleaned_area) if self.cleaned_area is not None else 0,
             'position': (int(self.x), int(self.y)),
             'lidar_rotation': self.lidar_rotation
         }
\ No newline at end of file
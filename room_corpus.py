@@ -0,0 +1,196 @@
+"""
+Oda Derlemi Modülü
+==================
+Önceden üretilmiş çok sayıda odayı (grid, başlangıç pozisyonu ve meta
+veriler) tek bir indeksli ikili dosyada saklar. Farklı makineler ve
+koşular aynı oda kümesini paylaşabilir; ölçümler birebir aynı girdilerle
+karşılaştırılır ve bölüm başına oda üretim süresi ortadan kalkar.
+
+Dosya biçimi (little-endian):
+    başlık: HEADER (sihirli sözcük, sürüm, oda sayısı, grid boyutları, derlem seed'i)
+    indeks: oda başına bir INDEX_DTYPE kaydı (oda seed'i, başlangıç, hücre ve bileşen sayıları)
+    gridler: GRID_ALIGN bayta hizalı, oda başına grid_height * grid_width bayt uint8
+
+Tüm odalar aynı boyutta olduğundan k. odanın konumu sabit genişlikten
+hesaplanır. Okuyucu dosyayı np.memmap ile açar; k. odaya O(1) erişilir ve
+aynı dosyayı açan süreçler (ör. sweep.py işçileri) işletim sisteminin
+sayfa önbelleğini paylaşır, odalar kopyalanmaz. Her oda kendi seed'iyle
+üretildiğinden tek başına da yeniden üretilebilir.
+
+Kullanım:
+    python room_corpus.py rooms.rvc --rooms 20000 --room-size 1000x700 --seed 0
+"""
+
+import argparse
+import os
+import random
+import struct
+import sys
+import time
+from typing import List, Tuple
+import numpy as np
+from room_generator import RoomGenerator
+
+MAGIC = b"RVRC"
+VERSION = 2
+HEADER = struct.Struct("<4sHIHHHq")
+GRID_ALIGN = 64
+
+# Oda başına indeks kaydı
+INDEX_DTYPE = np.dtype([
+    ('seed', '<u8'),            # Odayı üreten random.Random seed'i
+    ('start_x', '<i4'),         # Başlangıç pozisyonu (oda koordinatları, piksel)
+    ('start_y', '<i4'),
+    ('free_tiles', '<u4'),      # Boş hücre sayısı
+    ('obstacle_tiles', '<u4'),  # Engel hücre sayısı (1)
+    ('wall_tiles', '<u4'),      # Duvar hücre sayısı (2)
+    ('reachable_tiles', '<u4'), # Başlangıç pozisyonunun bağlı bileşenindeki boş hücre sayısı
+    ('components', '<u4'),      # Boş hücrelerin bağlı bileşen sayısı (free_cells)
+])
+
+def _grids_offset(room_count: int) -> int:
+    """Grid bölümünün dosyadaki konumu (indeksten sonra, hizalı)"""
+    offset = HEADER.size + INDEX_DTYPE.itemsize * room_count
+    return -(-offset // GRID_ALIGN) * GRID_ALIGN
+
+def build_corpus(path: str, room_count: int, width: int = 1000, height: int = 700,
+                 seed: int = 0, batch_size: int = 1024):
+    """
+    Odaları üretip derlem dosyasına yazar
+    
+    Dosya önce geçici bir yola yazılır ve tamamlanınca yerine taşınır;
+    yarıda kesilen bir üretim var olan derlemi bozmaz.
+    
+    Args:
+        path: Derlem dosyasının yolu
+        room_count: Üretilecek oda sayısı
+        width, height: Oda boyutu (piksel, Simulation'ın simülasyon alanı)
+        seed: Derlem seed'i (oda seed'leri bundan türetilir)
+        batch_size: Diske toplu yazılmadan önce bellekte biriktirilen oda sayısı
+    """
+    rng = random.Random(seed)
+    room_generator = RoomGenerator(width, height)
+    grid_width = room_generator.grid_width
+    grid_height = room_generator.grid_height
+    index = np.zeros(room_count, dtype=INDEX_DTYPE)
+    batch = np.empty((batch_size, grid_height, grid_width), dtype=np.uint8)
+    
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, room_count, room_generator.grid_size,
+                               grid_width, grid_height, seed))
+        # İndeks odalar üretildikçe doldurulur ve sonda yazılır
+        file.seek(_grids_offset(room_count))
+        for batch_start in range(0, room_count, batch_size):
+            count = min(batch_size, room_count - batch_start)
+            for i in range(count):
+                room_seed = rng.getrandbits(64)
+                room_generator.rng = random.Random(room_seed)
+                grid, start_pos = room_generator.generate_room()
+                free_cells = room_generator.free_cells(grid)
+                batch[i] = grid
+                index[batch_start + i] = (room_seed, start_pos[0], start_pos[1], 0, 0, 0,
+                                          free_cells.reachable_count, free_cells.component_count)
+            cells = batch[:count]
+            counts = index[batch_start:batch_start + count]
+            counts['free_tiles'] = np.count_nonzero(cells == 0, axis=(1, 2))
+            counts['obstacle_tiles'] = np.count_nonzero(cells == 1, axis=(1, 2))
+            counts['wall_tiles'] = np.count_nonzero(cells == 2, axis=(1, 2))
+            file.write(cells.tobytes())
+        file.seek(HEADER.size)
+        file.write(index.tobytes())
+    os.replace(temporary_path, path)
+
+class RoomCorpus:
+    def __init__(self, path: str):
+        """
+        Derlem okuyucu sınıfı; indeks ve gridler bellek eşlemeli açılır
+        
+        Args:
+            path: build_corpus ile yazılmış derlem dosyasının yolu
+        """
+        self.path = path
+        with open(path, "rb") as file:
+            header = file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            raise ValueError(f"derlem dosyası değil: {path}")
+        (magic, version, room_count, self.grid_size, self.grid_width, self.grid_height,
+         self.seed) = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError(f"derlem dosyası değil: {path}")
+        if version != VERSION:
+            raise ValueError(f"desteklenmeyen derlem sürümü: {version}")
+        offset = _grids_offset(room_count)
+        if os.path.getsize(path) < offset + room_count * self.grid_width * self.grid_height:
+            raise ValueError(f"derlem dosyası eksik: {path}")
+        
+        # Salt okunur eşlemeler; gridler sıradan ndarray görünümü olarak verilir
+        self.index = np.memmap(path, dtype=INDEX_DTYPE, mode='r', offset=HEADER.size,
+                               shape=(room_count,))
+        self.grids = np.memmap(path, dtype=np.uint8, mode='r', offset=offset,
+                               shape=(room_count, self.grid_height, self.grid_width)).view(np.ndarray)
+    
+    def __reduce__(self):
+        # İşçi süreçlere dosya içeriği değil yolu gönderilir; her süreç dosyayı kendisi eşler
+        return (RoomCorpus, (self.path,))
+    
+    def __len__(self) -> int:
+        return len(self.grids)
+    
+    @property
+    def width(self) -> int:
+        """Oda genişliği (piksel)"""
+        return self.grid_width * self.grid_size
+    
+    @property
+    def height(self) -> int:
+        """Oda yüksekliği (piksel)"""
+        return self.grid_height * self.grid_size
+    
+    def room(self, room_index: int) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """
+        k. oda (RoomGenerator.generate_room ile aynı biçimde)
+        
+        Dönen grid dosyaya bakan salt okunur bir görünümdür; kopyalanmaz.
+        """
+        record = self.index[room_index]
+        return self.grids[room_index], (int(record['start_x']), int(record['start_y']))
+    
+    def metadata(self, room_index: int) -> dict:
+        """k. odanın meta verileri (seed, başlangıç, hücre ve bileşen sayıları)"""
+        record = self.index[room_index]
+        return {name: int(record[name]) for name in INDEX_DTYPE.names}
+    
+    def regenerate(self, room_index: int) -> Tuple[np.ndarray, Tuple[int, int]]:
+        """k. odayı kayıtlı seed'inden yeniden üretir (derlemin üreticiyle tutarlılığını doğrulamak için)"""
+        room_generator = RoomGenerator(self.width, self.height,
+                                       random.Random(int(self.index[room_index]['seed'])))
+        return room_generator.generate_room()
+
+def parse_room_size(text: str) -> Tuple[int, int]:
+    """'1000x700' biçimindeki oda boyutunu ayrıştırır"""
+    try:
+        width, height = (int(part) for part in text.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"oda boyutu GENİŞLİKxYÜKSEKLİK olmalı: {text}")
+    return (width, height)
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Robot Vacuum Simulator oda derlemi oluşturucu")
+    parser.add_argument("output", help="derlem dosyasının yolu")
+    parser.add_argument("--rooms", type=int, default=10000, help="üretilecek oda sayısı")
+    parser.add_argument("--room-size", type=parse_room_size, default=(1000, 700),
+                        help="oda boyutu, örn. 1000x700 (varsayılan pencerenin simülasyon alanı)")
+    parser.add_argument("--seed", type=int, default=0, help="derlem seed'i")
+    args = parser.parse_args(argv)
+    
+    start = time.perf_counter()
+    build_corpus(args.output, args.rooms, *args.room_size, args.seed)
+    elapsed = time.perf_counter() - start
+    corpus = RoomCorpus(args.output)
+    print(f"{len(corpus)} rooms ({corpus.grid_width}x{corpus.grid_height} cells) written to "
+          f"{args.output} in {elapsed:.1f}s ({os.path.getsize(args.output) / 1e6:.1f} MB)",
+          file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
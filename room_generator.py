@@ -7,33 +7,47 @@ duvarlar ve mobilyalar içerebilir.
 
 import random
 import math
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+import numpy as np
+from config_space import ConfigurationSpace
+from distance_field import compute_distance_field, clearance_map
+from free_cells import FreeCellIndex
+from raycaster import pad_cells
 
 class RoomGenerator:
-    def __init__(self, width: int, height: int):
+    def __init__(self, width: int, height: int, rng: Optional[random.Random] = None):
         """
         Oda üretici sınıfı
         
         Args:
             width: Oda genişliği
             height: Oda yüksekliği
+            rng: Oda üretiminde kullanılan rastgele sayı üreteci (verilmezse yeni bir tane)
         """
+        self.rng = rng if rng is not None else random.Random()
         self.width = width
         self.height = height
         self.grid_size = 20  # Her grid karesi 20x20 pixel
         self.grid_width = width // self.grid_size
         self.grid_height = height // self.grid_size
         
-    def generate_room(self) -> Tuple[List[List[int]], Tuple[int, int]]:
+        # Son sorgulanan grid'den türetilen katmanlar (NumPy kopyası, mesafe alanı...)
+        self._layers_source = None
+        self._layers = {}
+        # is_valid_position için son grid'in satır görünümü (katman sözlüğüne uğramadan)
+        self._rows_source = None
+        self._rows = None
+        
+    def generate_room(self) -> Tuple[np.ndarray, Tuple[int, int]]:
         """
         Rastgele bir oda oluşturur
         
         Returns:
-            grid: 2D liste (0=boş, 1=engel, 2=duvar)
+            grid: 2D uint8 NumPy dizisi, [y, x] ile indekslenir (0=boş, 1=engel, 2=duvar)
             start_pos: Robot başlangıç pozisyonu
         """
         # Grid'i başlat (tüm hücreler boş)
-        grid = [[0 for _ in range(self.grid_width)] for _ in range(self.grid_height)]
+        grid = np.zeros((self.grid_height, self.grid_width), dtype=np.uint8)
         
         # Dış duvarları ekle
         self._add_outer_walls(grid)
@@ -42,7 +56,7 @@ class RoomGenerator:
         self._add_random_obstacles(grid)
         
         # L-şekilli odalar oluştur
-        if random.random() < 0.3:  # %30 şans
+        if self.rng.random() < 0.3:  # %30 şans
             self._create_l_shaped_room(grid)
         
         # Mobilya benzeri büyük engeller ekle
@@ -53,103 +67,190 @@ class RoomGenerator:
         
         return grid, start_pos
     
-    def _add_outer_walls(self, grid: List[List[int]]):
+    def _add_outer_walls(self, grid: np.ndarray):
         """Dış duvarları ekler"""
-        for i in range(self.grid_height):
-            for j in range(self.grid_width):
-                if i == 0 or i == self.grid_height-1 or j == 0 or j == self.grid_width-1:
-                    grid[i][j] = 2  # Duvar
+        grid[0, :] = 2  # Duvar
+        grid[-1, :] = 2
+        grid[:, 0] = 2
+        grid[:, -1] = 2
     
-    def _add_random_obstacles(self, grid: List[List[int]]):
+    def _add_random_obstacles(self, grid: np.ndarray):
         """Rastgele küçük engeller ekler"""
-        obstacle_count = random.randint(5, 15)
+        obstacle_count = self.rng.randint(5, 15)
         
         for _ in range(obstacle_count):
-            x = random.randint(2, self.grid_width - 3)
-            y = random.randint(2, self.grid_height - 3)
+            x = self.rng.randint(2, self.grid_width - 3)
+            y = self.rng.randint(2, self.grid_height - 3)
             
-            # Küçük engel grupları oluştur
-            size = random.randint(1, 3)
-            for dx in range(size):
-                for dy in range(size):
-                    if (x + dx < self.grid_width - 1 and 
-                        y + dy < self.grid_height - 1):
-                        grid[y + dy][x + dx] = 1  # Engel
-    
-    def _create_l_shaped_room(self, grid: List[List[int]]):
+            # Küçük engel grupları oluştur (dış duvarın içinde kalacak şekilde kırp)
+            size = self.rng.randint(1, 3)
+            grid[y:min(y + size, self.grid_height - 1),
+                 x:min(x + size, self.grid_width - 1)] = 1  # Engel
+    
+    def _create_l_shaped_room(self, grid: np.ndarray):
         """L-şekilli oda oluşturur"""
         # Odanın bir köşesini kapatır
-        corner = random.choice(['top-left', 'top-right', 'bottom-left', 'bottom-right'])
+        corner = self.rng.choice(['top-left', 'top-right', 'bottom-left', 'bottom-right'])
+        
+        block_width = self.rng.randint(3, 8)
+        block_height = self.rng.randint(3, 8)
         
-        block_width = random.randint(3, 8)
-        block_height = random.randint(3, 8)
+        top = slice(1, block_height)
+        bottom = slice(max(0, self.grid_height - block_height), self.grid_height - 1)
+        left = slice(1, block_width)
+        right = slice(max(0, self.grid_width - block_width), self.grid_width - 1)
         
         if corner == 'top-left':
-            for i in range(1, block_height):
-                for j in range(1, block_width):
-                    if i < self.grid_height and j < self.grid_width:
-                        grid[i][j] = 2
+            grid[top, left] = 2
         elif corner == 'top-right':
-            for i in range(1, block_height):
-                for j in range(self.grid_width - block_width, self.grid_width - 1):
-                    if i < self.grid_height and j >= 0:
-                        grid[i][j] = 2
+            grid[top, right] = 2
         elif corner == 'bottom-left':
-            for i in range(self.grid_height - block_height, self.grid_height - 1):
-                for j in range(1, block_width):
-                    if i >= 0 and j < self.grid_width:
-                        grid[i][j] = 2
+            grid[bottom, left] = 2
         elif corner == 'bottom-right':
-            for i in range(self.grid_height - block_height, self.grid_height - 1):
-                for j in range(self.grid_width - block_width, self.grid_width - 1):
-                    if i >= 0 and j >= 0:
-                        grid[i][j] = 2
+            grid[bottom, right] = 2
     
-    def _add_furniture(self, grid: List[List[int]]):
+    def _add_furniture(self, grid: np.ndarray):
         """Mobilya benzeri büyük engeller ekler"""
-        furniture_count = random.randint(2, 5)
+        furniture_count = self.rng.randint(2, 5)
         
         for _ in range(furniture_count):
             # Mobilya boyutu
-            width = random.randint(2, 4)
-            height = random.randint(2, 4)
+            width = self.rng.randint(2, 4)
+            height = self.rng.randint(2, 4)
             
             # Rastgele pozisyon
-            x = random.randint(3, self.grid_width - width - 3)
-            y = random.randint(3, self.grid_height - height - 3)
+            x = self.rng.randint(3, self.grid_width - width - 3)
+            y = self.rng.randint(3, self.grid_height - height - 3)
             
             # Mobilyayı yerleştir
-            for i in range(height):
-                for j in range(width):
-                    if (y + i < self.grid_height - 1 and 
-                        x + j < self.grid_width - 1):
-                        grid[y + i][x + j] = 1
-    
-    def _find_start_position(self, grid: List[List[int]]) -> Tuple[int, int]:
-        """Robot için uygun başlangıç pozisyonu bulur"""
-        attempts = 0
-        while attempts < 100:
-            x = random.randint(2, self.grid_width - 3)
-            y = random.randint(2, self.grid_height - 3)
-            
-            # Pozisyon boş mu ve etrafında yer var mı?
-            if (grid[y][x] == 0 and 
-                grid[y-1][x] == 0 and grid[y+1][x] == 0 and
-                grid[y][x-1] == 0 and grid[y][x+1] == 0):
-                return (x * self.grid_size + self.grid_size // 2, 
-                       y * self.grid_size + self.grid_size // 2)
-            
-            attempts += 1
+            grid[y:min(y + height, self.grid_height - 1),
+                 x:min(x + width, self.grid_width - 1)] = 1
+    
+    def _find_start_position(self, grid: np.ndarray,
+                             free_cells: Optional[FreeCellIndex] = None) -> Tuple[int, int]:
+        """
+        Robot için uygun başlangıç pozisyonu bulur
         
-        # Varsayılan pozisyon
-        return (50, 50)
+        Pozisyon, odanın en büyük bağlı bileşeninde çevresi (artı şeklindeki
+        5 hücre) boş hücrelerden rastgele seçilir (free_cells). Odanın boş
+        hücre indeksi verilmezse önbellekteki katman kullanılır.
+        """
+        index = free_cells if free_cells is not None else self.free_cells(grid)
+        x, y = index.random_start_cell(self.rng)
+        return (x * self.grid_size + self.grid_size // 2, 
+                y * self.grid_size + self.grid_size // 2)
+    
+    def random_start_position(self, grid: np.ndarray,
+                              free_cells: Optional[FreeCellIndex] = None) -> Tuple[int, int]:
+        """Mevcut odada rastgele bir başlangıç pozisyonu döndürür (oda yeniden üretilmez)"""
+        return self._find_start_position(grid, free_cells)
     
-    def is_valid_position(self, grid: List[List[int]], x: int, y: int) -> bool:
+    def is_valid_position(self, grid: np.ndarray, x: int, y: int) -> bool:
         """Verilen pozisyonun geçerli olup olmadığını kontrol eder"""
+        if grid is not self._rows_source:
+            self._rows = self.grid_rows(grid)
+            self._rows_source = grid
+        grid_x = x // self.grid_size
+        grid_y = y // self.grid_size
+        
+        if (0 <= grid_x < self.grid_width and 
+            0 <= grid_y < self.grid_height):
+            return self._rows[grid_y][grid_x] == 0
+        return False
+    
+    def _layer(self, grid: np.ndarray, name: str, build):
+        """
+        Grid'den türetilen bir katmanı önbellekten döndürür
+        
+        Katmanlar son sorgulanan grid nesnesi için bir kez oluşturulur; farklı
+        bir grid sorgulandığında önbellek temizlenir.
+        """
+        if grid is not self._layers_source:
+            self._layers_source = grid
+            self._layers = {}
+        layer = self._layers.get(name)
+        if layer is None:
+            layer = build(grid)
+            self._layers[name] = layer
+        return layer
+    
+    def invalidate_layers(self):
+        """Grid yerinde değiştirildiğinde türetilmiş katmanları geçersiz kılar"""
+        self._layers_source = None
+        self._layers = {}
+        self._rows_source = None
+        self._rows = None
+    
+    def grid_array(self, grid) -> np.ndarray:
+        """
+        Grid'i uint8 NumPy dizisi olarak döndürür
+        
+        generate_room çıktısı olduğu gibi döner; iç içe liste grid'ler
+        (eski kayıtlar, elle oluşturulan odalar) bir kez dönüştürülür.
+        """
+        if isinstance(grid, np.ndarray) and grid.dtype == np.uint8:
+            return grid
+        return self._layer(grid, 'array', lambda g: np.asarray(g, dtype=np.uint8))
+    
+    def grid_rows(self, grid: np.ndarray) -> List[List[int]]:
+        """
+        Grid'in iç içe liste görünümünü döndürür ([y][x] ile indekslenir)
+        
+        Tek hücre okumalarında liste indeksleme NumPy skaler indekslemeden
+        birkaç kat hızlıdır; ışın izleme ve çarpışma kontrolü gibi skaler
+        sıcak döngüler bu görünümü kullanır. Görünüm bir kopyadır: grid
+        yerinde değiştirilirse invalidate_layers çağrılmalıdır.
+        """
+        if isinstance(grid, list):
+            return grid
+        return self._layer(grid, 'rows', lambda g: g.tolist())
+    
+    def padded_array(self, grid: np.ndarray) -> np.ndarray:
+        """Grid'in tek hücrelik duvar çerçevesiyle çevrili kopyasını döndürür (ışın izleme için)"""
+        return self._layer(grid, 'padded', lambda g: pad_cells(self.grid_array(g)))
+    
+    def free_cells(self, grid: np.ndarray) -> FreeCellIndex:
+        """
+        Boş hücre indeksi ve bağlı bileşenler
+        
+        Bileşen sayısı önceden biliniyorsa (ör. derlem meta verisi) indeks
+        FreeCellIndex(grid, connected=True) ile doğrudan oluşturulup
+        kullanılmalıdır; bu katman her zaman etiketleme yapar.
+        """
+        return self._layer(grid, 'free_cells', lambda g: FreeCellIndex(self.grid_array(g)))
+    
+    def config_space(self, grid: np.ndarray, radius: float) -> ConfigurationSpace:
+        """
+        Verilen yarıçaplı robot gövdesi için şişirilmiş engel haritası
+        
+        Harita odanın güvenli yarıçap tablosunu da taşır; ön sensör mesafesi
+        açık alanda küre izleme ile ölçülür.
+        """
+        return self._layer(grid, f'config_space_{radius}',
+                           lambda g: ConfigurationSpace(self.grid_array(g), self.grid_size, radius,
+                                                        clearance=self.clearance_map(g)))
+    
+    def distance_field(self, grid: np.ndarray) -> np.ndarray:
+        """Her hücrenin en yakın engele Öklid mesafesini (hücre biriminde) döndürür"""
+        return self._layer(grid, 'distance_field',
+                           lambda g: compute_distance_field(self.grid_array(g)))
+    
+    def clearance_map(self, grid: np.ndarray) -> List[List[float]]:
+        """Hücre başına piksel cinsinden güvenli yarıçap tablosunu döndürür"""
+        return self._layer(grid, 'clearance',
+                           lambda g: clearance_map(self.distance_field(g), self.grid_size))
+    
+    def clearance(self, grid: np.ndarray, x: int, y: int) -> float:
+        """
+        Verilen noktadan en yakın engele olan mesafenin alt sınırı (O(1))
+        
+        Returns:
+            Piksel cinsinden güvenli yarıçap (oda dışında 0)
+        """
         grid_x = x // self.grid_size
         grid_y = y // self.grid_size
         
         if (0 <= grid_x < self.grid_width and 
             0 <= grid_y < self.grid_height):
-            return grid[grid_y][grid_x] == 0
-        return False
\ No newline at end of file
+            return self.clearance_map(grid)[grid_y][grid_x]
+        return 0.0
\ No newline at end of file
@@ -0,0 +1,407 @@
+"""
+İşçi Süreç Simülasyon Modülü
+============================
+Simülasyon çekirdeğini ayrı bir süreçte çalıştırır; pygame süreci sadece
+çizer. Yavaş bir tik çizimi, yavaş bir kare de simülasyonu bekletmez ve
+iki döngü ayrı çekirdeklerde çalışır (ağır filo veya LiDAR yüklerinde
+arayüz akıcı kalır).
+
+İşçi süreç Simulation ve FixedTimestep'i kendi içinde çalıştırır ve
+durumu multiprocessing.shared_memory üzerindeki çift tampona yazar:
+    
+    kontrol: son tamamlanan görüntünün yuvası
+    yuvalar: 2 x snapshot_dtype (robot durumları, ilk robotun LiDAR
+             verisi ve doluluk haritası, oda, temizlenebilir ve
+             temizlenmiş hücreler, tik ve hız bilgileri)
+
+İşçi her zaman son yayımlanmayan yuvaya yazar ve bitince kontrol
+indeksini o yuvaya çevirir; çizici son tamamlanan yuvayı yerel bir
+kopyaya alır. Her yuvanın kilidi sadece yazma ve kopyalama süresince
+tutulur, böylece yarım yazılmış bir görüntü okunmaz. Görüntü en fazla
+publish_interval aralıkla yayımlanır; yüksek hızlarda işçi yayımlama
+maliyetiyle yavaşlamaz.
+
+Komutlar (yeni oda, sıfırlama, hız) çiziciden işçiye bir Pipe ile gider.
+WorkerSimulation ve WorkerTimestep, Simulation ve FixedTimestep ile aynı
+arayüzü sunar; SimulationRenderer ve main.py döngüsü değişmeden kullanılır.
+"""
+
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+from typing import Optional
+import numpy as np
+from occupancy_grid import OccupancyGrid
+from robot_vacuum import LidarMode, RobotState
+from room_corpus import RoomCorpus
+from simulation import Simulation
+from timestep import SPEED_MULTIPLIERS, FixedTimestep
+
+# Durumlar görüntüde sıra numarasıyla saklanır
+STATES = list(RobotState)
+STATE_INDEX = {state: index for index, state in enumerate(STATES)}
+
+# Robot başına görüntü kaydı
+ROBOT_DTYPE = np.dtype([
+    ('x', '<f8'),
+    ('y', '<f8'),
+    ('angle', '<f4'),
+    ('battery', '<f4'),
+    ('lidar_rotation', '<f4'),
+    ('state', 'u1'),
+])
+
+# Kontrol bölümü (son tamamlanan yuva); yuvalar hizalı başlasın diye 64 bayt
+CONTROL_SIZE = 64
+
+# Çiziciden işçiye gönderilebilen komutlar
+SIMULATION_COMMANDS = ('generate_new_room', 'reset_robot')
+TIMESTEP_COMMANDS = ('set_speed', 'faster', 'slower')
+
+def snapshot_dtype(robot_count: int, lidar_resolution: int, grid_width: int, grid_height: int) -> np.dtype:
+    """Tek bir görüntü yuvasının düzeni"""
+    grid_shape = (grid_height, grid_width)
+    return np.dtype([
+        ('sequence', '<u8'),            # Yayım sayacı (0: henüz yayımlanmadı)
+        ('tick', '<i8'),                # simulation_time
+        ('room_version', '<u4'),        # Oda her değiştiğinde artar
+        ('coverage_generation', '<u4'), # CoverageMap.generation
+        ('total_tiles', '<u4'),
+        ('occupancy_version', '<u4'),   # İlk robotun doluluk haritası her değiştiğinde artar (0: harita yok)
+        ('speed_index', 'u1'),
+        ('ticks_per_second', '<f8'),
+        ('robots', ROBOT_DTYPE, (robot_count,)),
+        ('lidar', '<f4', (lidar_resolution,)),
+        ('room', 'u1', grid_shape),
+        ('cleanable', '?', grid_shape),
+        ('cleaned', '?', grid_shape),
+        ('occupancy', '<f4', grid_shape),
+    ], align=True)
+
+def _snapshot_views(buffer, dtype: np.dtype):
+    """Paylaşılan bellek üzerindeki kontrol ve yuva görünümleri"""
+    control = np.ndarray((1,), dtype='<i8', buffer=buffer)
+    slots = np.ndarray((2,), dtype=dtype, buffer=buffer, offset=CONTROL_SIZE)
+    return control, slots
+
+class _Publisher:
+    def __init__(self, simulation: Simulation, timestep: FixedTimestep, buffer, dtype: np.dtype, locks):
+        """İşçi tarafı: simülasyon durumunu çift tampona yazar"""
+        self.simulation = simulation
+        self.timestep = timestep
+        self.control, self.slots = _snapshot_views(buffer, dtype)
+        self.locks = locks
+        self.sequence = 0
+        self._room = None
+        self._room_version = 0
+        self._occupancy_key = None
+        self._occupancy_version = 0
+    
+    def publish(self):
+        """Güncel durumu yayımlanmayan yuvaya yazar ve yuvayı son görüntü yapar"""
+        sim = self.simulation
+        if sim.room_grid is not self._room:
+            self._room = sim.room_grid
+            self._room_version += 1
+        robot = sim.robot
+        occupancy = robot.occupancy_map
+        occupancy_key = None if occupancy is None else (id(occupancy), occupancy.version)
+        if occupancy_key != self._occupancy_key:
+            self._occupancy_key = occupancy_key
+            self._occupancy_version += 1
+        
+        slot_index = 1 - int(self.control[0])
+        slot = self.slots[slot_index]
+        with self.locks[slot_index]:
+            self.sequence += 1
+            slot['sequence'] = self.sequence
+            slot['tick'] = sim.simulation_time
+            slot['room_version'] = self._room_version
+            slot['coverage_generation'] = sim.cleaned_area.generation
+            slot['total_tiles'] = sim.total_tiles
+            slot['occupancy_version'] = 0 if occupancy is None else self._occupancy_version
+            slot['speed_index'] = self.timestep.speed_index
+            slot['ticks_per_second'] = self.timestep.ticks_per_second
+            slot['robots'] = [(r.x, r.y, r.angle, r.battery, r.lidar_rotation, STATE_INDEX[r.state])
+                              for r in sim.robots]
+            slot['lidar'] = robot.lidar_data
+            slot['room'] = sim.room_generator.grid_array(sim.room_grid)
+            slot['cleanable'] = sim.cleaned_area.free
+            slot['cleaned'] = sim.cleaned_area.cleaned
+            if occupancy is not None:
+                slot['occupancy'] = occupancy.log_odds
+        self.control[0] = slot_index
+
+def run_worker(config: dict, memory_name: str, dtype: np.dtype, locks, connection,
+               tick_rate: int, publish_interval: float):
+    """
+    İşçi süreç ana döngüsü
+    
+    Komutları işler, simülasyonu gerçek süre ve hız çarpanına göre
+    ilerletir ve en fazla publish_interval aralıkla görüntü yayımlar.
+    Çizici süreç kapanırsa (Pipe kopar) döngü biter.
+    """
+    memory = shared_memory.SharedMemory(name=memory_name)
+    publisher = None
+    try:
+        try:
+            simulation = Simulation(**config)
+            timestep = FixedTimestep(simulation, tick_rate=tick_rate)
+            publisher = _Publisher(simulation, timestep, memory.buf, dtype, locks)
+            publisher.publish()
+        except Exception as error:
+            connection.send(('error', f"{type(error).__name__}: {error}"))
+            raise
+        connection.send(('ready', simulation.seed))
+        
+        previous = last_publish = time.perf_counter()
+        pending = False  # Yayımlanmamış değişiklik var mı
+        while True:
+            while connection.poll():
+                command, *args = connection.recv()
+                if command == 'stop':
+                    return
+                if command in SIMULATION_COMMANDS:
+                    getattr(simulation, command)(*args)
+                elif command in TIMESTEP_COMMANDS:
+                    getattr(timestep, command)(*args)
+                pending = True
+            
+            now = time.perf_counter()
+            pending |= timestep.advance(now - previous) > 0
+            previous = now
+            if pending and now - last_publish >= publish_interval:
+                publisher.publish()
+                last_publish = now
+                pending = False
+            
+            if timestep.speed is not None:
+                # Bir sonraki tike kadar komut bekle (işçi boşta dönmez)
+                connection.poll(1 / (tick_rate * timestep.speed))
+    except (EOFError, BrokenPipeError):
+        pass
+    finally:
+        # Bellek görünümleri kapatılmadan önce bırakılmalı
+        publisher = None
+        memory.close()
+
+class WorkerSimulation(Simulation):
+    def __init__(self, width: int, height: int, robot_count: int = 1,
+                 lidar_mode: LidarMode = LidarMode.FULL, seed: Optional[int] = None,
+                 corpus: Optional[RoomCorpus] = None, room_index: int = 0,
+                 tick_rate: int = 60, publish_interval: float = 1 / 120, start_timeout: float = 60.0):
+        """
+        İşçi süreçte çalışan simülasyonun çizici tarafı
+        
+        Simulation ile aynı arayüzü sunar. step() robot kararlarını
+        çalıştırmaz; işçinin son görüntüsü robotlara, odaya ve temizlik
+        haritasına uygulanır. Yol izi görüntülerdeki konumlardan oluşturulur
+        ve sadece ilk robotun LiDAR verisi ve doluluk haritası aktarılır.
+        Profilleyici bu süreçteki çizim ve görüntü kopyalama sürelerini ölçer.
+        
+        Args:
+            width, height, robot_count, lidar_mode, seed, corpus, room_index:
+                İşçideki Simulation'ın parametreleri
+            tick_rate: 1x hızda saniyedeki tik sayısı (işçideki FixedTimestep)
+            publish_interval: İşçinin görüntü yayımlama aralığı (saniye)
+            start_timeout: İşçinin ilk görüntüyü yayımlaması için beklenen en fazla süre
+        
+        Raises:
+            RuntimeError: İşçi süreç başlatılamazsa
+        """
+        # Seed burada seçilir ki iki süreç aynı simülasyonu kursun
+        super().__init__(width, height, robot_count, lidar_mode, seed, corpus, room_index)
+        config = dict(width=width, height=height, robot_count=robot_count, lidar_mode=lidar_mode,
+                      seed=self.seed, corpus=corpus, room_index=room_index)
+        room_generator = self.room_generator
+        dtype = snapshot_dtype(robot_count, self.robot.lidar_resolution,
+                               room_generator.grid_width, room_generator.grid_height)
+        self._memory = shared_memory.SharedMemory(create=True, size=CONTROL_SIZE + 2 * dtype.itemsize)
+        self._control, self._slots = _snapshot_views(self._memory.buf, dtype)
+        self._control[0] = 1  # İlk yayım 0. yuvaya yazılır
+        self._snapshot = np.zeros((), dtype=dtype)
+        self._sequence = 0
+        self._room_version = None
+        self._coverage_generation = None
+        self._occupancy_version = 0
+        self.speed_index = 0
+        self.ticks_per_second = 0.0
+        
+        # pygame durumu kopyalanmasın diye işçi fork yerine spawn ile başlatılır
+        context = multiprocessing.get_context('spawn')
+        self._locks = (context.Lock(), context.Lock())
+        self._connection, worker_connection = context.Pipe()
+        self._process = context.Process(
+            target=run_worker, name="simulation-worker", daemon=True,
+            args=(config, self._memory.name, dtype, self._locks, worker_connection,
+                  tick_rate, publish_interval))
+        self._process.start()
+        worker_connection.close()
+        try:
+            message = self._connection.recv() if self._connection.poll(start_timeout) else ('error', "zaman aşımı")
+        except EOFError:
+            message = ('error', "süreç kapandı")
+        if message[0] != 'ready':
+            self.close()
+            raise RuntimeError(f"simülasyon işçisi başlatılamadı: {message[1]}")
+        self.sync()
+    
+    @property
+    def alive(self) -> bool:
+        """İşçi süreç çalışıyor mu"""
+        return self._process is not None and self._process.is_alive()
+    
+    def _send(self, command: str, *args):
+        """İşçiye komut gönderir (işçi kapandıysa yok sayılır)"""
+        if self.alive:
+            try:
+                self._connection.send((command, *args))
+            except (BrokenPipeError, OSError):
+                pass
+    
+    def sync(self) -> int:
+        """
+        İşçinin son görüntüsünü uygular
+        
+        Returns:
+            Önceki görüntüden beri işçide çalışan tik sayısı
+        """
+        profiler = self.profiler
+        start = profiler.clock() if profiler is not None else 0.0
+        slot_index = int(self._control[0])
+        with self._locks[slot_index]:
+            if self._slots[slot_index]['sequence'] == self._sequence:
+                return 0
+            self._snapshot[...] = self._slots[slot_index]
+        snapshot = self._snapshot
+        self._sequence = int(snapshot['sequence'])
+        ticks = int(snapshot['tick']) - self.simulation_time
+        self.simulation_time = int(snapshot['tick'])
+        self.speed_index = int(snapshot['speed_index'])
+        self.ticks_per_second = float(snapshot['ticks_per_second'])
+        
+        # Oda veya temizlik haritası sıfırlandıysa yerel harita baştan kurulur
+        room_version = int(snapshot['room_version'])
+        coverage_generation = int(snapshot['coverage_generation'])
+        if room_version != self._room_version:
+            self._room_version = room_version
+            self.room_grid = snapshot['room'].copy()
+            self._coverage_generation = None
+        if coverage_generation != self._coverage_generation:
+            self._coverage_generation = coverage_generation
+            self.cleaned_area.reset(self.room_grid, snapshot['cleanable'])
+            for robot in self.robots:
+                robot.path_history.clear()
+        self.cleaned_area.load(snapshot['cleaned'])
+        self.total_tiles = int(snapshot['total_tiles'])
+        
+        for robot, record in zip(self.robots, snapshot['robots'].tolist()):
+            robot.x, robot.y, robot.angle, robot.battery, robot.lidar_rotation, state = record
+            robot.state = STATES[state]
+            if ticks > 0:
+                robot.path_history.append((int(robot.x), int(robot.y)))
+        robot = self.robot
+        robot.lidar_data = snapshot['lidar'].astype(float)
+        
+        occupancy_version = int(snapshot['occupancy_version'])
+        if occupancy_version == 0:
+            robot.occupancy_map = None
+        elif occupancy_version != self._occupancy_version:
+            if robot.occupancy_map is None:
+                robot.occupancy_map = OccupancyGrid(self.room_generator.grid_width,
+                                                    self.room_generator.grid_height,
+                                                    self.room_generator.grid_size)
+            robot.occupancy_map.log_odds[...] = snapshot['occupancy']
+            robot.occupancy_map.version += 1
+        self._occupancy_version = occupancy_version
+        if profiler is not None:
+            profiler.lap('sync', start)
+        return max(ticks, 0)
+    
+    def step(self):
+        """Simülasyon işçide ilerler; son görüntüyü uygular"""
+        self.sync()
+    
+    def generate_new_room(self):
+        """İşçide yeni oda oluşturur (görüntü bir sonraki sync ile gelir)"""
+        self._send('generate_new_room')
+    
+    def reset_robot(self):
+        """İşçide robotları sıfırlar"""
+        self._send('reset_robot')
+    
+    def close(self, timeout: float = 2.0):
+        """İşçiyi durdurur ve paylaşılan belleği serbest bırakır"""
+        if self._process is not None:
+            self._send('stop')
+            self._process.join(timeout)
+            if self._process.is_alive():
+                self._process.terminate()
+                self._process.join()
+            self._process = None
+            self._connection.close()
+        if self._memory is not None:
+            # Bellek görünümleri kapatılmadan önce bırakılmalı
+            self._control = self._slots = None
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
+    
+    def __enter__(self) -> "WorkerSimulation":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+class WorkerTimestep:
+    def __init__(self, simulation: WorkerSimulation):
+        """
+        FixedTimestep ile aynı arayüz; hız komutları işçiye gönderilir
+        
+        Tikler işçide çalışır; advance() sadece son görüntüyü uygular.
+        Hız ve tik hızı göstergesi işçinin yayımladığı değerlerdir.
+        """
+        self.simulation = simulation
+        self.total_ticks = 0
+    
+    @property
+    def speed_index(self) -> int:
+        return self.simulation.speed_index
+    
+    @property
+    def speed(self) -> Optional[int]:
+        """Geçerli hız çarpanı (None: en yüksek hız)"""
+        return SPEED_MULTIPLIERS[self.speed_index]
+    
+    @property
+    def speed_label(self) -> str:
+        """Hız çarpanının ekranda gösterilen adı"""
+        return "MAX" if self.speed is None else f"{self.speed}x"
+    
+    @property
+    def ticks_per_second(self) -> float:
+        """İşçideki son bir saniyelik tik hızı"""
+        return self.simulation.ticks_per_second
+    
+    def set_speed(self, index: int):
+        """Hız çarpanını SPEED_MULTIPLIERS içindeki sırasıyla seçer"""
+        self.simulation._send('set_speed', index)
+    
+    def faster(self):
+        """Bir sonraki hız çarpanına geçer"""
+        self.simulation._send('faster')
+    
+    def slower(self):
+        """Bir önceki hız çarpanına geçer"""
+        self.simulation._send('slower')
+    
+    def advance(self, frame_time: float) -> int:
+        """
+        İşçinin son görüntüsünü uygular (frame_time kullanılmaz; süre işçide ölçülür)
+        
+        Returns:
+            Önceki kareden beri işçide çalışan tik sayısı
+        """
+        ticks = self.simulation.sync()
+        self.total_ticks += ticks
+        return ticks
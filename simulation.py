@@ -1,26 +1,48 @@
 """
 Simülasyon Modülü
 ================
-Ana simülasyon sınıfı. Oda üretimi, robot yönetimi ve
-görselleştirme işlemlerini koordine eder.
+Ana simülasyon sınıfı. Oda üretimi, robot yönetimi ve istatistikleri
+koordine eder. Bu modül pygame'e bağımlı değildir; görselleştirme
+için renderer modülündeki SimulationRenderer kullanılır.
 """
 
-import pygame
 import random
 import math
-from typing import List, Tuple
-from robot_vacuum import RobotVacuum
+from typing import List, Optional, Tuple
+import numpy as np
+from coverage_map import CoverageMap
+from free_cells import FreeCellIndex
+from profiler import PhaseProfiler
+from robot_vacuum import RobotVacuum, LidarMode
+from room_corpus import RoomCorpus
 from room_generator import RoomGenerator
+from spatial_hash import SpatialHash
 
 class Simulation:
-    def __init__(self, width: int, height: int):
+    def __init__(self, width: int, height: int, robot_count: int = 1,
+                 lidar_mode: LidarMode = LidarMode.FULL, seed: Optional[int] = None,
+                 corpus: Optional[RoomCorpus] = None, room_index: int = 0):
         """
         Simülasyon sınıfı
         
+        Oda üretici ve her robot, seed'den türetilen kendi random.Random
+        üretecini kullanır; aynı seed ile aynı odalar ve aynı robot kararları
+        elde edilir. Global random modülünün durumu kullanılmaz ve değişmez.
+        
         Args:
             width: Ekran genişliği
             height: Ekran yüksekliği
+            robot_count: Aynı odayı paylaşan robot sayısı (1'den fazlası filo modu)
+            lidar_mode: Robotların LiDAR tarama modu
+            seed: Rastgele sayı tohumu (verilmezse rastgele seçilir ve self.seed'de saklanır)
+            corpus: Verilirse odalar üretilmez, bu derlemden sırayla yüklenir
+            room_index: Derlemden yüklenecek ilk oda
         """
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        
         self.width = width
         self.height = height
         
@@ -31,245 +53,218 @@ class Simulation:
         self.sim_offset_y = 50
         
         # Oda üretici
-        self.room_generator = RoomGenerator(self.sim_width, self.sim_height)
-        
-        # İlk odayı oluştur
-        self.room_grid, start_pos = self.room_generator.generate_room()
-        
-        # Robot süpürgeyi oluştur
-        self.robot = RobotVacuum(
-            start_pos[0] + self.sim_offset_x, 
-            start_pos[1] + self.sim_offset_y, 
-            self.room_generator.grid_size
-        )
-        # Offset bilgisini robota ilet
-        self.robot.set_simulation_offset(self.sim_offset_x, self.sim_offset_y)
+        self.room_generator = RoomGenerator(self.sim_width, self.sim_height, self._derive_rng())
+        
+        # İlk odayı oluştur (derlem verildiyse derlemden al)
+        self.corpus = corpus
+        self.room_index = room_index
+        if corpus is not None:
+            if (corpus.grid_width, corpus.grid_height) != (self.room_generator.grid_width,
+                                                           self.room_generator.grid_height):
+                raise ValueError(f"derlem odaları {corpus.width}x{corpus.height}, simülasyon alanı "
+                                 f"{self.sim_width}x{self.sim_height}")
+            self.room_grid, start_pos, self.free_cells = self._corpus_room(room_index)
+        else:
+            self.room_grid, start_pos = self.room_generator.generate_room()
+            self.free_cells = self.room_generator.free_cells(self.room_grid)
+        self.cleaned_area = CoverageMap(self.room_grid)
+        
+        # Robot süpürgeleri oluştur; filo tek bir temizlik haritasını paylaşır
+        self.robots = []
+        for _ in range(robot_count):
+            robot = RobotVacuum(
+                start_pos[0] + self.sim_offset_x, 
+                start_pos[1] + self.sim_offset_y, 
+                self.room_generator.grid_size,
+                lidar_mode,
+                self._derive_rng()
+            )
+            # Offset bilgisini robota ilet
+            robot.set_simulation_offset(self.sim_offset_x, self.sim_offset_y)
+            robot.cleaned_area = self.cleaned_area
+            self.robots.append(robot)
+        self.robot = self.robots[0]  # Tek robotlu kullanım ve LiDAR görüntüsü için
+        
+        # Robot-robot komşu sorguları için uzamsal hash (sadece filo modunda)
+        self.spatial_hash = SpatialHash(self.room_generator.grid_size) if robot_count > 1 else None
+        self._place_robots(start_pos)
+        self._reset_coverage()
         
         # Simülasyon istatistikleri
-        self.total_tiles = self._count_empty_tiles()
         self.simulation_time = 0
         
-        # Fontlar
-        pygame.font.init()
-        self.font_large = pygame.font.Font(None, 32)
-        self.font_medium = pygame.font.Font(None, 24)
-        self.font_small = pygame.font.Font(None, 20)
+        # Aşama süresi ölçümü (opsiyonel)
+        self.profiler: Optional[PhaseProfiler] = None
+    
+    def _derive_rng(self) -> random.Random:
+        """Simülasyon seed'inden bağımsız bir alt rastgele sayı üreteci türetir"""
+        return random.Random(self.rng.getrandbits(64))
     
     def generate_new_room(self):
-        """Yeni bir oda oluşturur"""
-        self.room_grid, start_pos = self.room_generator.generate_room()
-        self.robot.reset(
-            start_pos[0] + self.sim_offset_x, 
-            start_pos[1] + self.sim_offset_y
-        )
-        self.robot.set_simulation_offset(self.sim_offset_x, self.sim_offset_y)
-        self.total_tiles = self._count_empty_tiles()
+        """Yeni bir oda oluşturur (derlem kullanılıyorsa derlemin bir sonraki odasını yükler)"""
+        if self.corpus is not None:
+            self.room_index = (self.room_index + 1) % len(self.corpus)
+            self.load_room(*self._corpus_room(self.room_index))
+        else:
+            self.load_room(*self.room_generator.generate_room())
+    
+    def load_room(self, grid: np.ndarray, start_pos: Tuple[int, int],
+                  free_cells: Optional[FreeCellIndex] = None):
+        """
+        Verilen odayı yükler ve robotları yerleştirir
+        
+        Args:
+            grid: Oda grid'i (uint8 NumPy dizisi, 0=boş)
+            start_pos: İlk robotun başlangıç pozisyonu (oda koordinatları)
+            free_cells: Odanın boş hücre indeksi (verilmezse grid'den hesaplanır)
+        """
+        self.room_grid = grid
+        self.free_cells = free_cells if free_cells is not None else self.room_generator.free_cells(grid)
+        self._place_robots(start_pos)
+        self._reset_coverage()
         self.simulation_time = 0
     
+    def _corpus_room(self, room_index: int) -> Tuple[np.ndarray, Tuple[int, int], FreeCellIndex]:
+        """
+        Derlemin k. odası, başlangıç pozisyonu ve boş hücre indeksi; tek
+        bileşenli odalarda etiketleme yapılmaz (derlem meta verisinden)
+        """
+        grid, start_pos = self.corpus.room(room_index)
+        connected = self.corpus.index[room_index]['components'] == 1
+        return grid, start_pos, FreeCellIndex(grid, connected)
+    
+    def _reset_coverage(self):
+        """
+        Temizlik haritasını robotların ulaşabildiği hücrelerle baştan oluşturur
+        
+        Kapsama oranı sadece robotların başlangıç hücrelerinin bağlı
+        bileşenlerine göre hesaplanır; kapalı kalmış boş hücreler sayılmaz.
+        """
+        grid_size = self.room_generator.grid_size
+        cells = [(int(robot.x - self.sim_offset_x) // grid_size, int(robot.y - self.sim_offset_y) // grid_size)
+                 for robot in self.robots]
+        reachable = self.free_cells.reachable_from(cells)
+        self.cleaned_area.reset(self.room_grid, reachable)
+        self.total_tiles = self.cleaned_area.total_tiles
+    
     def reset_robot(self):
         """Robotu mevcut odada sıfırlar"""
-        _, start_pos = self.room_generator.generate_room()  # Sadece pozisyon için
-        self.robot.reset(
-            start_pos[0] + self.sim_offset_x, 
-            start_pos[1] + self.sim_offset_y
-        )
-        self.robot.set_simulation_offset(self.sim_offset_x, self.sim_offset_y)
+        self._place_robots(self.room_generator.random_start_position(self.room_grid, self.free_cells))
         self.simulation_time = 0
     
-    def update(self):
-        """Simülasyonu günceller"""
-        self.simulation_time += 1
-        
-        # Robotu güncelle - offset'i robot sınıfına ilet
-        self.robot.update(self.room_grid, self.room_generator)
+    def _place_robots(self, start_pos: Tuple[int, int]):
+        """
+        Robotları odaya yerleştirir
         
-        # Yol geçmişini kaydet (doğru ekran koordinatlarında)
-        self.robot.path_history.append((int(self.robot.x), int(self.robot.y)))
-        if len(self.robot.path_history) > 500:
-            self.robot.path_history.pop(0)
+        İlk robot start_pos'a konur; diğerleri birbirleriyle çakışmayan
+        rastgele başlangıç pozisyonlarına dağıtılır.
+        """
+        if self.spatial_hash is not None:
+            self.spatial_hash.clear()
+        
+        for i, robot in enumerate(self.robots):
+            position = start_pos
+            for _ in range(20):
+                if i == 0 or not self._spawn_blocked(position, robot.radius):
+                    break
+                position = self.room_generator.random_start_position(self.room_grid, self.free_cells)
+            
+            robot.reset(
+                position[0] + self.sim_offset_x, 
+                position[1] + self.sim_offset_y
+            )
+            robot.set_simulation_offset(self.sim_offset_x, self.sim_offset_y)
+            robot.config_space = None  # Yeni odanın çarpışma haritası ilk harekette oluşturulur
+            if self.spatial_hash is not None:
+                self.spatial_hash.insert(robot, robot.x, robot.y)
     
-    def draw(self, screen: pygame.Surface):
-        """Simülasyonu çizer"""
-        # Arka plan
-        sim_rect = pygame.Rect(self.sim_offset_x, self.sim_offset_y, 
-                              self.sim_width, self.sim_height)
-        pygame.draw.rect(screen, (250, 250, 250), sim_rect)
-        pygame.draw.rect(screen, (200, 200, 200), sim_rect, 2)
-        
-        # Odayı çiz
-        self._draw_room(screen)
-        
-        # Robotu çiz
-        self.robot.draw(screen)
+    def _spawn_blocked(self, position: Tuple[int, int], radius: int) -> bool:
+        """Başlangıç pozisyonu yerleştirilmiş bir robotla çakışıyor mu"""
+        x = position[0] + self.sim_offset_x
+        y = position[1] + self.sim_offset_y
+        for other in self.spatial_hash.query(x, y, 2 * radius):
+            if (other.x - x) ** 2 + (other.y - y) ** 2 < (2 * radius) ** 2:
+                return True
+        return False
+    
+    def enable_profiling(self, window: int = 1024) -> PhaseProfiler:
+        """
+        Tik aşamalarının (ve bağlı çiziciyse çizim aşamalarının) süre ölçümünü açar
         
-        # LiDAR görüntüsünü çiz (sağ üst köşe)
-        lidar_view_size = 180
-        lidar_view_x = self.width - lidar_view_size - 10
-        lidar_view_y = 50
-        self.robot.draw_lidar_view(screen, lidar_view_x, lidar_view_y, lidar_view_size)
+        Args:
+            window: Aşama başına yüzdeliklerin hesaplandığı son ölçüm sayısı
         
-        # UI'yi çiz
-        self._draw_ui(screen)
+        Returns:
+            Tüm robotların paylaştığı profilleyici
+        """
+        if self.profiler is None:
+            self.profiler = PhaseProfiler(window)
+        for robot in self.robots:
+            robot.profiler = self.profiler
+        return self.profiler
     
-    def _draw_room(self, screen: pygame.Surface):
-        """Odayı çizer"""
-        grid_size = self.room_generator.grid_size
-        
-        for y in range(len(self.room_grid)):
-            for x in range(len(self.room_grid[0])):
-                rect = pygame.Rect(
-                    x * grid_size + self.sim_offset_x,
-                    y * grid_size + self.sim_offset_y,
-                    grid_size,
-                    grid_size
-                )
-                
-                cell_value = self.room_grid[y][x]
-                
-                if cell_value == 1:  # Engel
-                    pygame.draw.rect(screen, (139, 69, 19), rect)  # Kahverengi
-                    pygame.draw.rect(screen, (101, 67, 33), rect, 1)
-                elif cell_value == 2:  # Duvar
-                    pygame.draw.rect(screen, (64, 64, 64), rect)  # Koyu gri
-                    pygame.draw.rect(screen, (32, 32, 32), rect, 1)
+    def disable_profiling(self):
+        """Süre ölçümünü kapatır (ölçülen kod tekrar ek maliyetsiz çalışır)"""
+        self.profiler = None
+        for robot in self.robots:
+            robot.profiler = None
     
-    def _draw_ui(self, screen: pygame.Surface):
-        """Kullanıcı arayüzünü çizer"""
-        # Robot durumu
-        status = self.robot.get_status()
-        
-        # Sol panel - Robot durumu (kompakt)
-        panel_x = 10
-        panel_y = 80
-        
-        # Ana durum kutusu
-        status_box = pygame.Rect(panel_x - 5, panel_y - 5, 180, 160)
-        pygame.draw.rect(screen, (240, 240, 240), status_box)
-        pygame.draw.rect(screen, (180, 180, 180), status_box, 2)
-        
-        # Başlık
-        title = self.font_large.render("🤖 ROBOT STATUS", True, (50, 50, 50))
-        screen.blit(title, (panel_x, panel_y))
-        panel_y += 35
-        
-        # Durum bilgileri (daha kompakt)
-        lidar_angle_deg = int((status['lidar_rotation'] * 180 / math.pi) % 360)
-        info_texts = [
-            f"Mode: {status['state'].upper()}",
-            f"Battery: {status['battery']:.0f}%",
-            f"Cleaned: {status['cleaned_tiles']} tiles",
-            f"Position: ({status['position'][0]}, {status['position'][1]})",
-            f"LiDAR: {lidar_angle_deg}°",
-            f"Time: {self.simulation_time // 60}:{self.simulation_time % 60:02d}",
-        ]
-        
-        for i, text in enumerate(info_texts):
-            color = (60, 60, 60)
-            if i == 0:  # Durum rengini ayarla
-                if status['state'] == 'exploring':
-                    color = (0, 150, 0)
-                elif status['state'] == 'stuck':
-                    color = (200, 0, 0)
-                elif status['state'] == 'cleaning':
-                    color = (0, 0, 200)
-            
-            rendered_text = self.font_small.render(text, True, color)
-            screen.blit(rendered_text, (panel_x + 5, panel_y + i * 20))
-        
-        # Batarya çubuğu
-        battery_rect = pygame.Rect(panel_x + 5, panel_y + len(info_texts) * 20 + 5, 100, 8)
-        pygame.draw.rect(screen, (100, 100, 100), battery_rect)
-        battery_fill = int((status['battery'] / 100) * 100)
-        battery_color = (0, 200, 0) if status['battery'] > 50 else (200, 200, 0) if status['battery'] > 20 else (200, 0, 0)
-        pygame.draw.rect(screen, battery_color, pygame.Rect(battery_rect.x, battery_rect.y, battery_fill, 8))
+    def step(self):
+        """Simülasyonu bir tik ilerletir"""
+        profiler = self.profiler
+        start = profiler.clock() if profiler is not None else 0.0
+        self.simulation_time += 1
         
-        # Temizlik verimliliği
-        if self.total_tiles > 0:
-            efficiency = (status['cleaned_tiles'] / self.total_tiles) * 100
-            efficiency_text = f"Efficiency: {efficiency:.1f}%"
+        for robot in self.robots:
+            # Robotu güncelle - offset'i robot sınıfına ilet
+            robot.update(self.room_grid, self.room_generator, self.spatial_hash)
             
-            color = (0, 150, 0) if efficiency > 80 else (200, 150, 0) if efficiency > 50 else (200, 0, 0)
-            rendered_efficiency = self.font_small.render(efficiency_text, True, color)
-            screen.blit(rendered_efficiency, (panel_x + 5, panel_y + len(info_texts) * 20 + 20))
-        
-        # Sağ panel - LiDAR ve Algoritma bilgileri (LiDAR görüntüsünün altında)
-        right_panel_x = self.width - 190
-        right_panel_y = 250  # LiDAR görüntüsünün altında
-        
-        # Sağ panel kutusu
-        info_box = pygame.Rect(right_panel_x - 5, right_panel_y - 5, 185, 300)
-        pygame.draw.rect(screen, (245, 245, 245), info_box)
-        pygame.draw.rect(screen, (180, 180, 180), info_box, 2)
-        
-        # LiDAR başlığı
-        lidar_title = self.font_medium.render("📡 LIDAR SYSTEM", True, (50, 50, 50))
-        screen.blit(lidar_title, (right_panel_x, right_panel_y))
-        right_panel_y += 30
-        
-        lidar_info = [
-            f"• Range: {self.robot.lidar_range}px",
-            f"• Resolution: {self.robot.lidar_resolution} rays",
-            f"• Rotation: {lidar_angle_deg}°",
-            "• Real-time mapping",
-            "• Obstacle detection"
-        ]
-        
-        for i, info in enumerate(lidar_info):
-            rendered_info = self.font_small.render(info, True, (80, 80, 80))
-            screen.blit(rendered_info, (right_panel_x + 5, right_panel_y + i * 16))
-        
-        right_panel_y += len(lidar_info) * 16 + 25
-        
-        # Algoritma başlığı
-        algorithm_title = self.font_medium.render("🧠 AI BEHAVIOR", True, (50, 50, 50))
-        screen.blit(algorithm_title, (right_panel_x, right_panel_y))
-        right_panel_y += 30
-        
-        algorithm_info = [
-            "• Autonomous navigation",
-            "• Wall following",
-            "• Obstacle avoidance", 
-            "• Stuck detection",
-            "• Path optimization"
-        ]
-        
-        for i, info in enumerate(algorithm_info):
-            rendered_info = self.font_small.render(info, True, (80, 80, 80))
-            screen.blit(rendered_info, (right_panel_x + 5, right_panel_y + i * 16))
-        
-        right_panel_y += len(algorithm_info) * 16 + 25
-        
-        # Kontrollar başlığı
-        controls_title = self.font_medium.render("🎮 CONTROLS", True, (50, 50, 50))
-        screen.blit(controls_title, (right_panel_x, right_panel_y))
-        right_panel_y += 30
-        
-        controls_info = [
-            "• SPACE: New room",
-            "• R: Reset robot",
-            "• ESC: Exit"
-        ]
-        
-        for i, info in enumerate(controls_info):
-            rendered_info = self.font_small.render(info, True, (80, 80, 80))
-            screen.blit(rendered_info, (right_panel_x + 5, right_panel_y + i * 16))
+            # Yol geçmişini kaydet (doğru ekran koordinatlarında, en eski nokta kendiliğinden düşer)
+            robot.path_history.append((int(robot.x), int(robot.y)))
+        if profiler is not None:
+            profiler.lap('tick.total', start)
+    
+    def update(self):
+        """Simülasyonu günceller (step() ile aynı, GUI döngüsü için)"""
+        self.step()
+    
+    def run(self, ticks: int) -> dict:
+        """
+        Simülasyonu kare hızından bağımsız olarak verilen tik sayısı kadar çalıştırır
         
-        # Alt bilgi çubuğu
-        bottom_rect = pygame.Rect(0, self.height - 35, self.width, 35)
-        pygame.draw.rect(screen, (220, 220, 220), bottom_rect)
-        pygame.draw.line(screen, (180, 180, 180), (0, self.height - 35), (self.width, self.height - 35), 2)
+        Args:
+            ticks: Çalıştırılacak tik sayısı
         
-        bottom_y = self.height - 25
-        status_text = "🤖 AUTONOMOUS ROBOT VACUUM SIMULATION - NO HUMAN INTERVENTION"
-        control_text = self.font_small.render(status_text, True, (80, 80, 80))
-        text_rect = control_text.get_rect(center=(self.width // 2, bottom_y))
-        screen.blit(control_text, text_rect)
+        Returns:
+            Son tikten sonraki simülasyon durumu (get_status)
+        """
+        for _ in range(ticks):
+            self.step()
+        return self.get_status()
+    
+    def get_status(self) -> dict:
+        """Robot durumu ve simülasyon istatistiklerini döndürür"""
+        status = self.robot.get_status()
+        status['time'] = self.simulation_time
+        status['total_tiles'] = self.total_tiles
+        status['efficiency'] = self.cleaned_area.coverage()
+        return status
     
-    def _count_empty_tiles(self) -> int:
-        """Boş karoların sayısını hesaplar"""
-        count = 0
-        for row in self.room_grid:
-            for cell in row:
-                if cell == 0:  # Boş karo
-                    count += 1
-        return count
\ No newline at end of file
+    def get_fleet_status(self) -> dict:
+        """Filo genelindeki istatistikleri döndürür"""
+        state_counts = {}
+        for robot in self.robots:
+            state_counts[robot.state.value] = state_counts.get(robot.state.value, 0) + 1
+        
+        cleaned_tiles = self.cleaned_area.cleaned_count
+        return {
+            'robot_count': len(self.robots),
+            'states': state_counts,
+            'mean_battery': sum(robot.battery for robot in self.robots) / len(self.robots),
+            'min_battery': min(robot.battery for robot in self.robots),
+            'cleaned_tiles': cleaned_tiles,
+            'robot_contacts': sum(robot.robot_contacts for robot in self.robots),
+            'time': self.simulation_time,
+            'total_tiles': self.total_tiles,
+            'efficiency': self.cleaned_area.coverage()
+        }
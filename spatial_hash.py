@@ -0,0 +1,71 @@
+"""
+Uzamsal Hash Modülü
+===================
+Düzgün hücrelere bölünmüş uzamsal hash. Robot filosunda komşu sorgularını
+tüm robotlarla karşılaştırmak (O(N²)) yerine sadece yakın hücrelerdeki
+robotlarla sınırlar.
+"""
+
+from typing import Dict, Hashable, Iterator, Set, Tuple
+
+class SpatialHash:
+    def __init__(self, cell_size: int):
+        """
+        Uzamsal hash sınıfı
+        
+        Args:
+            cell_size: Kova boyutu (piksel); genellikle oda grid_size değeri
+        """
+        self.cell_size = cell_size
+        self.buckets: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self.item_cells: Dict[Hashable, Tuple[int, int]] = {}
+    
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        """Noktanın bulunduğu kova anahtarı"""
+        return (int(x // self.cell_size), int(y // self.cell_size))
+    
+    def insert(self, item: Hashable, x: float, y: float):
+        """Nesneyi verilen konumdaki kovaya ekler"""
+        cell = self._cell(x, y)
+        self.buckets.setdefault(cell, set()).add(item)
+        self.item_cells[item] = cell
+    
+    def remove(self, item: Hashable):
+        """Nesneyi hash'ten çıkarır"""
+        cell = self.item_cells.pop(item)
+        bucket = self.buckets[cell]
+        bucket.discard(item)
+        if not bucket:
+            del self.buckets[cell]
+    
+    def move(self, item: Hashable, x: float, y: float):
+        """Nesnenin konumunu günceller (kova değişmediyse işlem yapmaz)"""
+        cell = self._cell(x, y)
+        if self.item_cells.get(item) == cell:
+            return
+        if item in self.item_cells:
+            self.remove(item)
+        self.buckets.setdefault(cell, set()).add(item)
+        self.item_cells[item] = cell
+    
+    def clear(self):
+        """Tüm nesneleri kaldırır"""
+        self.buckets.clear()
+        self.item_cells.clear()
+    
+    def query(self, x: float, y: float, radius: float) -> Iterator[Hashable]:
+        """
+        Verilen dairenin kesiştiği kovalardaki nesneleri döndürür
+        
+        Sonuç adaylardır; kesin mesafe kontrolü çağırana aittir.
+        """
+        min_x, min_y = self._cell(x - radius, y - radius)
+        max_x, max_y = self._cell(x + radius, y + radius)
+        for cell_x in range(min_x, max_x + 1):
+            for cell_y in range(min_y, max_y + 1):
+                bucket = self.buckets.get((cell_x, cell_y))
+                if bucket:
+                    yield from bucket
+    
+    def __len__(self) -> int:
+        return len(self.item_cells)
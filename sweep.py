@@ -0,0 +1,192 @@
+"""
+Parametre Taraması
+==================
+Birbirinden bağımsız çok sayıda headless simülasyon bölümünü (episode)
+tüm CPU çekirdeklerine dağıtır. Her bölüm bir (seed, oda boyutu, speed,
+lidar_range, sensor_range, angular_speed) kombinasyonudur ve verilen tik
+sayısı kadar ya da kapsama hedefine ulaşılana kadar çalışır.
+
+Sonuçlar bittikçe JSON satırları olarak yazılır (JSONL). --telemetry ile
+her bölümün tik telemetrisi ayrıca sütun dosyalarına yazılır (telemetry.py).
+
+Kullanım:
+    python sweep.py --seeds 200 --room-sizes 1000x700 600x400 --speed 1.5 2.5 \\
+        --ticks 5000 --coverage 80 --output results.jsonl
+    python sweep.py --seeds 10000 --corpus rooms.rvc --output results.jsonl
+"""
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List
+from robot_vacuum import LidarMode
+from room_corpus import RoomCorpus, parse_room_size
+from simulation import Simulation
+from telemetry import TelemetryWriter
+
+# Simulation ekran boyutundan UI paylarını düşerek oda alanını hesaplar
+UI_MARGIN_X = 200
+UI_MARGIN_Y = 100
+
+# Kapsama hedefinin kontrol edildiği tik aralığı
+COVERAGE_CHECK_INTERVAL = 50
+
+# İşçi süreçte açılmış derlemler (her süreç dosyayı bir kez eşler)
+_corpora = {}
+
+def _open_corpus(path: str) -> RoomCorpus:
+    """Derlemi bu süreçte ilk kullanımda açar"""
+    corpus = _corpora.get(path)
+    if corpus is None:
+        corpus = _corpora[path] = RoomCorpus(path)
+    return corpus
+
+def run_episode(episode: dict) -> dict:
+    """
+    Tek bir simülasyon bölümünü çalıştırır (işçi süreçte)
+    
+    Args:
+        episode: Bölüm parametreleri (seed, room_size, speed, lidar_range,
+                 sensor_range, angular_speed, ticks, coverage_target, lidar_mode,
+                 telemetry, telemetry_lidar_every; derlem kullanılıyorsa corpus ve room)
+    
+    Returns:
+        Parametreler ve sonuç istatistiklerini içeren sözlük
+    """
+    start = time.perf_counter()
+    room_width, room_height = episode['room_size']
+    corpus = _open_corpus(episode['corpus']) if episode.get('corpus') is not None else None
+    simulation = Simulation(room_width + UI_MARGIN_X, room_height + UI_MARGIN_Y,
+                            lidar_mode=LidarMode(episode['lidar_mode']), seed=episode['seed'],
+                            corpus=corpus, room_index=episode.get('room', 0))
+    robot = simulation.robot
+    robot.speed = episode['speed']
+    robot.lidar_range = episode['lidar_range']
+    robot.sensor_range = episode['sensor_range']
+    robot.angular_speed = episode['angular_speed']
+    
+    # Telemetri istenmişse her tik sütun dosyalarına yazılır (tik tik çalıştırılır)
+    telemetry = None
+    if episode.get('telemetry') is not None:
+        telemetry = TelemetryWriter(episode['telemetry'], simulation, episode['telemetry_lidar_every'])
+    
+    coverage_target = episode['coverage_target']
+    ticks_to_target = None
+    try:
+        while simulation.simulation_time < episode['ticks']:
+            ticks = min(COVERAGE_CHECK_INTERVAL, episode['ticks'] - simulation.simulation_time)
+            if telemetry is None:
+                simulation.run(ticks)
+            else:
+                for _ in range(ticks):
+                    simulation.step()
+                    telemetry.record()
+            if coverage_target is not None and simulation.get_status()['efficiency'] >= coverage_target:
+                ticks_to_target = simulation.simulation_time
+                break
+    finally:
+        if telemetry is not None:
+            telemetry.close()
+    
+    status = simulation.get_status()
+    return {
+        **episode,
+        'ticks_run': status['time'],
+        'cleaned_tiles': status['cleaned_tiles'],
+        'total_tiles': status['total_tiles'],
+        'coverage': status['efficiency'],
+        'ticks_to_target': ticks_to_target,
+        'battery': status['battery'],
+        'final_state': status['state'],
+        'elapsed_sec': time.perf_counter() - start,
+    }
+
+def build_episodes(args) -> Iterator[dict]:
+    """
+    Komut satırı parametrelerinin kartezyen çarpımından bölümleri üretir
+    
+    Derlem verildiyse oda boyutu derlemden alınır ve her seed derlemin
+    seed % oda sayısı numaralı odasında çalışır.
+    """
+    room_sizes = args.room_sizes
+    corpus = None
+    if args.corpus is not None:
+        corpus = RoomCorpus(args.corpus)
+        room_sizes = [(corpus.width, corpus.height)]
+    combinations = itertools.product(
+        room_sizes, args.speed, args.lidar_range, args.sensor_range,
+        args.angular_speed, range(args.seed_start, args.seed_start + args.seeds))
+    for index, (room_size, speed, lidar_range, sensor_range, angular_speed, seed) in enumerate(combinations):
+        telemetry = None
+        if args.telemetry is not None:
+            telemetry = os.path.join(args.telemetry, f"episode_{index:06d}")
+        episode = {
+            'seed': seed,
+            'room_size': room_size,
+            'speed': speed,
+            'lidar_range': lidar_range,
+            'sensor_range': sensor_range,
+            'angular_speed': angular_speed,
+            'ticks': args.ticks,
+            'coverage_target': args.coverage,
+            'lidar_mode': args.lidar_mode,
+            'telemetry': telemetry,
+            'telemetry_lidar_every': args.telemetry_lidar_every,
+        }
+        if corpus is not None:
+            episode['corpus'] = args.corpus
+            episode['room'] = seed % len(corpus)
+        yield episode
+
+def main(argv: List[str] = None):
+    parser = argparse.ArgumentParser(description="Robot Vacuum Simulator parametre taraması")
+    parser.add_argument("--seeds", type=int, default=10, help="kombinasyon başına seed sayısı")
+    parser.add_argument("--seed-start", type=int, default=0, help="ilk seed değeri")
+    parser.add_argument("--room-sizes", type=parse_room_size, nargs='+', default=[(1000, 700)],
+                        help="oda boyutları, örn. 1000x700 600x400")
+    parser.add_argument("--corpus", metavar="PATH", default=None,
+                        help="odaları üretmek yerine room_corpus.py derleminden al (--room-sizes yok sayılır)")
+    parser.add_argument("--speed", type=float, nargs='+', default=[1.5])
+    parser.add_argument("--lidar-range", type=int, nargs='+', default=[100])
+    parser.add_argument("--sensor-range", type=int, nargs='+', default=[30])
+    parser.add_argument("--angular-speed", type=float, nargs='+', default=[0.1])
+    parser.add_argument("--ticks", type=int, default=5000, help="bölüm başına en fazla tik")
+    parser.add_argument("--coverage", type=float, default=None,
+                        help="bu kapsama yüzdesine ulaşınca bölümü bitir")
+    parser.add_argument("--lidar-mode", choices=[mode.value for mode in LidarMode],
+                        default=LidarMode.FULL.value)
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="işçi süreç sayısı")
+    parser.add_argument("--chunksize", type=int, default=8,
+                        help="işçilere tek seferde gönderilen bölüm sayısı")
+    parser.add_argument("--output", default="-", help="JSONL çıktı dosyası ('-' = stdout)")
+    parser.add_argument("--telemetry", metavar="DIR", default=None,
+                        help="bölüm başına tik telemetrisini DIR/episode_NNNNNN dizinlerine yaz")
+    parser.add_argument("--telemetry-lidar-every", type=int, default=0, metavar="N",
+                        help="telemetriye her N tikte bir LiDAR görüntüsü ekle (0: ekleme)")
+    args = parser.parse_args(argv)
+    
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    start = time.perf_counter()
+    completed = 0
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            # map sonuçları bittikçe (sırayla) döndürür; hepsini bellekte biriktirmeden yaz
+            for result in executor.map(run_episode, build_episodes(args), chunksize=args.chunksize):
+                output.write(json.dumps(result) + "\n")
+                completed += 1
+                if completed % args.chunksize == 0:
+                    output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    
+    elapsed = time.perf_counter() - start
+    print(f"{completed} episodes in {elapsed:.1f}s ({completed / elapsed:.1f} episodes/s, "
+          f"{args.workers} workers)", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Telemetri Modülü
+================
+Tik başına simülasyon durumunu (get_status) ve LiDAR anlık görüntülerini
+diske sütun bazlı, sadece sona eklenen bir biçimde yazar. Her sütun sabit
+dtype'lı ayrı bir ham dosyadır; analiz kodu sütunları numpy.memmap ile
+açar ve milyonlarca tiki Python nesnesine dönüştürmeden okur.
+
+Dizin yapısı:
+    meta.json      sütun dtype'ları, durum adları, seed, LiDAR çözünürlüğü
+    <sütun>.bin    tik başına bir değer (ör. battery.bin, efficiency.bin)
+    lidar.bin      her lidar_every tikte bir lidar_resolution float32 mesafe
+    lidar_time.bin LiDAR görüntülerinin alındığı tikler
+
+Kayıtlar bellekte biriktirilir ve chunk_rows satırda bir toplu yazılır;
+her tikte dosya yazılmaz. Satır sayısı dosya boyutlarından hesaplandığı
+için yarıda kesilen bir koşunun yazılmış kısmı da okunabilir.
+"""
+
+import json
+import os
+from typing import Dict, List, Optional
+import numpy as np
+from robot_vacuum import RobotState
+
+VERSION = 1
+
+# get_status() alanlarından türetilen tik sütunları
+COLUMNS = (
+    ('time', '<u4'),
+    ('state', 'u1'),
+    ('battery', '<f4'),
+    ('cleaned_tiles', '<u4'),
+    ('x', '<i4'),
+    ('y', '<i4'),
+    ('lidar_rotation', '<f4'),
+    ('efficiency', '<f4'),
+)
+ROW_DTYPE = np.dtype(list(COLUMNS))
+LIDAR_DTYPE = np.dtype('<f4')
+LIDAR_TIME_DTYPE = np.dtype('<u4')
+
+# Durumlar sıra numarasıyla saklanır; adları meta.json'da
+STATES = list(RobotState)
+STATE_INDEX = {state.value: index for index, state in enumerate(STATES)}
+
+class TelemetryWriter:
+    def __init__(self, directory: str, simulation, lidar_every: int = 0, chunk_rows: int = 4096):
+        """
+        Telemetri yazıcı sınıfı
+        
+        Args:
+            directory: Sütun dosyalarının yazılacağı dizin (yoksa oluşturulur)
+            simulation: Kaydedilen simülasyon (get_status() ve robot.lidar_data okunur)
+            lidar_every: Kaç tikte bir LiDAR görüntüsü alınacağı (0: alınmaz)
+            chunk_rows: Diske toplu yazılmadan önce biriktirilen tik sayısı
+        """
+        self.directory = directory
+        self.simulation = simulation
+        self.lidar_every = lidar_every
+        self.chunk_rows = chunk_rows
+        self.rows_written = 0
+        self._rows: List[tuple] = []
+        self._lidar: List[np.ndarray] = []
+        self._lidar_time: List[int] = []
+        
+        os.makedirs(directory, exist_ok=True)
+        robot = simulation.robot
+        meta = {
+            'version': VERSION,
+            'seed': getattr(simulation, 'seed', None),
+            'total_tiles': simulation.total_tiles,
+            'columns': {name: dtype for name, dtype in COLUMNS},
+            'states': [state.value for state in STATES],
+            'lidar_every': lidar_every,
+            'lidar_resolution': robot.lidar_resolution,
+            'lidar_range': robot.lidar_range,
+            'lidar_dtype': LIDAR_DTYPE.str,
+        }
+        with open(os.path.join(directory, 'meta.json'), 'w') as file:
+            json.dump(meta, file, indent=2)
+        
+        self._files = {name: open(os.path.join(directory, f"{name}.bin"), 'wb') for name, _ in COLUMNS}
+        if lidar_every > 0:
+            self._files['lidar'] = open(os.path.join(directory, 'lidar.bin'), 'wb')
+            self._files['lidar_time'] = open(os.path.join(directory, 'lidar_time.bin'), 'wb')
+    
+    def record(self):
+        """Simülasyonun geçerli durumunu bir satır olarak ekler"""
+        status = self.simulation.get_status()
+        x, y = status['position']
+        tick = status['time']
+        self._rows.append((
+            tick, STATE_INDEX[status['state']], status['battery'], status['cleaned_tiles'],
+            x, y, status['lidar_rotation'], status['efficiency']
+        ))
+        if self.lidar_every > 0 and tick % self.lidar_every == 0:
+            self._lidar.append(np.asarray(self.simulation.robot.lidar_data, dtype=LIDAR_DTYPE))
+            self._lidar_time.append(tick)
+        if len(self._rows) >= self.chunk_rows:
+            self.flush()
+    
+    def flush(self):
+        """Biriken satırları sütun dosyalarına toplu olarak yazar"""
+        if self._rows:
+            rows = np.array(self._rows, dtype=ROW_DTYPE)
+            for name, _ in COLUMNS:
+                self._files[name].write(rows[name].tobytes())
+            self.rows_written += len(rows)
+            self._rows.clear()
+        if self._lidar:
+            self._files['lidar'].write(np.stack(self._lidar).tobytes())
+            self._files['lidar_time'].write(np.array(self._lidar_time, dtype=LIDAR_TIME_DTYPE).tobytes())
+            self._lidar.clear()
+            self._lidar_time.clear()
+        for file in self._files.values():
+            file.flush()
+    
+    def close(self):
+        """Kalan satırları yazar ve dosyaları kapatır"""
+        if self._files:
+            self.flush()
+            for file in self._files.values():
+                file.close()
+            self._files = {}
+    
+    def __enter__(self) -> "TelemetryWriter":
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+class TelemetryReader:
+    def __init__(self, directory: str):
+        """
+        Telemetri okuyucu sınıfı; sütunlar ilk erişimde memmap ile açılır
+        
+        Args:
+            directory: TelemetryWriter ile yazılmış dizin
+        """
+        self.directory = directory
+        with open(os.path.join(directory, 'meta.json')) as file:
+            self.meta = json.load(file)
+        if self.meta['version'] != VERSION:
+            raise ValueError(f"desteklenmeyen telemetri sürümü: {self.meta['version']}")
+        self.columns: Dict[str, np.dtype] = {name: np.dtype(dtype) for name, dtype in self.meta['columns'].items()}
+        self.states = self.meta['states']
+        self.lidar_resolution = self.meta['lidar_resolution']
+        
+        # Yarım yazılmış son satır olmasın diye en kısa sütuna göre kırpılır
+        self.row_count = min(self._file_rows(name, dtype.itemsize) for name, dtype in self.columns.items())
+        self._maps: Dict[str, np.ndarray] = {}
+    
+    def _file_rows(self, name: str, row_size: int) -> int:
+        """Sütun dosyasındaki tam satır sayısı"""
+        path = os.path.join(self.directory, f"{name}.bin")
+        return os.path.getsize(path) // row_size if os.path.exists(path) else 0
+    
+    def _map(self, name: str, dtype: np.dtype, shape: tuple) -> np.ndarray:
+        """Sütun dosyasını salt okunur memmap olarak açar (boş dosya için boş dizi)"""
+        if shape[0] == 0:
+            return np.empty(shape, dtype=dtype)
+        return np.memmap(os.path.join(self.directory, f"{name}.bin"), dtype=dtype, mode='r', shape=shape)
+    
+    def column(self, name: str) -> np.ndarray:
+        """Tik başına bir değer içeren sütun (salt okunur memmap)"""
+        if name not in self._maps:
+            self._maps[name] = self._map(name, self.columns[name], (self.row_count,))
+        return self._maps[name]
+    
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.column(name)
+    
+    def __len__(self) -> int:
+        return self.row_count
+    
+    def state_names(self, indices: Optional[np.ndarray] = None) -> np.ndarray:
+        """Durum sıra numaralarını ('exploring', ...) adlarına çevirir"""
+        if indices is None:
+            indices = self.column('state')
+        return np.array(self.states)[indices]
+    
+    def _open_lidar(self):
+        """LiDAR görüntü ve zaman dosyalarını aynı görüntü sayısıyla açar"""
+        if 'lidar' not in self._maps:
+            count = min(self._file_rows('lidar', LIDAR_DTYPE.itemsize * self.lidar_resolution),
+                        self._file_rows('lidar_time', LIDAR_TIME_DTYPE.itemsize))
+            self._maps['lidar'] = self._map('lidar', LIDAR_DTYPE, (count, self.lidar_resolution))
+            self._maps['lidar_time'] = self._map('lidar_time', LIDAR_TIME_DTYPE, (count,))
+    
+    @property
+    def lidar(self) -> np.ndarray:
+        """LiDAR görüntüleri, (görüntü sayısı, lidar_resolution) float32 memmap"""
+        self._open_lidar()
+        return self._maps['lidar']
+    
+    @property
+    def lidar_time(self) -> np.ndarray:
+        """LiDAR görüntülerinin alındığı tikler"""
+        self._open_lidar()
+        return self._maps['lidar_time']
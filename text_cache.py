@@ -0,0 +1,67 @@
+"""
+Yazı Önbelleği Modülü
+=====================
+pygame font nesneleri ve render edilmiş yazı yüzeyleri için önbellek.
+Font oluşturmak ve yazı render etmek çizim döngüsündeki en pahalı
+işlemlerdendir; aynı (font, boyut, yazı, renk) için yüzey bir kez
+oluşturulur. Yazı yüzeyleri LRU (en uzun süredir kullanılmayan önce
+atılır) ile sınırlandırılır, böylece sürekli değişen değerler (konum,
+süre) belleği büyütmez.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import pygame
+
+class TextCache:
+    def __init__(self, max_entries: int = 512):
+        """
+        Yazı önbelleği sınıfı
+        
+        Args:
+            max_entries: Saklanan en fazla yazı yüzeyi sayısı
+        """
+        self.max_entries = max_entries
+        self._fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+        self._surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def font(self, size: int, name: Optional[str] = None) -> pygame.font.Font:
+        """Verilen boyuttaki fontu döndürür (her font bir kez oluşturulur)"""
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            if not pygame.font.get_init():
+                pygame.font.init()
+            font = pygame.font.Font(name, size)
+            self._fonts[key] = font
+        return font
+    
+    def render(self, text: str, size: int, color: Tuple[int, int, int],
+               name: Optional[str] = None) -> pygame.Surface:
+        """
+        Yazıyı render eder veya önbellekteki yüzeyi döndürür
+        
+        Dönen yüzey paylaşılır; çağıran üzerinde değişiklik yapmamalıdır.
+        """
+        key = (name, size, text, tuple(color))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        
+        self.misses += 1
+        surface = self.font(size, name).render(text, True, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+    
+    def clear(self):
+        """Tüm yazı yüzeylerini atar (fontlar korunur)"""
+        self._surfaces.clear()
+    
+    def __len__(self) -> int:
+        return len(self._surfaces)
@@ -0,0 +1,111 @@
+"""
+Sabit Zaman Adımı Modülü
+========================
+Simülasyon tiklerini kare hızından ayıran sabit zaman adımlı çalıştırıcı.
+Geçen gerçek süre bir biriktiricide toplanır ve her tam tik süresi için
+simulation.update() bir kez çağrılır; hız çarpanı (1x, 10x, 100x) aynı
+sürede çalışan tik sayısını çarpar. "MAX" hızında kare başına ayrılan süre
+bütçesi boyunca mümkün olduğunca çok tik çalıştırılır.
+
+Simülasyon bütçeye sığmadığında birikmiş tikler atılır; böylece yavaşlayan
+bir bilgisayarda kareler arası süre büyüyüp kendini besleyen bir gecikme
+oluşmaz (arayüz akıcı kalır, gerçek hız göstergede görünür).
+"""
+
+import time
+from collections import deque
+from typing import Optional
+
+# Seçilebilir hız çarpanları (None: bütçe boyunca en yüksek hız)
+SPEED_MULTIPLIERS = (1, 10, 100, None)
+
+class FixedTimestep:
+    def __init__(self, simulation, tick_rate: int = 60, step_budget: float = 0.012,
+                 max_frame_time: float = 0.25):
+        """
+        Sabit zaman adımlı çalıştırıcı sınıfı
+        
+        Args:
+            simulation: update() metodu olan simülasyon
+            tick_rate: 1x hızda saniyedeki tik sayısı
+            step_budget: Kare başına simülasyona ayrılan en fazla süre (saniye)
+            max_frame_time: Tek karede hesaba katılan en fazla gerçek süre
+                            (pencere sürüklenmesi gibi duraklamalar sonrası)
+        """
+        self.simulation = simulation
+        self.tick_rate = tick_rate
+        self.step_budget = step_budget
+        self.max_frame_time = max_frame_time
+        self.speed_index = 0
+        self.total_ticks = 0
+        self.ticks_per_second = 0.0
+        self._accumulator = 0.0
+        self._rate_samples = deque()  # (zaman, toplam tik) son bir saniye
+    
+    @property
+    def speed(self) -> Optional[int]:
+        """Geçerli hız çarpanı (None: en yüksek hız)"""
+        return SPEED_MULTIPLIERS[self.speed_index]
+    
+    @property
+    def speed_label(self) -> str:
+        """Hız çarpanının ekranda gösterilen adı"""
+        return "MAX" if self.speed is None else f"{self.speed}x"
+    
+    def set_speed(self, index: int):
+        """Hız çarpanını SPEED_MULTIPLIERS içindeki sırasıyla seçer"""
+        self.speed_index = max(0, min(index, len(SPEED_MULTIPLIERS) - 1))
+        self._accumulator = 0.0
+    
+    def faster(self):
+        """Bir sonraki hız çarpanına geçer"""
+        self.set_speed(self.speed_index + 1)
+    
+    def slower(self):
+        """Bir önceki hız çarpanına geçer"""
+        self.set_speed(self.speed_index - 1)
+    
+    def advance(self, frame_time: float) -> int:
+        """
+        Geçen gerçek süre kadar simülasyonu ilerletir
+        
+        Args:
+            frame_time: Önceki kareden beri geçen süre (saniye)
+        
+        Returns:
+            Bu karede çalıştırılan tik sayısı
+        """
+        deadline = time.perf_counter() + self.step_budget
+        ticks = 0
+        if self.speed is None:
+            # En yüksek hız: bütçe dolana kadar çalış
+            while True:
+                self.simulation.update()
+                ticks += 1
+                if time.perf_counter() >= deadline:
+                    break
+        else:
+            self._accumulator += min(frame_time, self.max_frame_time) * self.tick_rate * self.speed
+            while self._accumulator >= 1.0:
+                self.simulation.update()
+                self._accumulator -= 1.0
+                ticks += 1
+                if time.perf_counter() >= deadline:
+                    # Yetişilemiyor: birikmiş tikleri at
+                    self._accumulator = 0.0
+                    break
+        
+        self.total_ticks += ticks
+        self._update_rate()
+        return ticks
+    
+    def _update_rate(self):
+        """Son bir saniyedeki tik hızını günceller"""
+        now = time.perf_counter()
+        samples = self._rate_samples
+        samples.append((now, self.total_ticks))
+        while len(samples) > 2 and now - samples[0][0] > 1.0:
+            samples.popleft()
+        elapsed = now - samples[0][0]
+        if elapsed > 0:
+            self.ticks_per_second = (self.total_ticks - samples[0][1]) / elapsed